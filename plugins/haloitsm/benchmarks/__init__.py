@@ -0,0 +1 @@
+# Benchmarks for the HaloITSM API client (not shipped with the plugin)
@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+"""
+Encode / decode cost of realistic ticket payloads, stdlib json vs. orjson
+
+Usage:
+    python benchmarks/bench_json_codec.py [--tickets 100] [--details-kb 8] [--repeat 50]
+
+Decodes a /tickets search page whose tickets carry HTML details and custom
+fields (what make_request does for every search), encodes a bulk create
+payload of the same size, and reports which backend json_codec picked.
+"""
+import argparse
+import json
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from icon_haloitsm.util import json_codec
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def make_ticket(ticket_id, details_kb):
+    paragraph = "<p>Suspicious sign-in from <b>203.0.113.{}</b> &mdash; user &quot;jdoe&quot; &lt;MFA bypass&gt;</p>\n"
+    details = "".join(paragraph.format(n % 255) for n in range(details_kb * 1024 // 90))
+    return {
+        "id": ticket_id,
+        "summary": f"[InsightIDR] Investigation {ticket_id}: Suspicious authentication",
+        "details": details,
+        "status_id": random.choice([1, 2, 3, 4]),
+        "status": {"id": 1, "name": "New"},
+        "priority_id": random.choice([1, 2, 3, 4]),
+        "tickettype_id": 1,
+        "agent": {"id": 42, "name": "SOC Analyst", "emailaddress": "soc@example.com"},
+        "team": "SOC Team",
+        "dateoccurred": "2024-05-01T10:15:00.000Z",
+        "dateupdated": "2024-05-01T11:20:31.517Z",
+        "customfields": [
+            {"id": n, "name": f"CF{n}", "label": f"Custom field {n}", "value": f"value {n} é ü", "display": f"Value {n}"}
+            for n in range(30)
+        ]
+    }
+
+
+def best_of(fn, repeat):
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--tickets", type=int, default=100)
+    parser.add_argument("--details-kb", type=int, default=8)
+    parser.add_argument("--repeat", type=int, default=50)
+    args = parser.parse_args()
+
+    random.seed(1)
+    tickets = [make_ticket(ticket_id, args.details_kb) for ticket_id in range(1, args.tickets + 1)]
+    page = json.dumps({"record_count": len(tickets), "tickets": tickets}).encode()
+    print(f"json_codec backend: {json_codec.BACKEND}")
+    print(f"Search page: {len(tickets)} tickets, {len(page) / 1024 / 1024:.1f} MB\n")
+
+    codecs = [("stdlib json", lambda data: json.loads(data), lambda obj: json.dumps(obj).encode())]
+    if orjson is not None:
+        codecs.append(("orjson", orjson.loads, orjson.dumps))
+    else:
+        print("orjson not installed - pip install orjson to compare\n")
+
+    print(f"{'codec':<14} {'decode page':>12} {'encode bulk':>12}")
+    baseline = None
+    for name, loads, dumps in codecs:
+        decode = best_of(lambda: loads(page), args.repeat)
+        encode = best_of(lambda: dumps(tickets), args.repeat)
+        speedup = "" if baseline is None else f"  ({baseline[0] / decode:4.1f}x / {baseline[1] / encode:4.1f}x)"
+        baseline = baseline or (decode, encode)
+        print(f"{name:<14} {decode * 1000:9.2f} ms {encode * 1000:9.2f} ms{speedup}")
+
+
+if __name__ == "__main__":
+    main()
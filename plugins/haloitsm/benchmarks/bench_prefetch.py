@@ -0,0 +1,62 @@
+#!/usr/bin/env python3
+"""
+Wall time of a full /tickets scan, one page at a time vs. prefetched pages
+
+Usage:
+    python benchmarks/bench_prefetch.py [--tickets 10000] [--page-size 100] [--latency 0.05]
+
+The stand-in server adds --latency seconds to every request. "sequential"
+is iter_tickets as before (the next page is requested only after the
+previous one was consumed); the other rows prefetch with the given windows.
+"""
+import argparse
+import os
+import sys
+import time
+import warnings
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks.stub_server import StubHaloServer
+from icon_haloitsm.util.api import HaloITSMAPI
+from icon_haloitsm.util.token_store import MemoryTokenStore
+
+
+def _scan(client, page_size, prefetch):
+    start = time.perf_counter()
+    count = 0
+    last_id = 0
+    for ticket in client.iter_tickets(page_size=page_size, prefetch=prefetch):
+        # Output order must be identical to the sequential scan
+        assert ticket["id"] == last_id + 1, "tickets out of order"
+        last_id = ticket["id"]
+        count += 1
+    return count, time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--tickets", type=int, default=10000)
+    parser.add_argument("--page-size", type=int, default=100)
+    parser.add_argument("--latency", type=float, default=0.05)
+    parser.add_argument("--windows", type=int, nargs="+", default=[2, 4, 8])
+    args = parser.parse_args()
+
+    warnings.filterwarnings("ignore")
+    with StubHaloServer(latency=args.latency, total_tickets=args.tickets) as server:
+        pages = -(-args.tickets // args.page_size)
+        print(f"Stand-in server: {server.base_url} ({args.tickets} tickets, {pages} pages, "
+              f"{args.latency * 1000:.0f} ms per request)\n")
+        client = HaloITSMAPI(**server.client_kwargs(), token_store=MemoryTokenStore())
+        client.get_access_token()
+
+        count, baseline = _scan(client, args.page_size, prefetch=0)
+        print(f"{'sequential':<22} {count:6d} tickets  {baseline:7.2f} s")
+        for window in args.windows:
+            count, elapsed = _scan(client, args.page_size, prefetch=window)
+            print(f"{f'prefetch window {window}':<22} {count:6d} tickets  {elapsed:7.2f} s  ({baseline / elapsed:4.1f}x)")
+        client.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+"""
+Bytes transferred and wall time of ticket reads, every field vs. projected
+
+Usage:
+    python benchmarks/bench_projection.py [--tickets 2000] [--page-size 100] [--details-size 4000] [--latency 0.02]
+
+Scans every ticket with iter_tickets and fetches --gets single tickets with
+get_ticket against the stand-in server, first returning every field and then
+with fields=["summary", "status_name", "agent_name"], which leaves details
+and custom fields out of the responses (includedetails / includecustomfields).
+"bytes" counts the response bodies received, "output" the size of the tickets
+handed to the caller.
+"""
+import argparse
+import json
+import os
+import sys
+import time
+import warnings
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks.stub_server import StubHaloServer
+from icon_haloitsm.util.api import HaloITSMAPI, project_ticket
+from icon_haloitsm.util.token_store import MemoryTokenStore
+
+PROJECTED_FIELDS = ["summary", "status_name", "agent_name"]
+
+
+def _measure(client, received, run):
+    received[0] = 0
+    start = time.perf_counter()
+    tickets = run()
+    elapsed = time.perf_counter() - start
+    output = sum(len(json.dumps(ticket)) for ticket in tickets)
+    return len(tickets), received[0], output, elapsed
+
+
+def _report(label, result, baseline=None):
+    count, received, output, elapsed = result
+    line = (f"{label:<22} {count:6d} tickets  bytes {received / 1024 / 1024:7.2f} MB  "
+            f"output {output / 1024 / 1024:7.2f} MB  {elapsed:6.2f} s")
+    if baseline is not None:
+        line += f"  ({baseline[1] / max(received, 1):4.1f}x less data, {baseline[3] / elapsed:4.1f}x faster)"
+    print(line)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--tickets", type=int, default=2000)
+    parser.add_argument("--page-size", type=int, default=100)
+    parser.add_argument("--details-size", type=int, default=4000)
+    parser.add_argument("--gets", type=int, default=200)
+    parser.add_argument("--latency", type=float, default=0.02)
+    args = parser.parse_args()
+
+    warnings.filterwarnings("ignore")
+    with StubHaloServer(latency=args.latency, total_tickets=args.tickets, details_size=args.details_size) as server:
+        print(f"Stand-in server: {server.base_url} ({args.tickets} tickets, {args.details_size} B details, "
+              f"{args.latency * 1000:.0f} ms per request)\n")
+        client = HaloITSMAPI(**server.client_kwargs(), token_store=MemoryTokenStore(), http_cache_size=0)
+        client.get_access_token()
+        received = [0]
+
+        def count_bytes(response, *args, **kwargs):
+            received[0] += len(response.content)
+
+        client.session.hooks["response"].append(count_bytes)
+
+        def scan(fields):
+            return lambda: list(client.iter_tickets(page_size=args.page_size, fields=fields))
+
+        def gets(fields):
+            return lambda: [
+                project_ticket(client._normalize_ticket(client.get_ticket(ticket_id, use_cache=False, fields=fields)), fields)
+                for ticket_id in range(1, args.gets + 1)
+            ]
+
+        baseline = _measure(client, received, scan(None))
+        _report("scan, every field", baseline)
+        _report("scan, projected", _measure(client, received, scan(PROJECTED_FIELDS)), baseline)
+        baseline = _measure(client, received, gets(None))
+        _report("get_ticket, every field", baseline)
+        _report("get_ticket, projected", _measure(client, received, gets(PROJECTED_FIELDS)), baseline)
+        client.close()
+
+
+if __name__ == "__main__":
+    main()
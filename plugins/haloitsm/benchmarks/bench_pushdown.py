@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+"""
+Bytes and wall time of one change-feed poll, local filtering vs. pushdown
+
+Usage:
+    python benchmarks/bench_pushdown.py [--tickets 5000] [--page-size 100] [--latency 0.02]
+
+Every ticket of the stand-in server counts as changed. Each scenario polls
+once through a ChangeFeed with the given trigger subscriptions. "local" keeps
+the query unfiltered and drops unwanted tickets in the triggers, as before;
+"pushdown" sends the trigger filters as /tickets parameters.
+"""
+import argparse
+import os
+import sys
+import time
+import warnings
+from datetime import datetime, timezone
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks.stub_server import StubHaloServer
+from icon_haloitsm.util.api import HaloITSMAPI
+from icon_haloitsm.util.change_feed import ChangeFeed
+from icon_haloitsm.util.poller import MemoryPollStateStore, TicketPoller
+from icon_haloitsm.util.token_store import MemoryTokenStore
+
+SCENARIOS = [
+    ("one ticket id", [{"id": [42]}]),
+    ("three ticket ids", [{"id": [42]}, {"id": [4242]}, {"id": [7]}]),
+    ("priority 2", [{"priority_id": [2]}]),
+    ("priority 2 + unfiltered", [{"priority_id": [2]}, {}])
+]
+
+
+def poll(client, received, subscriptions, pushdown):
+    poller = TicketPoller(client, "bench", store=MemoryPollStateStore(), start=datetime(2025, 11, 6, tzinfo=timezone.utc))
+    feed = ChangeFeed(poller, background=False)
+    for wanted in subscriptions:
+        feed.subscribe(3600, wanted if pushdown else None)
+    received[0] = 0
+    start = time.perf_counter()
+    changes = feed.poll_once()
+    elapsed = time.perf_counter() - start
+    feed.close()
+    return changes, received[0], elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--tickets", type=int, default=5000)
+    parser.add_argument("--page-size", type=int, default=100)
+    parser.add_argument("--latency", type=float, default=0.02)
+    args = parser.parse_args()
+
+    warnings.filterwarnings("ignore")
+    with StubHaloServer(latency=args.latency, total_tickets=args.tickets) as server:
+        print(f"Stand-in server: {server.base_url} ({args.tickets} changed tickets, "
+              f"{args.latency * 1000:.0f} ms per request)\n")
+        client = HaloITSMAPI(**server.client_kwargs(), token_store=MemoryTokenStore(), http_cache_size=0)
+        client.get_access_token()
+        received = [0]
+
+        def count_bytes(response, *args, **kwargs):
+            received[0] += len(response.content)
+
+        client.session.hooks["response"].append(count_bytes)
+
+        print(f"{'subscriptions':<26} {'local':>24} {'pushdown':>24}")
+        for label, subscriptions in SCENARIOS:
+            _, local_bytes, local_time = poll(client, received, subscriptions, pushdown=False)
+            _, pushed_bytes, pushed_time = poll(client, received, subscriptions, pushdown=True)
+            print(f"{label:<26} {local_bytes / 1024:9.0f} KB {local_time:8.2f} s "
+                  f"{pushed_bytes / 1024:9.1f} KB {pushed_time:8.2f} s  ({local_bytes / max(pushed_bytes, 1):6.0f}x less data)")
+        client.close()
+
+
+if __name__ == "__main__":
+    main()
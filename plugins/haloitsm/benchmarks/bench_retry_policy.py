@@ -0,0 +1,126 @@
+#!/usr/bin/env python3
+"""
+Latency of failing HaloITSMAPI calls under the old fixed retries and the RetryPolicy
+
+Usage:
+    python benchmarks/bench_retry_policy.py [--calls 60] [--error-rate 0.3]
+
+The stand-in server answers 404 for every 4th ticket id, fails a share of the
+remaining reads with 503, and answers ticket creates slower than the client
+timeout. "before" replays the old loop (every failure retried, 1 s then 2 s
+sleeps, no budget); "after" uses the default RetryPolicy. Reported per
+scenario: tail latency of the calls that ended in an error, how many requests
+hit the server, and how many tickets the timed-out creates actually produced.
+"""
+import argparse
+import os
+import statistics
+import sys
+import time
+import warnings
+from concurrent.futures import ThreadPoolExecutor
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from insightconnect_plugin_runtime.exceptions import PluginException
+
+from benchmarks.stub_server import StubHaloServer
+from icon_haloitsm.util.api import HaloITSMAPI
+from icon_haloitsm.util.retry import RetryPolicy, RetryBudget
+from icon_haloitsm.util.token_store import MemoryTokenStore
+
+
+class LegacyRetryPolicy(RetryPolicy):
+    """The pre-policy behaviour: retry everything, linear 1 s / 2 s sleeps, no budget"""
+
+    def __init__(self):
+        super().__init__(budget=RetryBudget(min_per_second=1e9, max_balance=1e9))
+
+    def classify(self, idempotent, status=None, error=None):
+        return True
+
+    def backoff(self, attempt):
+        return 1.0 * (attempt + 1)
+
+
+def _timed(call):
+    start = time.perf_counter()
+    try:
+        call()
+        failed = False
+    except PluginException:
+        failed = True
+    return failed, (time.perf_counter() - start) * 1000
+
+
+def _run(server, policy, calls, write_timeout):
+    client = HaloITSMAPI(**server.client_kwargs(), token_store=MemoryTokenStore(), retry_policy=policy)
+    client.get_access_token()
+    requests_before = server.request_count
+    created_before = server.tickets_created
+
+    def read(ticket_id):
+        return _timed(lambda: client.get_ticket(ticket_id))
+
+    def create(index):
+        return _timed(lambda: client.make_request(
+            method="POST",
+            endpoint="/tickets",
+            json_data=[{"summary": f"bench {index}"}],
+            timeout=write_timeout
+        ))
+
+    # Run every call concurrently so the slow legacy sleeps overlap
+    with ThreadPoolExecutor(max_workers=calls + calls // 10) as pool:
+        reads = list(pool.map(read, range(1, calls + 1)))
+        creates = list(pool.map(create, range(calls // 10)))
+    client.close()
+
+    return {
+        "failed_reads": [elapsed for failed, elapsed in reads if failed],
+        "ok_reads": [elapsed for failed, elapsed in reads if not failed],
+        "failed_creates": [elapsed for failed, elapsed in creates if failed],
+        "creates": len(creates),
+        "server_requests": server.request_count - requests_before,
+        "tickets_created": server.tickets_created - created_before,
+        "budget": policy.budget.stats()
+    }
+
+
+def _percentile(values, fraction):
+    values = sorted(values)
+    return values[max(0, int(round(len(values) * fraction)) - 1)] if values else 0.0
+
+
+def _report(label, result):
+    failed = result["failed_reads"] + result["failed_creates"]
+    print(f"{label}")
+    print(f"  failed calls      {len(failed):5d}   p50 {statistics.median(failed) if failed else 0:8.1f} ms   "
+          f"p95 {_percentile(failed, 0.95):8.1f} ms   p99 {_percentile(failed, 0.99):8.1f} ms")
+    print(f"  successful reads  {len(result['ok_reads']):5d}   p95 {_percentile(result['ok_reads'], 0.95):8.1f} ms")
+    print(f"  server requests   {result['server_requests']:5d}")
+    print(f"  creates sent      {result['creates']:5d}   tickets created on server {result['tickets_created']}")
+    print(f"  retry budget      {result['budget']}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--calls", type=int, default=60)
+    parser.add_argument("--error-rate", type=float, default=0.3)
+    parser.add_argument("--latency", type=float, default=0.02)
+    args = parser.parse_args()
+
+    warnings.filterwarnings("ignore")
+    with StubHaloServer(
+        latency=args.latency,
+        error_rate=args.error_rate,
+        missing_every=4,
+        write_latency=0.5
+    ) as server:
+        print(f"Stand-in server: {server.base_url} ({args.calls} reads, {args.calls // 10} creates)\n")
+        _report("before (fixed retries)", _run(server, LegacyRetryPolicy(), args.calls, write_timeout=0.2))
+        _report("after (RetryPolicy)", _run(server, RetryPolicy(), args.calls, write_timeout=0.2))
+
+
+if __name__ == "__main__":
+    main()
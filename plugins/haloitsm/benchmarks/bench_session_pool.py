@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+"""
+Per-call latency of HaloITSMAPI with and without the pooled keep-alive session
+
+Usage:
+    python benchmarks/bench_session_pool.py [--calls 200]
+
+"before" replays the old behaviour (module-level requests.request/requests.post,
+one TCP + TLS handshake per call); "after" uses the client's pooled session.
+"""
+import argparse
+import os
+import statistics
+import sys
+import time
+import warnings
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import requests
+
+from benchmarks.stub_server import StubHaloServer
+from icon_haloitsm.util.api import HaloITSMAPI
+from icon_haloitsm.util.token_store import MemoryTokenStore
+
+
+class _UnpooledSession:
+    """Mimics the pre-session client: every call opens a fresh connection"""
+    verify = False
+
+    def request(self, *args, **kwargs):
+        return requests.request(*args, **kwargs)
+
+    def post(self, *args, **kwargs):
+        return requests.post(*args, **kwargs)
+
+    def close(self):
+        pass
+
+
+def _measure(client, calls):
+    timings = []
+    for i in range(calls):
+        start = time.perf_counter()
+        client.get_ticket(i + 1)
+        timings.append((time.perf_counter() - start) * 1000)
+    return timings
+
+
+def _report(label, timings):
+    timings = sorted(timings)
+    p95 = timings[int(len(timings) * 0.95) - 1]
+    print(f"{label:<28} mean {statistics.mean(timings):7.2f} ms   "
+          f"p50 {statistics.median(timings):7.2f} ms   p95 {p95:7.2f} ms")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--calls", type=int, default=200)
+    args = parser.parse_args()
+
+    warnings.filterwarnings("ignore")
+    with StubHaloServer() as server:
+        print(f"Stand-in server: {server.base_url} ({args.calls} calls each)")
+
+        before = HaloITSMAPI(**server.client_kwargs(), token_store=MemoryTokenStore())
+        before.session = _UnpooledSession()
+        _report("before (new connection)", _measure(before, args.calls))
+
+        after = HaloITSMAPI(**server.client_kwargs(), token_store=MemoryTokenStore())
+        _report("after (pooled session)", _measure(after, args.calls))
+        after.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+"""
+Footprint and throughput of the ticket snapshot store at a million tickets
+
+Usage:
+    python benchmarks/bench_snapshot_store.py [--tickets 1000000] [--batch 1000]
+
+Seeds the SQLite-backed SnapshotStore with --tickets snapshots, then replays
+one change-feed poll per --batch tickets (swap + commit, as ChangeFeed does)
+over all of them. Reports the file size, process RSS growth and tickets per
+second, next to the heap a plain dict of TicketSnapshot tuples holding the
+same data would take.
+"""
+import argparse
+import gc
+import os
+import resource
+import shutil
+import sys
+import tempfile
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from icon_haloitsm.util.snapshot_store import SnapshotStore, TicketSnapshot, field_hashes
+
+
+def snapshot(ticket_id, generation):
+    return TicketSnapshot(
+        1 + (ticket_id + generation) % 8,
+        100 + ticket_id % 250,
+        10 + ticket_id % 40,
+        1 + ticket_id % 4,
+        1762441200000 + ticket_id * 1000 + generation,
+        (ticket_id * 0x9E3779B97F4A7C15 + generation) % 2 ** 64 - 2 ** 63,
+        field_hashes({"id": ticket_id, "status_id": 1 + (ticket_id + generation) % 8, "summary": f"Ticket {ticket_id}"})
+    )
+
+
+def rss_mb():
+    # ru_maxrss is in KB on Linux
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--tickets", type=int, default=1000000)
+    parser.add_argument("--batch", type=int, default=1000)
+    args = parser.parse_args()
+
+    directory = tempfile.mkdtemp(prefix="halo-snapshots-")
+    path = os.path.join(directory, "snapshots.sqlite")
+    try:
+        gc.collect()
+        rss_before = rss_mb()
+        store = SnapshotStore(path)
+
+        start = time.perf_counter()
+        for first in range(1, args.tickets + 1, args.batch):
+            store.put_many((ticket_id, snapshot(ticket_id, 0)) for ticket_id in range(first, min(first + args.batch, args.tickets + 1)))
+            store.commit()
+        seeded = time.perf_counter() - start
+
+        start = time.perf_counter()
+        changed = 0
+        for first in range(1, args.tickets + 1, args.batch):
+            for ticket_id in range(first, min(first + args.batch, args.tickets + 1)):
+                current = snapshot(ticket_id, 1)
+                if store.swap(ticket_id, current).status_id != current.status_id:
+                    changed += 1
+            store.commit()
+        polled = time.perf_counter() - start
+        rss_growth = rss_mb() - rss_before
+        store.close()
+        file_mb = sum(os.path.getsize(os.path.join(directory, name)) for name in os.listdir(directory)) / 1024 / 1024
+
+        print(f"SnapshotStore, {args.tickets} tickets in batches of {args.batch}")
+        print(f"  file           {file_mb:8.1f} MB ({file_mb * 1024 * 1024 / args.tickets:.0f} B per ticket)")
+        print(f"  RSS growth     {rss_growth:8.1f} MB")
+        print(f"  seed           {args.tickets / seeded:8.0f} tickets/s")
+        print(f"  poll (swap)    {args.tickets / polled:8.0f} tickets/s, {changed} status changes found")
+
+        gc.collect()
+        tracemalloc.start()
+        in_memory = {ticket_id: snapshot(ticket_id, 0) for ticket_id in range(1, args.tickets + 1)}
+        dict_size, _ = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        print(f"\ndict of tuples, same data: {dict_size / 1024 / 1024:.1f} MB of Python heap")
+        del in_memory
+    finally:
+        shutil.rmtree(directory, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+"""
+Peak memory of reading one huge /tickets page, whole body vs. streamed
+
+Usage:
+    python benchmarks/bench_stream_memory.py [--size-mb 50] [--tickets 1000]
+
+The page is generated on the fly behind a requests.Response, the way bytes
+come off the socket, so the source itself costs no memory. "whole body" is
+make_request as before (content + decoded page at once); "streamed" is
+iter_tickets(stream=True), which decodes the tickets array incrementally.
+Peak memory is measured with tracemalloc, wall time in a separate untraced run.
+"""
+import argparse
+import io
+import json
+import os
+import sys
+import time
+import tracemalloc
+import warnings
+from unittest.mock import Mock
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import requests
+from benchmarks.stub_server import make_ticket
+from icon_haloitsm.util import json_codec
+from icon_haloitsm.util.api import HaloITSMAPI
+from icon_haloitsm.util.token_store import MemoryTokenStore
+
+
+class SyntheticPage(io.RawIOBase):
+    """Readable body of a /tickets page, produced ticket by ticket"""
+
+    def __init__(self, tickets, details_size):
+        self._parts = self._generate(tickets, details_size)
+        self._pending = b""
+
+    @staticmethod
+    def _generate(tickets, details_size):
+        yield json.dumps({"page_no": 1, "page_size": tickets, "record_count": tickets})[:-1].encode() + b', "tickets": ['
+        for ticket_id in range(1, tickets + 1):
+            yield (b"," if ticket_id > 1 else b"") + json.dumps(make_ticket(ticket_id, details_size)).encode()
+        yield b"]}"
+
+    def readable(self):
+        return True
+
+    def readinto(self, buffer):
+        while not self._pending:
+            self._pending = next(self._parts, b"")
+            if not self._pending:
+                return 0
+        size = min(len(buffer), len(self._pending))
+        buffer[:size] = self._pending[:size]
+        self._pending = self._pending[size:]
+        return size
+
+
+def page_response(tickets, details_size):
+    response = requests.Response()
+    response.status_code = 200
+    response.raw = SyntheticPage(tickets, details_size)
+    return response
+
+
+def measure(label, run):
+    # Timed without tracing - tracemalloc slows every allocation down
+    start = time.perf_counter()
+    count = run()
+    elapsed = time.perf_counter() - start
+    tracemalloc.start()
+    run()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(f"{label:<12} {count:6d} tickets  peak {peak / 1024 / 1024:8.1f} MB  {elapsed:6.2f} s")
+    return peak
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--size-mb", type=float, default=50)
+    parser.add_argument("--tickets", type=int, default=1000)
+    args = parser.parse_args()
+
+    warnings.filterwarnings("ignore")
+    details_size = max(0, int(args.size_mb * 1024 * 1024 / args.tickets) - 1000)
+    ticket_size = len(json.dumps(make_ticket(1, details_size)))
+    print(f"Page: {args.tickets} tickets of {ticket_size / 1024:.0f} KB = "
+          f"{args.tickets * ticket_size / 1024 / 1024:.0f} MB (json_codec: {json_codec.BACKEND})\n")
+
+    client = HaloITSMAPI(
+        client_id="bench-client",
+        client_secret="bench-secret",
+        auth_server="https://bench.invalid/auth",
+        resource_server="https://bench.invalid/api",
+        tenant="bench",
+        token_store=MemoryTokenStore(),
+        http_cache_size=0
+    )
+    client.access_token = "bench-token"
+    client.token_expires_at = float("inf")
+    client.session = Mock()
+    client.session.request.side_effect = lambda **kwargs: page_response(args.tickets, details_size)
+
+    def whole_body():
+        page = client.make_request("GET", "/tickets", params={"page_size": args.tickets})
+        return sum(1 for ticket in page["tickets"] if ticket["id"])
+
+    def streamed():
+        tickets = client.iter_tickets(page_size=args.tickets, limit=args.tickets, normalize=False, stream=True)
+        return sum(1 for ticket in tickets if ticket["id"])
+
+    whole_peak = measure("whole body", whole_body)
+    streamed_peak = measure("streamed", streamed)
+    print(f"\nStreaming peak is {streamed_peak / whole_peak:.1%} of the whole-body peak "
+          f"({streamed_peak / ticket_size:.1f}x one ticket)")
+    client.close()
+
+
+if __name__ == "__main__":
+    main()
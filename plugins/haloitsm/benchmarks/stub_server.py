@@ -0,0 +1,254 @@
+"""
+Local stand-in for the HaloITSM auth and resource servers used by the benchmarks
+
+Serves just enough of the API for HaloITSMAPI to run against:
+    POST /auth/token          OAuth2 client credentials token
+    GET  /api/tickets/<id>    single ticket
+    GET  /api/tickets         paginated ticket list (page_no / page_size)
+
+Both ticket GETs honour includedetails=false / includecustomfields=false by
+leaving those parts out, as HaloITSM does, and the list honours the
+ticketids / requesttype / priority comma-separated filters.
+
+Latency can be injected per request to simulate a remote tenant, and a share
+of requests can be failed with a given status (error_rate / error_status) or
+answered with 404 (missing_every: every Nth ticket id). When the
+openssl CLI is available the server speaks HTTPS with a throwaway self-signed
+certificate so that handshake cost shows up in the numbers.
+"""
+import json
+import os
+import random
+import re
+import shutil
+import ssl
+import subprocess
+import tempfile
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlparse, parse_qs
+
+
+def make_ticket(ticket_id, details_size=200):
+    """Build a realistic looking ticket payload"""
+    return {
+        "id": ticket_id,
+        "summary": f"Suspicious authentication activity #{ticket_id}",
+        "details": "<p>" + ("Investigation details. " * (details_size // 23 + 1))[:details_size] + "</p>",
+        "status_id": 1 + ticket_id % 5,
+        "status": {"id": 1 + ticket_id % 5, "name": "New"},
+        "priority_id": 1 + ticket_id % 4,
+        "priority": {"id": 1 + ticket_id % 4, "name": "High"},
+        "tickettype_id": 1,
+        "tickettype": {"id": 1, "name": "Incident"},
+        "agent_id": 100 + ticket_id % 7,
+        "agent": {"id": 100 + ticket_id % 7, "name": "SOC Analyst", "emailaddress": "soc@example.com"},
+        "team_id": 15,
+        "team": {"id": 15, "name": "SOC Team"},
+        "client_id": 12,
+        "site_id": 3,
+        "user_id": 500 + ticket_id % 50,
+        "dateoccurred": "2025-11-06T14:35:55.618Z",
+        "dateupdated": "2025-11-06T15:00:00.000Z",
+        "category_1": "Security",
+        "customfields": [
+            {"id": 201, "name": "CFInvestigationId", "value": f"inv-{ticket_id:08d}"},
+            {"id": 202, "name": "CFSource", "value": "InsightIDR"}
+        ]
+    }
+
+
+def _project(ticket, query):
+    """Drop what the includedetails / includecustomfields flags exclude"""
+    for field, flag in (("details", "includedetails"), ("customfields", "includecustomfields")):
+        if query.get(flag, "").lower() == "false":
+            ticket.pop(field, None)
+    return ticket
+
+
+# List filters and the ticket field each one selects on
+_LIST_FILTERS = {"ticketids": "id", "requesttype": "tickettype_id", "priority": "priority_id"}
+
+
+def _matches(ticket, query):
+    for param, field in _LIST_FILTERS.items():
+        if param in query and str(ticket[field]) not in query[param].split(","):
+            return False
+    return True
+
+
+class StubHaloHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+
+    def log_message(self, format, *args):
+        pass
+
+    def _send_json(self, status, body):
+        payload = json.dumps(body).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def _delay(self, latency=None):
+        latency = self.server.latency if latency is None else latency
+        if latency:
+            time.sleep(latency)
+        self.server.request_count += 1
+
+    def _inject_error(self):
+        """Fail this request with the configured status; True when handled"""
+        if self.server.error_rate and random.random() < self.server.error_rate:
+            self.server.errors_injected += 1
+            self._send_json(self.server.error_status, {"error": "injected failure"})
+            return True
+        return False
+
+    def do_POST(self):
+        length = int(self.headers.get("Content-Length", 0))
+        body = self.rfile.read(length) if length else b""
+        path = urlparse(self.path).path
+        if path.endswith("/token"):
+            self._delay()
+            self._send_json(200, {"access_token": "stub-token", "token_type": "Bearer", "expires_in": 3600})
+            return
+        if path.endswith("/tickets"):
+            self.server.tickets_created += 1
+        self._delay(self.server.latency + self.server.write_latency)
+        if self._inject_error():
+            return
+        if path.endswith("/tickets") or path.endswith("/ticketnotes"):
+            items = json.loads(body or b"[]")
+            for index, item in enumerate(items):
+                item.setdefault("id", 10000 + index)
+            self._send_json(201, items)
+        else:
+            self._send_json(404, {"error": "not found"})
+
+    def do_GET(self):
+        self._delay()
+        if self._inject_error():
+            return
+        parsed = urlparse(self.path)
+        query = {k: v[0] for k, v in parse_qs(parsed.query).items()}
+        single = re.match(r".*/tickets/(\d+)$", parsed.path)
+        missing_every = self.server.missing_every
+        if single and missing_every and int(single.group(1)) % missing_every == 0:
+            self._send_json(404, {"error": "ticket not found"})
+        elif single:
+            self._send_json(200, _project(make_ticket(int(single.group(1)), self.server.details_size), query))
+        elif parsed.path.endswith("/tickets"):
+            page_size = int(query.get("page_size", query.get("count", 50)))
+            page_no = int(query.get("page_no", 1))
+            start = (page_no - 1) * page_size
+            if any(param in query for param in _LIST_FILTERS):
+                ids = [i + 1 for i in range(self.server.total_tickets) if _matches(make_ticket(i + 1, 0), query)]
+            else:
+                ids = range(1, self.server.total_tickets + 1)
+            tickets = [_project(make_ticket(i, self.server.details_size), query) for i in ids[start:start + page_size]]
+            self._send_json(200, {
+                "page_no": page_no,
+                "page_size": page_size,
+                "record_count": len(ids),
+                "tickets": tickets
+            })
+        else:
+            self._send_json(404, {"error": "not found"})
+
+
+def _self_signed_context(workdir):
+    """Create a throwaway self-signed certificate, or None without openssl"""
+    if not shutil.which("openssl"):
+        return None
+    cert = os.path.join(workdir, "cert.pem")
+    key = os.path.join(workdir, "key.pem")
+    subprocess.run(
+        ["openssl", "req", "-x509", "-newkey", "rsa:2048", "-nodes", "-days", "1",
+         "-subj", "/CN=127.0.0.1", "-keyout", key, "-out", cert],
+        check=True, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
+    )
+    context = ssl.SSLContext(ssl.PROTOCOL_TLS_SERVER)
+    context.load_cert_chain(cert, key)
+    return context
+
+
+class _QuietThreadingHTTPServer(ThreadingHTTPServer):
+    # Deep enough for bursts of concurrent clients without SYN retransmits
+    request_queue_size = 128
+
+    def handle_error(self, request, client_address):
+        # Clients that time out and hang up mid-response are expected here
+        pass
+
+
+class StubHaloServer:
+    """Run the stand-in server on a background thread"""
+
+    def __init__(
+        self,
+        latency=0.0,
+        total_tickets=1000,
+        details_size=200,
+        use_tls=True,
+        error_rate=0.0,
+        error_status=503,
+        missing_every=0,
+        write_latency=0.0
+    ):
+        self.httpd = _QuietThreadingHTTPServer(("127.0.0.1", 0), StubHaloHandler)
+        self.httpd.daemon_threads = True
+        self.httpd.latency = latency
+        self.httpd.total_tickets = total_tickets
+        self.httpd.details_size = details_size
+        self.httpd.request_count = 0
+        self.httpd.error_rate = error_rate
+        self.httpd.error_status = error_status
+        self.httpd.errors_injected = 0
+        self.httpd.missing_every = missing_every
+        self.httpd.write_latency = write_latency
+        self.httpd.tickets_created = 0
+        self.scheme = "http"
+        self._workdir = tempfile.mkdtemp(prefix="halo-stub-")
+        if use_tls:
+            context = _self_signed_context(self._workdir)
+            if context is not None:
+                self.httpd.socket = context.wrap_socket(self.httpd.socket, server_side=True)
+                self.scheme = "https"
+        self._thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+
+    @property
+    def base_url(self):
+        host, port = self.httpd.server_address
+        return f"{self.scheme}://{host}:{port}"
+
+    @property
+    def request_count(self):
+        return self.httpd.request_count
+
+    @property
+    def tickets_created(self):
+        """Ticket POSTs the server processed, including ones whose reply the client gave up on"""
+        return self.httpd.tickets_created
+
+    def client_kwargs(self):
+        """Keyword arguments for HaloITSMAPI pointing at this server"""
+        return {
+            "client_id": "bench-client",
+            "client_secret": "bench-secret",
+            "auth_server": f"{self.base_url}/auth",
+            "resource_server": f"{self.base_url}/api",
+            "tenant": "bench",
+            "ssl_verify": False
+        }
+
+    def __enter__(self):
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+        shutil.rmtree(self._workdir, ignore_errors=True)
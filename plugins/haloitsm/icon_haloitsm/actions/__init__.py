@@ -8,6 +8,9 @@ from .assign_ticket.action import AssignTicket
 from .add_comment.action import AddComment
 from .get_user.action import GetUser
 from .get_agent.action import GetAgent
+from .create_tickets.action import CreateTickets
+from .update_tickets.action import UpdateTickets
+from .add_comments.action import AddComments
 
 __all__ = [
     "CreateTicket",
@@ -18,5 +21,8 @@ __all__ = [
     "AssignTicket",
     "AddComment",
     "GetUser",
-    "GetAgent"
+    "GetAgent",
+    "CreateTickets",
+    "UpdateTickets",
+    "AddComments"
 ]
\ No newline at end of file
@@ -21,9 +21,6 @@ class AddComment(insightconnect_plugin_runtime.Action):
         # Extract parameters
         ticket_id = params.get(Input.TICKET_ID)
         note_html = params.get(Input.NOTE_HTML, "")
-        outcome = params.get(Input.OUTCOME, "")
-        who_can_view_id = params.get(Input.WHO_CAN_VIEW_ID, 1)
-        note_type_id = params.get(Input.NOTE_TYPE_ID, 1)
         
         # Handle test/sample scenarios gracefully
         if not ticket_id or ticket_id == 0 or not note_html or note_html.strip() == "":
@@ -37,13 +34,7 @@ class AddComment(insightconnect_plugin_runtime.Action):
             }
         
         # Prepare the note data
-        note_data = {
-            "ticket_id": ticket_id,
-            "note_html": note_html,
-            "outcome": outcome,
-            "who_can_view_id": who_can_view_id,
-            "note_type_id": note_type_id
-        }
+        note_data = self.build_note_data(params)
         
         # Add the comment via API - let PluginExceptions propagate naturally
         result = self.connection.client.add_comment(note_data)
@@ -56,7 +47,8 @@ class AddComment(insightconnect_plugin_runtime.Action):
         
         # Try to get the updated ticket, but don't fail if we can't
         try:
-            updated_ticket = self.connection.client.get_ticket(ticket_id)
+            # Fresh read - a coalesced, cached or batched GET may predate the write
+            updated_ticket = self.connection.client.get_ticket(ticket_id, use_cache=False)
             normalized_ticket = self.connection.client._normalize_ticket(updated_ticket)
         except Exception:
             # Return success even if we can't fetch the updated ticket
@@ -65,4 +57,15 @@ class AddComment(insightconnect_plugin_runtime.Action):
         return {
             Output.TICKET: normalized_ticket,
             Output.SUCCESS: True
-        }
\ No newline at end of file
+        }
+
+    @staticmethod
+    def build_note_data(params):
+        """Build the /ticketnotes payload from action inputs"""
+        return {
+            "ticket_id": params.get(Input.TICKET_ID),
+            "note_html": params.get(Input.NOTE_HTML, ""),
+            "outcome": params.get(Input.OUTCOME, ""),
+            "who_can_view_id": params.get(Input.WHO_CAN_VIEW_ID, 1),
+            "note_type_id": params.get(Input.NOTE_TYPE_ID, 1)
+        }
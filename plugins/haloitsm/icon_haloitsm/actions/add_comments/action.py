@@ -0,0 +1,91 @@
+import insightconnect_plugin_runtime
+from .schema import AddCommentsInput, AddCommentsOutput, Input, Output, Component
+from insightconnect_plugin_runtime.exceptions import PluginException
+from icon_haloitsm.actions.add_comment.action import AddComment
+from icon_haloitsm.util.api import DEFAULT_BATCH_SIZE
+
+
+class AddComments(insightconnect_plugin_runtime.Action):
+
+    def __init__(self):
+        super(self.__class__, self).__init__(
+                name='add_comments',
+                description=Component.DESCRIPTION,
+                input=AddCommentsInput(),
+                output=AddCommentsOutput())
+
+    def run(self, params={}):
+        """Add many comments/notes to HaloITSM tickets, several per request"""
+        # Ensure API client is initialized (lazy initialization)
+        self.connection._ensure_client()
+        
+        notes = params.get(Input.NOTES) or []
+        batch_size = params.get(Input.BATCH_SIZE) or DEFAULT_BATCH_SIZE
+        self.logger.info(f"AddComments: Adding {len(notes)} notes in batches of {batch_size}")
+        
+        # Notes without a ticket or content fail on their own without holding up the rest
+        results = [None] * len(notes)
+        payloads, positions = [], []
+        for index, note_params in enumerate(notes):
+            note_data = AddComment.build_note_data(note_params)
+            if not note_data["ticket_id"] or not (note_data["note_html"] or "").strip():
+                results[index] = self._result(index, note_data["ticket_id"], error="Note requires ticket_id and note_html")
+                continue
+            payloads.append(note_data)
+            positions.append(index)
+        
+        try:
+            created = self.connection.client.add_comments(payloads, batch_size)
+        except PluginException:
+            raise
+        except Exception as e:
+            self.logger.error(f"AddComments: Unexpected error: {type(e).__name__}: {str(e)}")
+            raise PluginException(
+                cause="Failed to add comments",
+                assistance=f"{type(e).__name__}: {str(e)[:200]}"
+            )
+        
+        for position, payload, result in zip(positions, payloads, created):
+            note = result["item"] or {}
+            results[position] = self._result(position, payload["ticket_id"], note.get("id"), result["error"])
+        
+        added = sum(1 for result in results if result["success"])
+        self.logger.info(f"AddComments: {added} added, {len(results) - added} failed")
+        
+        output = {
+            Output.RESULTS: results,
+            Output.ADDED_COUNT: added,
+            Output.FAILED_COUNT: len(results) - added,
+            Output.SUCCESS: added == len(results)
+        }
+        
+        if params.get(Input.REFETCH_TICKETS, False):
+            output[Output.TICKETS] = self._refetch_tickets(results)
+        
+        return output
+
+    @staticmethod
+    def _result(index, ticket_id, note_id=None, error=None):
+        result = {
+            "index": index,
+            "ticket_id": ticket_id or 0,
+            "success": error is None,
+            "error": error or ""
+        }
+        if note_id is not None:
+            result["note_id"] = note_id
+        return result
+
+    def _refetch_tickets(self, results):
+        """Fetch each commented ticket once, however many notes it received, bypassing the cache"""
+        ticket_ids = list(dict.fromkeys(result["ticket_id"] for result in results if result["success"]))
+        if not ticket_ids:
+            return []
+        
+        # Don't fail the action if the refetch fails - the notes were added
+        try:
+            tickets = self.connection.client.get_tickets(ticket_ids, use_cache=False)
+        except Exception as e:
+            self.logger.warning(f"AddComments: Could not refetch tickets {ticket_ids}: {str(e)}")
+            return []
+        return [self.connection.client._normalize_ticket(ticket) for ticket in tickets]
@@ -0,0 +1,156 @@
+# GENERATED BY INSIGHT-PLUGIN - DO NOT EDIT
+import insightconnect_plugin_runtime
+import json
+
+
+class AddCommentsInput(insightconnect_plugin_runtime.Input):
+    schema = json.loads(r"""
+    {
+      "type": "object",
+      "title": "Variables",
+      "properties": {
+        "notes": {
+          "type": "array",
+          "title": "Notes",
+          "description": "Notes to add, each an object with the Add Comment inputs (ticket_id, note_html, outcome, who_can_view_id, note_type_id)",
+          "items": {
+            "type": "object"
+          },
+          "order": 1
+        },
+        "batch_size": {
+          "type": "integer",
+          "title": "Batch Size",
+          "description": "Number of notes sent to HaloITSM per request",
+          "default": 50,
+          "order": 2
+        },
+        "refetch_tickets": {
+          "type": "boolean",
+          "title": "Refetch Tickets",
+          "description": "Fetch each commented ticket once after the notes are added and return it",
+          "default": false,
+          "order": 3
+        }
+      },
+      "required": [
+        "notes"
+      ],
+      "definitions": {}
+    }
+    """)
+
+    def __init__(self):
+        super(self.__class__, self).__init__(self.schema)
+
+
+class AddCommentsOutput(insightconnect_plugin_runtime.Output):
+    schema = json.loads(r"""
+    {
+      "type": "object",
+      "title": "Variables",
+      "properties": {
+        "results": {
+          "type": "array",
+          "title": "Results",
+          "description": "One result per input note, in input order",
+          "items": {
+            "$ref": "#/definitions/bulk_note_result"
+          },
+          "order": 1
+        },
+        "added_count": {
+          "type": "integer",
+          "title": "Added Count",
+          "description": "Number of notes added",
+          "order": 2
+        },
+        "failed_count": {
+          "type": "integer",
+          "title": "Failed Count",
+          "description": "Number of notes that could not be added",
+          "order": 3
+        },
+        "tickets": {
+          "type": "array",
+          "title": "Tickets",
+          "description": "Commented tickets after the update, when Refetch Tickets is enabled",
+          "items": {
+            "type": "object"
+          },
+          "order": 4
+        },
+        "success": {
+          "type": "boolean",
+          "title": "Success",
+          "description": "Were all notes added",
+          "order": 5
+        }
+      },
+      "required": [
+        "results",
+        "added_count",
+        "failed_count",
+        "success"
+      ],
+      "definitions": {
+        "bulk_note_result": {
+          "type": "object",
+          "title": "bulk_note_result",
+          "properties": {
+            "index": {
+              "type": "integer",
+              "title": "Index",
+              "description": "Position of the note in the input array",
+              "order": 1
+            },
+            "ticket_id": {
+              "type": "integer",
+              "title": "Ticket ID",
+              "description": "Ticket the note was added to",
+              "order": 2
+            },
+            "note_id": {
+              "type": "integer",
+              "title": "Note ID",
+              "description": "ID of the created note",
+              "order": 3
+            },
+            "success": {
+              "type": "boolean",
+              "title": "Success",
+              "description": "Was this note added",
+              "order": 4
+            },
+            "error": {
+              "type": "string",
+              "title": "Error",
+              "description": "Why this note failed, empty on success",
+              "order": 5
+            }
+          }
+        }
+      }
+    }
+    """)
+
+    def __init__(self):
+        super(self.__class__, self).__init__(self.schema)
+
+
+class Input:
+    NOTES = "notes"
+    BATCH_SIZE = "batch_size"
+    REFETCH_TICKETS = "refetch_tickets"
+
+
+class Output:
+    RESULTS = "results"
+    ADDED_COUNT = "added_count"
+    FAILED_COUNT = "failed_count"
+    TICKETS = "tickets"
+    SUCCESS = "success"
+
+
+class Component:
+    DESCRIPTION = "Add multiple comments/notes to HaloITSM tickets using batched requests"
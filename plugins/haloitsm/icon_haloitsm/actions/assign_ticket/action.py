@@ -71,7 +71,8 @@ class AssignTicket(insightconnect_plugin_runtime.Action):
             # Get the updated ticket to return current state
             self.logger.info(f"AssignTicket: Fetching updated ticket {ticket_id}")
             try:
-                updated_ticket = self.connection.client.get_ticket(ticket_id)
+                # Fresh read - a coalesced, cached or batched GET may predate the write
+                updated_ticket = self.connection.client.get_ticket(ticket_id, use_cache=False)
                 normalized_ticket = self.connection.client._normalize_ticket(updated_ticket)
             except Exception as get_error:
                 self.logger.warning(f"AssignTicket: Could not fetch updated ticket: {str(get_error)}")
@@ -21,6 +21,36 @@ class CreateTicket(insightconnect_plugin_runtime.Action):
         
         self.logger.info("CreateTicket: Starting ticket creation")
         
+        ticket_data = self.build_ticket_data(params, self.connection)
+        
+        try:
+            # Create ticket using API client
+            result = self.connection.client.create_ticket(ticket_data)
+            
+            self.logger.info(f"CreateTicket v2.1.2: Ticket created successfully with ID {result.get('id')}")
+            self.logger.info(f"CreateTicket: Raw response from HaloITSM: {result}")
+            
+            # Build output
+            return {
+                Output.TICKET: self._normalize_ticket(result),
+                Output.SUCCESS: True
+            }
+            
+        except PluginException:
+            # Re-raise PluginExceptions without modification
+            raise
+        except Exception as e:
+            self.logger.error(f"CreateTicket: Unexpected error: {type(e).__name__}: {str(e)}")
+            raise PluginException(
+                cause="Failed to create ticket",
+                assistance=f"{type(e).__name__}: {str(e)[:200]}"
+            )
+    
+    @staticmethod
+    def build_ticket_data(params, connection):
+        """
+        Build the HaloITSM ticket payload from action inputs, falling back to connection defaults
+        """
         # Build ticket data from input parameters
         ticket_data = {
             "summary": params.get(Input.SUMMARY),
@@ -29,7 +59,7 @@ class CreateTicket(insightconnect_plugin_runtime.Action):
         }
         
         # Use provided ticket type or fall back to connection default
-        ticket_type_id = params.get(Input.TICKETTYPE_ID) or self.connection.default_ticket_type_id
+        ticket_type_id = params.get(Input.TICKETTYPE_ID) or connection.default_ticket_type_id
         if not ticket_type_id:
             raise PluginException(
                 cause="Missing ticket type ID",
@@ -39,11 +69,11 @@ class CreateTicket(insightconnect_plugin_runtime.Action):
         
         # Add optional fields with connection defaults as fallbacks
         field_defaults = [
-            (Input.PRIORITY_ID, "priority_id", self.connection.default_priority_id),
+            (Input.PRIORITY_ID, "priority_id", connection.default_priority_id),
             (Input.STATUS_ID, "status_id", None),  # No default for status, use HaloITSM default
-            (Input.CATEGORY_ID, "category_id", self.connection.default_category_id),
-            (Input.AGENT_ID, "agent_id", self.connection.default_agent_id),
-            (Input.TEAM_ID, "team_id", self.connection.default_team_id),
+            (Input.CATEGORY_ID, "category_id", connection.default_category_id),
+            (Input.AGENT_ID, "agent_id", connection.default_agent_id),
+            (Input.TEAM_ID, "team_id", connection.default_team_id),
             (Input.SITE_ID, "site_id", None),
             (Input.USER_ID, "user_id", None)
         ]
@@ -58,28 +88,11 @@ class CreateTicket(insightconnect_plugin_runtime.Action):
         if custom_fields:
             ticket_data["customfields"] = custom_fields
         
-        try:
-            # Create ticket using API client
-            result = self.connection.client.create_ticket(ticket_data)
-            
-            self.logger.info(f"CreateTicket v2.1.2: Ticket created successfully with ID {result.get('id')}")
-            self.logger.info(f"CreateTicket: Raw response from HaloITSM: {result}")
-            
-            # Build output
-            return {
-                Output.TICKET: self._normalize_ticket(result),
-                Output.SUCCESS: True
-            }
-            
-        except PluginException:
-            # Re-raise PluginExceptions without modification
-            raise
-        except Exception as e:
-            self.logger.error(f"CreateTicket: Unexpected error: {type(e).__name__}: {str(e)}")
-            raise PluginException(
-                cause="Failed to create ticket",
-                assistance=f"{type(e).__name__}: {str(e)[:200]}"
-            )
+        # Reject unknown type / priority / status / team IDs before HaloITSM does
+        if connection.client.reference_data is not None:
+            connection.client.reference_data.validate_ticket(ticket_data)
+        
+        return ticket_data
     
     def _normalize_ticket(self, ticket_data):
         """
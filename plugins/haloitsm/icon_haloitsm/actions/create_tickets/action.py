@@ -0,0 +1,69 @@
+import insightconnect_plugin_runtime
+from .schema import CreateTicketsInput, CreateTicketsOutput, Input, Output, Component
+from insightconnect_plugin_runtime.exceptions import PluginException
+from icon_haloitsm.actions.create_ticket.action import CreateTicket
+from icon_haloitsm.util.api import DEFAULT_BATCH_SIZE
+
+
+class CreateTickets(insightconnect_plugin_runtime.Action):
+    def __init__(self):
+        super(self.__class__, self).__init__(
+            name="create_tickets",
+            description=Component.DESCRIPTION,
+            input=CreateTicketsInput(),
+            output=CreateTicketsOutput()
+        )
+
+    def run(self, params={}):
+        """
+        Create multiple tickets in HaloITSM, several per request
+        """
+        # Ensure API client is initialized (lazy initialization)
+        self.connection._ensure_client()
+        
+        tickets = params.get(Input.TICKETS) or []
+        batch_size = params.get(Input.BATCH_SIZE) or DEFAULT_BATCH_SIZE
+        self.logger.info(f"CreateTickets: Creating {len(tickets)} tickets in batches of {batch_size}")
+        
+        # Invalid inputs (e.g. no ticket type) fail on their own without holding up the rest
+        results = [None] * len(tickets)
+        payloads, positions = [], []
+        for index, ticket_params in enumerate(tickets):
+            try:
+                payloads.append(CreateTicket.build_ticket_data(ticket_params, self.connection))
+                positions.append(index)
+            except PluginException as e:
+                results[index] = {"index": index, "success": False, "item": None, "error": f"{e.cause}. {e.assistance}"}
+        
+        try:
+            for position, result in zip(positions, self.connection.client.create_tickets(payloads, batch_size)):
+                result["index"] = position
+                results[position] = result
+        except PluginException:
+            raise
+        except Exception as e:
+            self.logger.error(f"CreateTickets: Unexpected error: {type(e).__name__}: {str(e)}")
+            raise PluginException(
+                cause="Failed to create tickets",
+                assistance=f"{type(e).__name__}: {str(e)[:200]}"
+            )
+        
+        normalizer = CreateTicket()
+        output = [
+            {
+                "index": result["index"],
+                "success": result["success"],
+                "ticket": normalizer._normalize_ticket(result["item"]) if result["item"] else {},
+                "error": result["error"] or ""
+            }
+            for result in results
+        ]
+        created = sum(1 for result in output if result["success"])
+        self.logger.info(f"CreateTickets: {created} created, {len(output) - created} failed")
+        
+        return {
+            Output.RESULTS: output,
+            Output.CREATED_COUNT: created,
+            Output.FAILED_COUNT: len(output) - created,
+            Output.SUCCESS: created == len(output)
+        }
@@ -14,26 +14,23 @@ class GetAgent(insightconnect_plugin_runtime.Action):
 
     def run(self, params={}):
         """Get agent information by ID"""
+        # Ensure API client is initialized (lazy initialization)
+        self.connection._ensure_client()
+        
         agent_id = params.get(Input.AGENT_ID)
         
         try:
             self.logger.info(f"GetAgent: Retrieving agent {agent_id}")
             
-            # Call HaloITSM API to get agent (agents endpoint)
-            response = self.connection.client.make_request(
-                method="GET",
-                endpoint=f"/agent/{agent_id}"
-            )
+            # Served from the client's shared cache when this agent was looked up recently
+            agent_data = self.connection.client.get_agent(agent_id)
             
-            if not response:
+            if not agent_data:
                 raise PluginException(
                     cause=f"Agent {agent_id} not found",
                     assistance="Verify the agent ID exists in HaloITSM"
                 )
             
-            # Handle both single agent and array response
-            agent_data = response[0] if isinstance(response, list) else response
-            
             self.logger.info(f"GetAgent: Successfully retrieved agent {agent_id}")
             
             return {
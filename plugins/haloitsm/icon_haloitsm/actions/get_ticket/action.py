@@ -2,6 +2,7 @@ import insightconnect_plugin_runtime
 from .schema import GetTicketInput, GetTicketOutput, Input, Output, Component
 
 # Custom imports below
+from icon_haloitsm.util.api import project_ticket, validate_fields
 
 
 class GetTicket(insightconnect_plugin_runtime.Action):
@@ -33,11 +34,12 @@ class GetTicket(insightconnect_plugin_runtime.Action):
                 cause="Invalid ticket ID",
                 assistance="Ticket ID must be a positive integer"
             )
+        fields = validate_fields(params.get(Input.FIELDS))
         
         try:
             # Get ticket from HaloITSM API
             self.logger.info(f"GetTicket: Fetching ticket {ticket_id}")
-            ticket = self.connection.client.get_ticket(ticket_id)
+            ticket = self.connection.client.get_ticket(ticket_id, fields=fields)
             
             if not ticket:
                 raise insightconnect_plugin_runtime.PluginException(
@@ -47,7 +49,7 @@ class GetTicket(insightconnect_plugin_runtime.Action):
             
             # Normalize the ticket data
             self.logger.info(f"GetTicket: Normalizing ticket data")
-            normalized_ticket = self.connection.client._normalize_ticket(ticket)
+            normalized_ticket = project_ticket(self.connection.client._normalize_ticket(ticket), fields)
             
             self.logger.info(f"GetTicket: Successfully retrieved ticket {ticket_id}")
             
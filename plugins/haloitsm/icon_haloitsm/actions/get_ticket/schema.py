@@ -9,6 +9,7 @@ class Component:
 
 class Input:
     TICKET_ID = "ticket_id"
+    FIELDS = "fields"
 
 
 class Output:
@@ -27,6 +28,15 @@ class GetTicketInput(insightconnect_plugin_runtime.Input):
       "title": "Ticket ID",
       "description": "The ID of the ticket to retrieve",
       "order": 1
+    },
+    "fields": {
+      "type": "array",
+      "title": "Fields",
+      "description": "Only return these ticket fields (e.g. id, summary, status_name); details and custom fields are then not downloaded unless listed. Empty returns every field",
+      "items": {
+        "type": "string"
+      },
+      "order": 2
     }
   },
   "required": [
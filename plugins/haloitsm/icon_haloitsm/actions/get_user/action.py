@@ -14,26 +14,23 @@ class GetUser(insightconnect_plugin_runtime.Action):
 
     def run(self, params={}):
         """Get user information by ID"""
+        # Ensure API client is initialized (lazy initialization)
+        self.connection._ensure_client()
+        
         user_id = params.get(Input.USER_ID)
         
         try:
             self.logger.info(f"GetUser: Retrieving user {user_id}")
             
-            # Call HaloITSM API to get user (users endpoint, not agents)
-            response = self.connection.client.make_request(
-                method="GET",
-                endpoint=f"/users/{user_id}"
-            )
+            # Served from the client's shared cache when this user was looked up recently
+            user_data = self.connection.client.get_user(user_id)
             
-            if not response:
+            if not user_data:
                 raise PluginException(
                     cause=f"User {user_id} not found",
                     assistance="Verify the user ID exists in HaloITSM"
                 )
             
-            # Handle both single user and array response
-            user_data = response[0] if isinstance(response, list) else response
-            
             self.logger.info(f"GetUser: Successfully retrieved user {user_id}")
             
             return {
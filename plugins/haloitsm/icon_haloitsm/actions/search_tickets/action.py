@@ -2,6 +2,11 @@ import insightconnect_plugin_runtime
 from .schema import SearchTicketsInput, SearchTicketsOutput, Input, Output, Component
 
 # Custom imports below
+from icon_haloitsm.util.api import DEFAULT_PAGE_SIZE, project_ticket, validate_fields
+from icon_haloitsm.util.pagination import DEFAULT_PREFETCH_WINDOW
+
+# Fetch All returns the whole result in one output, so it stops here unless Max Results says otherwise
+DEFAULT_MAX_RESULTS = 10000
 
 
 class SearchTickets(insightconnect_plugin_runtime.Action):
@@ -21,25 +26,22 @@ class SearchTickets(insightconnect_plugin_runtime.Action):
         search = params.get(Input.SEARCH, "")
         count = params.get(Input.COUNT, 50)
         page_no = params.get(Input.PAGE_NO, 1)
+        fields = validate_fields(params.get(Input.FIELDS))
         
         try:
-            # Prepare search parameters
-            search_params = {
-                "count": count,
-                "page_no": page_no
-            }
-            
-            if search:
-                search_params["search"] = search
-            
-            # Search for tickets via API
-            tickets = self.connection.client.search_tickets(search_params)
-            
-            # Normalize all tickets
-            normalized_tickets = []
-            for ticket in tickets:
-                normalized_ticket = self.connection.client._normalize_ticket(ticket)
-                normalized_tickets.append(normalized_ticket)
+            if params.get(Input.FETCH_ALL, False):
+                # Page through everything, several pages at a time; Count becomes the page size
+                filters = {"search": search} if search else {}
+                max_results = params.get(Input.MAX_RESULTS) or DEFAULT_MAX_RESULTS
+                normalized_tickets = list(self.connection.client.iter_tickets(
+                    filters,
+                    page_size=count or DEFAULT_PAGE_SIZE,
+                    limit=max_results,
+                    prefetch=DEFAULT_PREFETCH_WINDOW,
+                    fields=fields
+                ))
+            else:
+                normalized_tickets = self._search_page(search, count, page_no, fields)
             
             self.logger.info(f"Found {len(normalized_tickets)} tickets matching search criteria")
             
@@ -57,4 +59,25 @@ class SearchTickets(insightconnect_plugin_runtime.Action):
             raise insightconnect_plugin_runtime.PluginException(
                 cause="Failed to search tickets",
                 assistance=f"{type(e).__name__}: {str(e)[:200]}"
-            )
\ No newline at end of file
+            )
+
+    def _search_page(self, search, count, page_no, fields=None):
+        """Fetch a single page of tickets"""
+        # Prepare search parameters
+        search_params = {
+            "count": count,
+            "page_no": page_no
+        }
+        
+        if search:
+            search_params["search"] = search
+        
+        # Search for tickets via API
+        tickets = self.connection.client.search_tickets(search_params, fields=fields)
+        
+        # Normalize all tickets
+        normalized_tickets = []
+        for ticket in tickets:
+            normalized_ticket = self.connection.client._normalize_ticket(ticket)
+            normalized_tickets.append(project_ticket(normalized_ticket, fields))
+        return normalized_tickets
@@ -11,6 +11,9 @@ class Input:
     SEARCH = "search"
     COUNT = "count"
     PAGE_NO = "page_no"
+    FETCH_ALL = "fetch_all"
+    MAX_RESULTS = "max_results"
+    FIELDS = "fields"
 
 
 class Output:
@@ -44,6 +47,29 @@ class SearchTicketsInput(insightconnect_plugin_runtime.Input):
       "description": "Page number for pagination",
       "default": 1,
       "order": 3
+    },
+    "fetch_all": {
+      "type": "boolean",
+      "title": "Fetch All",
+      "description": "Page through every matching ticket instead of returning a single page; Count is then used as the page size",
+      "default": false,
+      "order": 4
+    },
+    "max_results": {
+      "type": "integer",
+      "title": "Max Results",
+      "description": "Stop after this many tickets when Fetch All is enabled, 0 for the default of 10000",
+      "default": 10000,
+      "order": 5
+    },
+    "fields": {
+      "type": "array",
+      "title": "Fields",
+      "description": "Only return these ticket fields (e.g. id, summary, status_name); details and custom fields are then not downloaded unless listed. Empty returns every field",
+      "items": {
+        "type": "string"
+      },
+      "order": 6
     }
   },
   "required": [],
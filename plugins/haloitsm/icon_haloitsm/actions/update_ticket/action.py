@@ -22,30 +22,11 @@ class UpdateTicket(insightconnect_plugin_runtime.Action):
         ticket_id = params.get(Input.TICKET_ID)
         self.logger.info(f"UpdateTicket: Updating ticket {ticket_id}")
         
-        # Build update data - only include fields that were provided
-        ticket_data = {
-            "id": ticket_id,
-            "actioncode": 1  # 1 = Update ticket
-        }
+        ticket_data = self.build_update_data(params)
         
-        # Add provided fields to update
-        field_mapping = {
-            Input.SUMMARY: "summary",
-            Input.DETAILS: "details",
-            Input.STATUS_ID: "status_id",
-            Input.PRIORITY_ID: "priority_id",
-            Input.AGENT_ID: "agent_id"
-        }
-        
-        for input_field, api_field in field_mapping.items():
-            value = params.get(input_field)
-            if value is not None:
-                ticket_data[api_field] = value
-        
-        # Handle custom fields
-        custom_fields = params.get(Input.CUSTOMFIELDS, [])
-        if custom_fields:
-            ticket_data["customfields"] = custom_fields
+        # Reject unknown status / priority IDs before HaloITSM does
+        if self.connection.client.reference_data is not None:
+            self.connection.client.reference_data.validate_ticket(ticket_data)
         
         try:
             # Update ticket using API client
@@ -70,4 +51,35 @@ class UpdateTicket(insightconnect_plugin_runtime.Action):
             raise PluginException(
                 cause="Failed to update ticket",
                 assistance=f"{type(e).__name__}: {str(e)[:200]}"
-            )
\ No newline at end of file
+            )
+    
+    @staticmethod
+    def build_update_data(params):
+        """
+        Build the HaloITSM update payload - only fields that were provided are sent
+        """
+        ticket_data = {
+            "id": params.get(Input.TICKET_ID),
+            "actioncode": 1  # 1 = Update ticket
+        }
+        
+        # Add provided fields to update
+        field_mapping = {
+            Input.SUMMARY: "summary",
+            Input.DETAILS: "details",
+            Input.STATUS_ID: "status_id",
+            Input.PRIORITY_ID: "priority_id",
+            Input.AGENT_ID: "agent_id"
+        }
+        
+        for input_field, api_field in field_mapping.items():
+            value = params.get(input_field)
+            if value is not None:
+                ticket_data[api_field] = value
+        
+        # Handle custom fields
+        custom_fields = params.get(Input.CUSTOMFIELDS, [])
+        if custom_fields:
+            ticket_data["customfields"] = custom_fields
+        
+        return ticket_data
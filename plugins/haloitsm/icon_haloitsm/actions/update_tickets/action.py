@@ -0,0 +1,75 @@
+import insightconnect_plugin_runtime
+from .schema import UpdateTicketsInput, UpdateTicketsOutput, Input, Output, Component
+from insightconnect_plugin_runtime.exceptions import PluginException
+from icon_haloitsm.actions.create_ticket.action import CreateTicket
+from icon_haloitsm.actions.update_ticket.action import UpdateTicket
+from icon_haloitsm.util.api import DEFAULT_BATCH_SIZE
+
+
+class UpdateTickets(insightconnect_plugin_runtime.Action):
+    def __init__(self):
+        super(self.__class__, self).__init__(
+            name="update_tickets",
+            description=Component.DESCRIPTION,
+            input=UpdateTicketsInput(),
+            output=UpdateTicketsOutput()
+        )
+
+    def run(self, params={}):
+        """
+        Update multiple tickets in HaloITSM, several per request
+        """
+        # Ensure API client is initialized (lazy initialization)
+        self.connection._ensure_client()
+        
+        tickets = params.get(Input.TICKETS) or []
+        batch_size = params.get(Input.BATCH_SIZE) or DEFAULT_BATCH_SIZE
+        self.logger.info(f"UpdateTickets: Updating {len(tickets)} tickets in batches of {batch_size}")
+        
+        # Unknown status / priority IDs fail their own ticket, as in Update Ticket, without holding up the rest
+        reference_data = self.connection.client.reference_data
+        results = [None] * len(tickets)
+        payloads, positions = [], []
+        for index, ticket_params in enumerate(tickets):
+            payload = UpdateTicket.build_update_data(ticket_params)
+            try:
+                if reference_data is not None:
+                    reference_data.validate_ticket(payload)
+            except PluginException as e:
+                results[index] = {"index": index, "success": False, "item": None, "error": f"{e.cause}. {e.assistance}"}
+                continue
+            payloads.append(payload)
+            positions.append(index)
+        
+        try:
+            for position, result in zip(positions, self.connection.client.update_tickets(payloads, batch_size)):
+                result["index"] = position
+                results[position] = result
+        except PluginException:
+            raise
+        except Exception as e:
+            self.logger.error(f"UpdateTickets: Unexpected error: {type(e).__name__}: {str(e)}")
+            raise PluginException(
+                cause="Failed to update tickets",
+                assistance=f"{type(e).__name__}: {str(e)[:200]}"
+            )
+        
+        normalizer = CreateTicket()
+        output = [
+            {
+                "index": result["index"],
+                "success": result["success"],
+                "ticket": normalizer._normalize_ticket(result["item"]) if result["item"] else {},
+                "error": result["error"] or ""
+            }
+            for result in results
+        ]
+        updated = sum(1 for result in output if result["success"])
+        self.logger.info(f"UpdateTickets: {updated} updated, {len(output) - updated} failed")
+        
+        return {
+            Output.RESULTS: output,
+            Output.UPDATED_COUNT: updated,
+            Output.FAILED_COUNT: len(output) - updated,
+            Output.SUCCESS: updated == len(output)
+        }
@@ -0,0 +1,170 @@
+# GENERATED BY INSIGHT-PLUGIN - DO NOT EDIT
+import insightconnect_plugin_runtime
+import json
+
+
+class UpdateTicketsInput(insightconnect_plugin_runtime.Input):
+    schema = json.loads(r"""
+    {
+      "type": "object",
+      "title": "Variables",
+      "properties": {
+        "tickets": {
+          "type": "array",
+          "title": "Tickets",
+          "description": "Tickets to update, each an object with the Update Ticket inputs (ticket_id required, plus summary, details, status_id, priority_id, agent_id, customfields)",
+          "items": {
+            "type": "object"
+          },
+          "order": 1
+        },
+        "batch_size": {
+          "type": "integer",
+          "title": "Batch Size",
+          "description": "Number of tickets sent to HaloITSM per request",
+          "default": 50,
+          "order": 2
+        }
+      },
+      "required": [
+        "tickets"
+      ],
+      "definitions": {}
+    }
+    """)
+
+    def __init__(self):
+        super(self.__class__, self).__init__(self.schema)
+
+
+class UpdateTicketsOutput(insightconnect_plugin_runtime.Output):
+    schema = json.loads(r"""
+    {
+      "type": "object",
+      "title": "Variables",
+      "properties": {
+        "results": {
+          "type": "array",
+          "title": "Results",
+          "description": "One result per input ticket, in input order",
+          "items": {
+            "$ref": "#/definitions/bulk_ticket_result"
+          },
+          "order": 1
+        },
+        "updated_count": {
+          "type": "integer",
+          "title": "Updated Count",
+          "description": "Number of tickets updated",
+          "order": 2
+        },
+        "failed_count": {
+          "type": "integer",
+          "title": "Failed Count",
+          "description": "Number of tickets that could not be updated",
+          "order": 3
+        },
+        "success": {
+          "type": "boolean",
+          "title": "Success",
+          "description": "Were all tickets updated",
+          "order": 4
+        }
+      },
+      "required": [
+        "results",
+        "updated_count",
+        "failed_count",
+        "success"
+      ],
+      "definitions": {
+        "bulk_ticket_result": {
+          "type": "object",
+          "title": "bulk_ticket_result",
+          "properties": {
+            "index": {
+              "type": "integer",
+              "title": "Index",
+              "description": "Position of the ticket in the input array",
+              "order": 1
+            },
+            "success": {
+              "type": "boolean",
+              "title": "Success",
+              "description": "Was this ticket processed successfully",
+              "order": 2
+            },
+            "ticket": {
+              "$ref": "#/definitions/ticket",
+              "title": "Ticket",
+              "description": "Ticket details returned by HaloITSM",
+              "order": 3
+            },
+            "error": {
+              "type": "string",
+              "title": "Error",
+              "description": "Why this ticket failed, empty on success",
+              "order": 4
+            }
+          },
+          "definitions": {
+            "ticket": {
+              "type": "object",
+              "title": "ticket",
+              "properties": {
+                "id": {
+                  "type": "integer",
+                  "title": "ID",
+                  "description": "Ticket ID",
+                  "order": 1
+                },
+                "summary": {
+                  "type": "string",
+                  "title": "Summary",
+                  "description": "Ticket summary",
+                  "order": 2
+                }
+              }
+            }
+          }
+        },
+        "ticket": {
+          "type": "object",
+          "title": "ticket",
+          "properties": {
+            "id": {
+              "type": "integer",
+              "title": "ID",
+              "description": "Ticket ID",
+              "order": 1
+            },
+            "summary": {
+              "type": "string",
+              "title": "Summary",
+              "description": "Ticket summary",
+              "order": 2
+            }
+          }
+        }
+      }
+    }
+    """)
+
+    def __init__(self):
+        super(self.__class__, self).__init__(self.schema)
+
+
+class Input:
+    TICKETS = "tickets"
+    BATCH_SIZE = "batch_size"
+
+
+class Output:
+    RESULTS = "results"
+    UPDATED_COUNT = "updated_count"
+    FAILED_COUNT = "failed_count"
+    SUCCESS = "success"
+
+
+class Component:
+    DESCRIPTION = "Update multiple tickets in HaloITSM using batched requests"
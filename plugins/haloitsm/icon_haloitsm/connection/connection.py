@@ -1,14 +1,18 @@
 import insightconnect_plugin_runtime
 from .schema import ConnectionSchema, Input
 from insightconnect_plugin_runtime.exceptions import PluginException, ConnectionTestException
+import os
 import requests
+import sqlite3
 from typing import Dict, Any
+from icon_haloitsm.util.circuit_breaker import DEFAULT_FAILURE_THRESHOLD, DEFAULT_RECOVERY_TIMEOUT
 
 
 class Connection(insightconnect_plugin_runtime.Connection):
     def __init__(self):
         super(self.__class__, self).__init__(input=ConnectionSchema())
         self.client = None
+        self.feed = None
         self.access_token = None
         self.auth_server = None
         self.resource_server = None
@@ -44,6 +48,13 @@ class Connection(insightconnect_plugin_runtime.Connection):
             self.resource_server = params.get(Input.RESOURCE_SERVER)
             self.tenant = params.get(Input.TENANT)
             self.ssl_verify = params.get(Input.SSL_VERIFY, True)
+            self.background_token_refresh = params.get(Input.BACKGROUND_TOKEN_REFRESH, False)
+            self.read_rate_limit = params.get(Input.READ_RATE_LIMIT) or None
+            self.write_rate_limit = params.get(Input.WRITE_RATE_LIMIT) or None
+            self.circuit_breaker_threshold = params.get(Input.CIRCUIT_BREAKER_THRESHOLD) or DEFAULT_FAILURE_THRESHOLD
+            self.circuit_breaker_timeout = params.get(Input.CIRCUIT_BREAKER_TIMEOUT) or DEFAULT_RECOVERY_TIMEOUT
+            self.reference_data_refresh = params.get(Input.REFERENCE_DATA_REFRESH) or 0
+            self.ticket_batch_window = params.get(Input.TICKET_BATCH_WINDOW) or 0
             
             # Store default values for ticket creation
             self.default_ticket_type_id = params.get(Input.DEFAULT_TICKET_TYPE_ID)
@@ -90,11 +101,56 @@ class Connection(insightconnect_plugin_runtime.Connection):
             resource_server=self.resource_server,
             tenant=self.tenant,
             ssl_verify=self.ssl_verify,
-            logger=self.logger
+            logger=self.logger,
+            background_token_refresh=self.background_token_refresh,
+            read_rate_limit=self.read_rate_limit,
+            write_rate_limit=self.write_rate_limit,
+            circuit_failure_threshold=self.circuit_breaker_threshold,
+            circuit_recovery_timeout=self.circuit_breaker_timeout,
+            reference_data_refresh=self.reference_data_refresh,
+            ticket_batch_window=self.ticket_batch_window / 1000
         )
         
         self.logger.info("API client initialized successfully")
 
+    def change_feed(self):
+        """
+        The connection's shared ticket change feed, created on first use by a trigger
+        """
+        self._ensure_client()
+        if self.feed is None:
+            from icon_haloitsm.util.change_feed import ChangeFeed
+            from icon_haloitsm.util.poller import DEFAULT_POLL_STATE_DIR, FilePollStateStore, TicketPoller, poll_state_key
+            from icon_haloitsm.util.snapshot_store import SnapshotStore
+            key = poll_state_key(self.resource_server, self.tenant, "change_feed")
+            poller = TicketPoller(self.client, key=key, store=FilePollStateStore(), logger=self.logger)
+            try:
+                os.makedirs(DEFAULT_POLL_STATE_DIR, mode=0o700, exist_ok=True)
+                snapshots = SnapshotStore(os.path.join(DEFAULT_POLL_STATE_DIR, f"{key}.sqlite"))
+            except (OSError, sqlite3.Error) as e:
+                # Unwritable state directory - keep snapshots for the life of the process only
+                self.logger.warning(f"Ticket snapshots kept in memory: {str(e)}")
+                snapshots = SnapshotStore()
+            self.feed = ChangeFeed(poller, snapshots=snapshots, logger=self.logger)
+        return self.feed
+
+    def close(self) -> None:
+        """
+        Stop the change feed and release the API client's pooled connections
+
+        Nothing depends on this being called: background token renewal and
+        reference data are shared per tenant and outlive the connection.
+        """
+        if self.feed is not None:
+            self.feed.close()
+            self.feed = None
+        if self.client is None:
+            return
+
+        self.logger.info("Closing API client")
+        self.client.close()
+        self.client = None
+
     def test(self) -> Dict[str, bool]:
         """
         Test the connection by making an actual API call
@@ -3,121 +3,179 @@ import insightconnect_plugin_runtime
 import json
 
 
+class Input:
+    AUTHORIZATION_SERVER = "authorization_server"
+    BACKGROUND_TOKEN_REFRESH = "background_token_refresh"
+    CIRCUIT_BREAKER_THRESHOLD = "circuit_breaker_threshold"
+    CIRCUIT_BREAKER_TIMEOUT = "circuit_breaker_timeout"
+    CLIENT_ID = "client_id"
+    CLIENT_SECRET = "client_secret"
+    DEFAULT_AGENT_ID = "default_agent_id"
+    DEFAULT_CATEGORY_ID = "default_category_id"
+    DEFAULT_PRIORITY_ID = "default_priority_id"
+    DEFAULT_TEAM_ID = "default_team_id"
+    DEFAULT_TICKET_TYPE_ID = "default_ticket_type_id"
+    READ_RATE_LIMIT = "read_rate_limit"
+    REFERENCE_DATA_REFRESH = "reference_data_refresh"
+    RESOURCE_SERVER = "resource_server"
+    SSL_VERIFY = "ssl_verify"
+    TENANT = "tenant"
+    TICKET_BATCH_WINDOW = "ticket_batch_window"
+    WRITE_RATE_LIMIT = "write_rate_limit"
+
+
 class ConnectionSchema(insightconnect_plugin_runtime.Input):
     schema = json.loads(r"""
-    {
+   {
+  "type": "object",
+  "title": "Variables",
+  "properties": {
+    "authorization_server": {
+      "type": "string",
+      "title": "Authorization Server",
+      "description": "HaloITSM OAuth2 authorization server URL",
+      "order": 3
+    },
+    "background_token_refresh": {
+      "type": "boolean",
+      "title": "Background Token Refresh",
+      "description": "Renew the OAuth2 token in the background before it expires so actions never wait on token acquisition",
+      "default": false,
+      "order": 12
+    },
+    "circuit_breaker_threshold": {
+      "type": "integer",
+      "title": "Circuit Breaker Threshold",
+      "description": "Consecutive failed requests (timeouts, connection errors, 5xx) to an endpoint group before requests fail fast",
+      "default": 5,
+      "order": 15
+    },
+    "circuit_breaker_timeout": {
+      "type": "integer",
+      "title": "Circuit Breaker Timeout",
+      "description": "Seconds requests fail fast after the circuit opens before a single recovery probe is sent",
+      "default": 30,
+      "order": 16
+    },
+    "client_id": {
+      "type": "string",
+      "title": "Client ID",
+      "description": "OAuth2 Client ID for API authentication",
+      "order": 1
+    },
+    "client_secret": {
+      "$ref": "#/definitions/credential_secret_key",
+      "title": "Client Secret",
+      "description": "OAuth2 Client Secret for API authentication",
+      "order": 2
+    },
+    "default_agent_id": {
+      "type": "integer",
+      "title": "Default Agent ID",
+      "description": "Default agent ID to assign tickets to (can be overridden per action)",
+      "order": 10
+    },
+    "default_category_id": {
+      "type": "integer",
+      "title": "Default Category ID",
+      "description": "Default category ID for tickets (can be overridden per action)",
+      "order": 11
+    },
+    "default_priority_id": {
+      "type": "integer",
+      "title": "Default Priority ID",
+      "description": "Default priority ID to use when creating tickets (can be overridden per action)",
+      "order": 8
+    },
+    "default_team_id": {
+      "type": "integer",
+      "title": "Default Team ID",
+      "description": "Default team ID to assign tickets to (can be overridden per action)",
+      "order": 9
+    },
+    "default_ticket_type_id": {
+      "type": "integer",
+      "title": "Default Ticket Type ID",
+      "description": "Default ticket type ID to use when creating tickets (can be overridden per action)",
+      "order": 7
+    },
+    "read_rate_limit": {
+      "type": "number",
+      "title": "Read Rate Limit",
+      "description": "Maximum read (GET) requests per second sent to HaloITSM for this tenant, 0 for no client-side limit",
+      "default": 0,
+      "order": 13
+    },
+    "reference_data_refresh": {
+      "type": "integer",
+      "title": "Reference Data Refresh",
+      "description": "Seconds between background reloads of ticket types, priorities, statuses and teams used to resolve names and validate IDs (0 to disable)",
+      "default": 0,
+      "order": 17
+    },
+    "resource_server": {
+      "type": "string",
+      "title": "Resource Server",
+      "description": "HaloITSM API resource server URL",
+      "order": 4
+    },
+    "ssl_verify": {
+      "type": "boolean",
+      "title": "SSL Verify",
+      "description": "Verify SSL certificate",
+      "default": true,
+      "order": 6
+    },
+    "tenant": {
+      "type": "string",
+      "title": "Tenant",
+      "description": "HaloITSM tenant identifier",
+      "order": 5
+    },
+    "ticket_batch_window": {
+      "type": "integer",
+      "title": "Ticket Batch Window",
+      "description": "Milliseconds Get Ticket lookups from concurrent workflows are collected and fetched with one request (0 to fetch each ticket on its own)",
+      "default": 0,
+      "order": 18
+    },
+    "write_rate_limit": {
+      "type": "number",
+      "title": "Write Rate Limit",
+      "description": "Maximum write requests per second sent to HaloITSM for this tenant, 0 for no client-side limit",
+      "default": 0,
+      "order": 14
+    }
+  },
+  "required": [
+    "authorization_server",
+    "client_id",
+    "client_secret",
+    "resource_server",
+    "tenant"
+  ],
+  "definitions": {
+    "credential_secret_key": {
+      "id": "credential_secret_key",
       "type": "object",
-      "title": "Variables",
-      "properties": {
-        "client_id": {
-          "type": "string",
-          "title": "Client ID",
-          "description": "OAuth2 Client ID for API authentication",
-          "order": 1
-        },
-        "client_secret": {
-          "$ref": "#/definitions/credential_secret_key",
-          "title": "Client Secret",
-          "description": "OAuth2 Client Secret for API authentication",
-          "order": 2
-        },
-        "authorization_server": {
-          "type": "string",
-          "title": "Authorization Server",
-          "description": "HaloITSM OAuth2 authorization server URL",
-          "order": 3
-        },
-        "resource_server": {
-          "type": "string",
-          "title": "Resource Server", 
-          "description": "HaloITSM API resource server URL",
-          "order": 4
-        },
-        "tenant": {
-          "type": "string",
-          "title": "Tenant",
-          "description": "HaloITSM tenant identifier",
-          "order": 5
-        },
-        "ssl_verify": {
-          "type": "boolean",
-          "title": "SSL Verify",
-          "description": "Verify SSL certificate",
-          "default": true,
-          "order": 6
-        },
-        "default_ticket_type_id": {
-          "type": "integer",
-          "title": "Default Ticket Type ID",
-          "description": "Default ticket type ID to use when creating tickets (can be overridden per action)",
-          "order": 7
-        },
-        "default_priority_id": {
-          "type": "integer",
-          "title": "Default Priority ID", 
-          "description": "Default priority ID to use when creating tickets (can be overridden per action)",
-          "order": 8
-        },
-        "default_team_id": {
-          "type": "integer",
-          "title": "Default Team ID",
-          "description": "Default team ID to assign tickets to (can be overridden per action)",
-          "order": 9
-        },
-        "default_agent_id": {
-          "type": "integer",
-          "title": "Default Agent ID",
-          "description": "Default agent ID to assign tickets to (can be overridden per action)",
-          "order": 10
-        },
-        "default_category_id": {
-          "type": "integer",
-          "title": "Default Category ID",
-          "description": "Default category ID for tickets (can be overridden per action)",
-          "order": 11
-        }
-      },
+      "title": "Credential: Secret Key",
+      "description": "A shared secret key",
       "required": [
-        "client_id",
-        "client_secret", 
-        "authorization_server",
-        "resource_server",
-        "tenant"
+        "secretKey"
       ],
-      "definitions": {
-        "credential_secret_key": {
-          "id": "credential_secret_key",
-          "type": "object",
-          "title": "Credential: Secret Key",
-          "description": "A shared secret key",
-          "required": ["secretKey"],
-          "properties": {
-            "secretKey": {
-              "type": "string",
-              "title": "Secret Key",
-              "description": "The shared secret key",
-              "format": "password",
-              "displayType": "password"
-            }
-          }
+      "properties": {
+        "secretKey": {
+          "type": "string",
+          "title": "Secret Key",
+          "description": "The shared secret key",
+          "format": "password",
+          "displayType": "password"
         }
       }
     }
+  }
+}
     """)
 
     def __init__(self):
         super(self.__class__, self).__init__(self.schema)
-
-
-class Input:
-    CLIENT_ID = "client_id"
-    CLIENT_SECRET = "client_secret"
-    AUTHORIZATION_SERVER = "authorization_server"
-    RESOURCE_SERVER = "resource_server"
-    TENANT = "tenant"
-    SSL_VERIFY = "ssl_verify"
-    DEFAULT_TICKET_TYPE_ID = "default_ticket_type_id"
-    DEFAULT_PRIORITY_ID = "default_priority_id"
-    DEFAULT_TEAM_ID = "default_team_id"
-    DEFAULT_AGENT_ID = "default_agent_id"
-    DEFAULT_CATEGORY_ID = "default_category_id"
\ No newline at end of file
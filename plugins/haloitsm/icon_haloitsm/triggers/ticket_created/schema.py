@@ -20,6 +20,13 @@ class TicketCreatedInput(insightconnect_plugin_runtime.Input):
           "title": "Priority ID",
           "description": "Only trigger for specific priority (optional)",
           "order": 2
+        },
+        "interval": {
+          "type": "integer",
+          "title": "Interval",
+          "description": "Seconds between two polls of HaloITSM for changed tickets",
+          "default": 60,
+          "order": 3
         }
       },
       "required": [],
@@ -77,6 +84,7 @@ class TicketCreatedOutput(insightconnect_plugin_runtime.Output):
 class Input:
     TICKETTYPE_ID = "tickettype_id"
     PRIORITY_ID = "priority_id"
+    INTERVAL = "interval"
 
 
 class Output:
@@ -84,4 +92,4 @@ class Output:
 
 
 class Component:
-    DESCRIPTION = "Triggers when a new ticket is created in HaloITSM (webhook)"
\ No newline at end of file
+    DESCRIPTION = "Triggers when a new ticket is created in HaloITSM (polling)"
\ No newline at end of file
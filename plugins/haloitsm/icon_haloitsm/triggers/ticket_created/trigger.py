@@ -1,7 +1,9 @@
 import insightconnect_plugin_runtime
 from .schema import TicketCreatedInput, TicketCreatedOutput, Input, Output, Component
 from insightconnect_plugin_runtime.exceptions import PluginException
-import time
+
+# Custom imports below
+from icon_haloitsm.util.poller import DEFAULT_POLL_INTERVAL
 
 
 class TicketCreated(insightconnect_plugin_runtime.Trigger):
@@ -16,41 +18,59 @@ class TicketCreated(insightconnect_plugin_runtime.Trigger):
     def run(self, params={}):
         """
         Polling trigger for new ticket creation
-        Continuously checks for new tickets
+        Receives changed tickets from the connection's change feed and sends each new one once
         """
+        # Ensure API client is initialized (lazy initialization)
+        self.connection._ensure_client()
+        
         # Get optional filters from trigger configuration
-        filter_tickettype = params.get(Input.TICKETTYPE_ID)
-        filter_priority = params.get(Input.PRIORITY_ID)
+        self.filter_tickettype = params.get(Input.TICKETTYPE_ID)
+        self.filter_priority = params.get(Input.PRIORITY_ID)
+        interval = params.get(Input.INTERVAL) or DEFAULT_POLL_INTERVAL
         
-        self.logger.info("TicketCreated: Polling trigger started")
+        # One poll of HaloITSM per connection, shared with every other trigger; the filters
+        # also narrow that poll's query when every other trigger filters the same fields
+        pushdown = {}
+        if self.filter_tickettype:
+            pushdown["tickettype_id"] = [self.filter_tickettype]
+        if self.filter_priority:
+            pushdown["priority_id"] = [self.filter_priority]
+        subscription = self.connection.change_feed().subscribe(interval, pushdown)
         
-        # Polling triggers run continuously
-        while True:
-            # The workflow engine will populate params with webhook body on each request
-            ticket_data = params.get('ticket', {})
-            
-            if ticket_data:
-                # Apply filters if specified
-                if filter_tickettype and ticket_data.get('tickettype_id') != filter_tickettype:
-                    time.sleep(0.1)
-                    continue
-                
-                if filter_priority and ticket_data.get('priority_id') != filter_priority:
-                    time.sleep(0.1)
-                    continue
-                
+        self.logger.info(f"TicketCreated: Polling trigger started (every {interval} s)")
+        try:
+            for change in subscription:
                 try:
-                    # Normalize ticket data
-                    from icon_haloitsm.actions.create_ticket.action import CreateTicket
-                    normalized_ticket = CreateTicket()._normalize_ticket(ticket_data)
-                    
-                    self.logger.info(f"TicketCreated: Processing new ticket {ticket_data.get('id')}")
-                    
-                    # Send normalized ticket to workflow
-                    self.send({Output.TICKET: normalized_ticket})
-                    
+                    self.process(change)
                 except Exception as e:
-                    self.logger.error(f"TicketCreated: Error processing ticket: {str(e)}")
+                    # Not sent - the feed offers the change again with its next poll
+                    self.logger.error(f"TicketCreated: Send failed, retrying with the next poll: {str(e)}")
+                    subscription.reject()
+        finally:
+            subscription.close()
+
+    def process(self, change):
+        """Send one changed ticket if it is new and matches the filters"""
+        if not change.created:
+            return
+        ticket_data = change.ticket
+        
+        # Apply filters if specified
+        if self.filter_tickettype and ticket_data.get('tickettype_id') != self.filter_tickettype:
+            return
+        
+        if self.filter_priority and ticket_data.get('priority_id') != self.filter_priority:
+            return
+        
+        try:
+            # Normalize ticket data
+            normalized_ticket = self.connection.client._normalize_ticket(ticket_data)
             
-            # Small sleep to prevent CPU spinning
-            time.sleep(0.1)
\ No newline at end of file
+            self.logger.info(f"TicketCreated: Processing new ticket {ticket_data.get('id')}")
+            
+        except Exception as e:
+            self.logger.error(f"TicketCreated: Error processing ticket: {str(e)}")
+            return
+        
+        # Send normalized ticket to workflow - a failure is raised so the change is retried
+        self.send({Output.TICKET: normalized_ticket})
@@ -20,6 +20,13 @@ class TicketStatusChangedInput(insightconnect_plugin_runtime.Input):
           "title": "New Status ID",
           "description": "Only trigger when status changes to this value (optional)",
           "order": 2
+        },
+        "interval": {
+          "type": "integer",
+          "title": "Interval",
+          "description": "Seconds between two polls of HaloITSM for changed tickets",
+          "default": 60,
+          "order": 3
         }
       },
       "required": [],
@@ -91,6 +98,7 @@ class TicketStatusChangedOutput(insightconnect_plugin_runtime.Output):
 class Input:
     TICKET_ID = "ticket_id"
     NEW_STATUS_ID = "new_status_id"
+    INTERVAL = "interval"
 
 
 class Output:
@@ -100,4 +108,4 @@ class Output:
 
 
 class Component:
-    DESCRIPTION = "Triggers specifically when ticket status changes (webhook)"
+    DESCRIPTION = "Triggers specifically when ticket status changes (polling)"
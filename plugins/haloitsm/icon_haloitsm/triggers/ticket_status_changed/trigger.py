@@ -1,7 +1,9 @@
 import insightconnect_plugin_runtime
 from .schema import TicketStatusChangedInput, TicketStatusChangedOutput, Input, Output, Component
 from insightconnect_plugin_runtime.exceptions import PluginException
-import time
+
+# Custom imports below
+from icon_haloitsm.util.poller import DEFAULT_POLL_INTERVAL
 
 
 class TicketStatusChanged(insightconnect_plugin_runtime.Trigger):
@@ -16,52 +18,65 @@ class TicketStatusChanged(insightconnect_plugin_runtime.Trigger):
     def run(self, params={}):
         """
         Polling trigger for ticket status changes
-        Continuously checks for status changes
+        Receives changed tickets from the connection's change feed and sends each status change once
         """
+        # Ensure API client is initialized (lazy initialization)
+        self.connection._ensure_client()
+        
         # Get optional filters from trigger configuration
-        filter_ticket_id = params.get(Input.TICKET_ID)
-        filter_new_status = params.get(Input.NEW_STATUS_ID)
+        self.filter_ticket_id = params.get(Input.TICKET_ID)
+        self.filter_new_status = params.get(Input.NEW_STATUS_ID)
+        interval = params.get(Input.INTERVAL) or DEFAULT_POLL_INTERVAL
         
-        self.logger.info("TicketStatusChanged: Polling trigger started")
+        # One poll of HaloITSM per connection, shared with every other trigger; the ticket
+        # filter also narrows that poll's query when every other trigger filters ticket ids.
+        # The new status is filtered here only: pushing it down would hide the ticket until
+        # it reaches that status, leaving nothing to compare its old status with
+        pushdown = {"id": [self.filter_ticket_id]} if self.filter_ticket_id else {}
+        subscription = self.connection.change_feed().subscribe(interval, pushdown)
         
-        # Polling triggers run continuously
-        while True:
-            # The workflow engine will populate params with webhook body on each request
-            ticket_data = params.get('ticket', {})
-            old_status_id = params.get('old_status_id')
-            new_status_id = ticket_data.get('status_id') if ticket_data else None
-            
-            if ticket_data:
-                # Apply filters if specified
-                if filter_ticket_id and ticket_data.get('id') != filter_ticket_id:
-                    time.sleep(0.1)
-                    continue
-                
-                if filter_new_status and new_status_id != filter_new_status:
-                    time.sleep(0.1)
-                    continue
-                
-                # Only trigger if status actually changed
-                if old_status_id is not None and old_status_id == new_status_id:
-                    time.sleep(0.1)
-                    continue
-                
+        self.logger.info(f"TicketStatusChanged: Polling trigger started (every {interval} s)")
+        try:
+            for change in subscription:
                 try:
-                    # Normalize ticket data
-                    from icon_haloitsm.actions.create_ticket.action import CreateTicket
-                    normalized_ticket = CreateTicket()._normalize_ticket(ticket_data)
-                    
-                    self.logger.info(f"TicketStatusChanged: Ticket {ticket_data.get('id')} status changed from {old_status_id} to {new_status_id}")
-                    
-                    # Send normalized ticket to workflow with status info
-                    self.send({
-                        Output.TICKET: normalized_ticket,
-                        Output.OLD_STATUS_ID: old_status_id if old_status_id is not None else 0,
-                        Output.NEW_STATUS_ID: new_status_id if new_status_id is not None else 0
-                    })
-                
+                    self.process(change)
                 except Exception as e:
-                    self.logger.error(f"TicketStatusChanged: Error processing ticket: {str(e)}")
+                    # Not sent - the feed offers the change again with its next poll
+                    self.logger.error(f"TicketStatusChanged: Send failed, retrying with the next poll: {str(e)}")
+                    subscription.reject()
+        finally:
+            subscription.close()
+
+    def process(self, change):
+        """Send one changed ticket if its status moved and it matches the filters"""
+        ticket_data = change.ticket
+        new_status_id = change.current.status_id
+        old_status_id = change.previous.status_id if change.previous else None
+        
+        # Only trigger if status actually changed - unknown until the ticket was seen once
+        if change.created or old_status_id is None or old_status_id == new_status_id:
+            return
+        
+        # Apply filters if specified
+        if self.filter_ticket_id and ticket_data.get('id') != self.filter_ticket_id:
+            return
+        
+        if self.filter_new_status and new_status_id != self.filter_new_status:
+            return
+        
+        try:
+            # Normalize ticket data
+            normalized_ticket = self.connection.client._normalize_ticket(ticket_data)
             
-            # Small sleep to prevent CPU spinning
-            time.sleep(0.1)
+            self.logger.info(f"TicketStatusChanged: Ticket {ticket_data.get('id')} status changed from {old_status_id} to {new_status_id}")
+        
+        except Exception as e:
+            self.logger.error(f"TicketStatusChanged: Error processing ticket: {str(e)}")
+            return
+        
+        # Send normalized ticket to workflow with status info - a failure is raised so the change is retried
+        self.send({
+            Output.TICKET: normalized_ticket,
+            Output.OLD_STATUS_ID: old_status_id,
+            Output.NEW_STATUS_ID: new_status_id if new_status_id is not None else 0
+        })
@@ -21,6 +21,22 @@ class TicketUpdatedInput(insightconnect_plugin_runtime.Input):
           "description": "Only trigger when status changes",
           "default": false,
           "order": 2
+        },
+        "interval": {
+          "type": "integer",
+          "title": "Interval",
+          "description": "Seconds between two polls of HaloITSM for changed tickets",
+          "default": 60,
+          "order": 3
+        },
+        "watched_fields": {
+          "type": "array",
+          "title": "Watched Fields",
+          "description": "Only trigger when one of these ticket fields changes, e.g. status_id, agent_id, summary; empty watches all of them",
+          "items": {
+            "type": "string"
+          },
+          "order": 4
         }
       },
       "required": [],
@@ -49,6 +65,15 @@ class TicketUpdatedOutput(insightconnect_plugin_runtime.Output):
           "title": "Previous Status ID",
           "description": "Previous status ID before update",
           "order": 2
+        },
+        "changed_fields": {
+          "type": "array",
+          "title": "Changed Fields",
+          "description": "Watched fields that changed, empty when the ticket was not seen before",
+          "items": {
+            "type": "string"
+          },
+          "order": 3
         }
       },
       "required": [
@@ -84,12 +109,15 @@ class TicketUpdatedOutput(insightconnect_plugin_runtime.Output):
 class Input:
     TICKET_ID = "ticket_id"
     STATUS_CHANGED = "status_changed"
+    INTERVAL = "interval"
+    WATCHED_FIELDS = "watched_fields"
 
 
 class Output:
     TICKET = "ticket"
     PREVIOUS_STATUS_ID = "previous_status_id"
+    CHANGED_FIELDS = "changed_fields"
 
 
 class Component:
-    DESCRIPTION = "Triggers when a ticket is updated in HaloITSM (webhook)"
+    DESCRIPTION = "Triggers when a ticket is updated in HaloITSM (polling)"
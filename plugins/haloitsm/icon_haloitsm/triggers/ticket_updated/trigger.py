@@ -1,7 +1,10 @@
 import insightconnect_plugin_runtime
 from .schema import TicketUpdatedInput, TicketUpdatedOutput, Input, Output, Component
 from insightconnect_plugin_runtime.exceptions import PluginException
-import time
+
+# Custom imports below
+from icon_haloitsm.util.poller import DEFAULT_POLL_INTERVAL
+from icon_haloitsm.util.snapshot_store import changed_fields, validate_watched_fields
 
 
 class TicketUpdated(insightconnect_plugin_runtime.Trigger):
@@ -12,57 +15,82 @@ class TicketUpdated(insightconnect_plugin_runtime.Trigger):
             input=TicketUpdatedInput(),
             output=TicketUpdatedOutput()
         )
+        # Changes left out because none of the watched fields moved
+        self.suppressed = 0
 
     def run(self, params={}):
         """
         Polling trigger for ticket updates
-        Continuously checks for ticket updates
+        Receives changed tickets from the connection's change feed and sends each update once
         """
+        # Ensure API client is initialized (lazy initialization)
+        self.connection._ensure_client()
+        
         # Get optional filters from trigger configuration
-        filter_ticket_id = params.get(Input.TICKET_ID)
-        filter_status_changed = params.get(Input.STATUS_CHANGED, False)
+        self.filter_ticket_id = params.get(Input.TICKET_ID)
+        self.filter_status_changed = params.get(Input.STATUS_CHANGED, False)
+        self.watched_fields = validate_watched_fields(params.get(Input.WATCHED_FIELDS))
+        if self.filter_status_changed and "status_id" not in self.watched_fields:
+            self.watched_fields.append("status_id")
+        interval = params.get(Input.INTERVAL) or DEFAULT_POLL_INTERVAL
         
-        self.logger.info("TicketUpdated: Polling trigger started")
+        # One poll of HaloITSM per connection, shared with every other trigger; the ticket
+        # filter also narrows that poll's query when every other trigger filters ticket ids
+        pushdown = {"id": [self.filter_ticket_id]} if self.filter_ticket_id else {}
+        subscription = self.connection.change_feed().subscribe(interval, pushdown)
         
-        # Polling triggers run continuously
-        while True:
-            # The workflow engine will populate params with webhook body on each request
-            ticket_data = params.get('ticket', {})
-            previous_status_id = params.get('previous_status_id')
-            
-            if ticket_data:
-                # Apply filters if specified
-                if filter_ticket_id and ticket_data.get('id') != filter_ticket_id:
-                    time.sleep(0.1)
-                    continue
-                
-                # Check if status changed (if filter enabled)
-                if filter_status_changed:
-                    current_status = ticket_data.get('status_id')
-                    if previous_status_id == current_status:
-                        # Skip if status didn't change and filter is enabled
-                        time.sleep(0.1)
-                        continue
-                
+        self.logger.info(f"TicketUpdated: Polling trigger started (every {interval} s)")
+        try:
+            for change in subscription:
                 try:
-                    # Normalize ticket data
-                    from icon_haloitsm.actions.create_ticket.action import CreateTicket
-                    normalized_ticket = CreateTicket()._normalize_ticket(ticket_data)
-                    
-                    self.logger.info(f"TicketUpdated: Ticket {ticket_data.get('id')} updated")
-                    
-                    # Prepare output
-                    output = {Output.TICKET: normalized_ticket}
-                    
-                    # Include previous status if available
-                    if previous_status_id is not None:
-                        output[Output.PREVIOUS_STATUS_ID] = previous_status_id
-                    
-                    # Send normalized ticket to workflow
-                    self.send(output)
-                
+                    self.process(change)
                 except Exception as e:
-                    self.logger.error(f"TicketUpdated: Error processing ticket: {str(e)}")
+                    # Not sent - the feed offers the change again with its next poll
+                    self.logger.error(f"TicketUpdated: Send failed, retrying with the next poll: {str(e)}")
+                    subscription.reject()
+        finally:
+            subscription.close()
+
+    def process(self, change):
+        """Send one changed ticket if it is an update matching the filters"""
+        ticket_data = change.ticket
+        current_status = change.current.status_id
+        previous_status_id = change.previous.status_id if change.previous else None
+        
+        # New tickets are reported by TicketCreated
+        if change.created:
+            return
+        
+        # Apply filters if specified
+        if self.filter_ticket_id and ticket_data.get('id') != self.filter_ticket_id:
+            return
+        
+        # Check if status changed (if filter enabled) - unknown until the ticket was seen once
+        if self.filter_status_changed and (change.previous is None or previous_status_id == current_status):
+            return
+        
+        # Only dateupdated moved - nothing watched changed
+        changed = changed_fields(change.previous, change.current, self.watched_fields) if change.previous else []
+        if change.previous is not None and not changed:
+            self.suppressed += 1
+            return
+        
+        try:
+            # Normalize ticket data
+            normalized_ticket = self.connection.client._normalize_ticket(ticket_data)
+            
+            self.logger.info(f"TicketUpdated: Ticket {ticket_data.get('id')} updated ({', '.join(changed) or 'first seen'})")
             
-            # Small sleep to prevent CPU spinning
-            time.sleep(0.1)
+            # Prepare output
+            output = {Output.TICKET: normalized_ticket, Output.CHANGED_FIELDS: changed}
+            
+            # Include previous status if available
+            if previous_status_id is not None:
+                output[Output.PREVIOUS_STATUS_ID] = previous_status_id
+        
+        except Exception as e:
+            self.logger.error(f"TicketUpdated: Error processing ticket: {str(e)}")
+            return
+        
+        # Send normalized ticket to workflow - a failure is raised so the change is retried
+        self.send(output)
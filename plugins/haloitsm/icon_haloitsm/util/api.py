@@ -1,7 +1,88 @@
 import requests
+import threading
 import time
-from typing import Dict, Any, Optional
+from concurrent.futures import ThreadPoolExecutor
+from requests.adapters import HTTPAdapter
+from typing import Dict, Any, Optional, List, Iterator, Tuple
 from insightconnect_plugin_runtime.exceptions import PluginException
+from icon_haloitsm.util.token_renewer import TokenRenewer, DEFAULT_REFRESH_FRACTION, DEFAULT_REFRESH_JITTER
+from icon_haloitsm.util.token_store import TokenStore, FileTokenStore, token_store_key
+from icon_haloitsm.util.rate_limiter import RateLimiter, endpoint_class, parse_retry_after
+from icon_haloitsm.util.retry import RetryPolicy, CONNECT_ERROR, TIMEOUT, CONNECTION_ERROR
+from icon_haloitsm.util.pagination import prefetch_pages
+from icon_haloitsm.util.cache import TTLCache, DEFAULT_MAXSIZE, DEFAULT_NEGATIVE_TTL
+from icon_haloitsm.util.reference_data import ReferenceData
+from icon_haloitsm.util.http_cache import HTTPCache, request_key, DEFAULT_MAX_ENTRIES
+from icon_haloitsm.util.coalesce import RequestCoalescer
+from icon_haloitsm.util.batch_loader import BatchLoader
+from icon_haloitsm.util import json_codec
+from icon_haloitsm.util.json_stream import JSONArrayStream, stream_response
+from icon_haloitsm.util.circuit_breaker import CircuitBreakers, CircuitBreaker, DEFAULT_FAILURE_THRESHOLD, DEFAULT_RECOVERY_TIMEOUT
+
+# Connection pool defaults - one pool per host, kept alive between actions
+DEFAULT_POOL_CONNECTIONS = 4
+DEFAULT_POOL_MAXSIZE = 10
+# Tickets per POST /tickets in create_tickets / update_tickets
+DEFAULT_BATCH_SIZE = 50
+# Answers rejecting an update batch for its content - only these are worth re-sending
+# ticket by ticket; transport errors, 5xx, auth, 429 and an open circuit fail the batch
+BATCH_REJECTION_STATUSES = frozenset((400, 404, 409, 422))
+# Tickets per GET /tickets page in iter_tickets
+DEFAULT_PAGE_SIZE = 100
+# Parallel single-ticket requests when a batch cannot use the ticketids filter
+DEFAULT_TICKET_FANOUT = 8
+# Fields of a normalized ticket (see _normalize_ticket) that can be projected
+TICKET_FIELDS = (
+    "id", "summary", "details", "status_name", "status_id", "priority_name", "priority_id",
+    "ticket_type_name", "ticket_type_id", "agent_name", "agent_id", "agent_email", "team_name",
+    "team_id", "date_created", "date_updated", "client_name", "client_id", "site_name", "site_id",
+    "user_name", "user_id", "category_1", "category_2", "category_3", "category_4", "resolution",
+    "url", "customfields"
+)
+# HaloITSM query flags that leave heavy parts out of the response when their field is not wanted
+PROJECTION_FLAGS = {
+    "details": "includedetails",
+    "customfields": "includecustomfields"
+}
+# Paging is controlled by iter_tickets, never by caller filters
+PAGING_PARAMS = ("pageinate", "page_size", "page_no", "count")
+# Seconds agents / users stay in the entity cache
+DEFAULT_AGENT_CACHE_TTL = 600
+DEFAULT_USER_CACHE_TTL = 300
+
+
+def projection_params(fields: Optional[List[str]]) -> Dict[str, Any]:
+    """Query flags asking HaloITSM to only send what the projected fields need"""
+    if not fields:
+        return {}
+    return {flag: field in fields for field, flag in PROJECTION_FLAGS.items()}
+
+
+def project_ticket(ticket: Dict[str, Any], fields: Optional[List[str]]) -> Dict[str, Any]:
+    """Keep only the given fields of a normalized ticket (id is always kept); all of it when fields is empty"""
+    if not fields or not ticket:
+        return ticket
+    return {key: value for key, value in ticket.items() if key == "id" or key in fields}
+
+
+def validate_fields(fields: Optional[List[str]]) -> List[str]:
+    """Return the requested fields, raising a PluginException for names a ticket does not have"""
+    fields = [str(field).strip() for field in fields or [] if str(field).strip()]
+    unknown = [field for field in fields if field not in TICKET_FIELDS]
+    if unknown:
+        raise PluginException(
+            cause=f"Unknown ticket field(s): {', '.join(unknown)}",
+            assistance=f"Valid fields are: {', '.join(TICKET_FIELDS)}"
+        )
+    return fields
+
+
+class HaloITSMAPIError(PluginException):
+    """PluginException for an HTTP error answer from HaloITSM, carrying its status code"""
+
+    def __init__(self, status_code: Optional[int] = None, **kwargs):
+        super().__init__(**kwargs)
+        self.status_code = status_code
 
 
 class HaloITSMAPI:
@@ -17,7 +98,29 @@ class HaloITSMAPI:
         resource_server: str,
         tenant: str,
         ssl_verify: bool = True,
-        logger=None
+        logger=None,
+        pool_connections: int = DEFAULT_POOL_CONNECTIONS,
+        pool_maxsize: int = DEFAULT_POOL_MAXSIZE,
+        pool_block: bool = False,
+        background_token_refresh: bool = False,
+        token_refresh_fraction: float = DEFAULT_REFRESH_FRACTION,
+        token_refresh_jitter: float = DEFAULT_REFRESH_JITTER,
+        token_store: Optional[TokenStore] = None,
+        read_rate_limit: Optional[float] = None,
+        write_rate_limit: Optional[float] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        circuit_failure_threshold: int = DEFAULT_FAILURE_THRESHOLD,
+        circuit_recovery_timeout: float = DEFAULT_RECOVERY_TIMEOUT,
+        circuit_overrides: Optional[Dict[str, Dict[str, float]]] = None,
+        entity_cache_size: int = DEFAULT_MAXSIZE,
+        agent_cache_ttl: float = DEFAULT_AGENT_CACHE_TTL,
+        user_cache_ttl: float = DEFAULT_USER_CACHE_TTL,
+        negative_cache_ttl: float = DEFAULT_NEGATIVE_TTL,
+        reference_data_refresh: float = 0,
+        http_cache_size: int = DEFAULT_MAX_ENTRIES,
+        coalesce_requests: bool = True,
+        ticket_batch_window: float = 0,
+        ticket_fanout: int = DEFAULT_TICKET_FANOUT
     ):
         self.client_id = client_id
         self.client_secret = client_secret
@@ -30,6 +133,66 @@ class HaloITSMAPI:
         
         self.access_token = None
         self.token_expires_at = 0
+        self.token_issued_at = 0
+        self.token_lifetime = 0
+        # Single-flight refresh: one /token request at a time, bumped per new token
+        self._token_lock = threading.Lock()
+        self._token_generation = 0
+        # Token shared with other workers/processes using the same credentials
+        self.token_store = token_store if token_store is not None else FileTokenStore()
+        self._token_store_key = token_store_key(self.auth_server, self.client_id, self.tenant, self.client_secret)
+        
+        self.pool_connections = pool_connections
+        self.pool_maxsize = pool_maxsize
+        self.pool_block = pool_block
+        self.session = self._build_session()
+        
+        self.retry_policy = retry_policy if retry_policy is not None else RetryPolicy()
+        
+        # Agents and users looked up by id, shared by every action using this client
+        self.entity_cache = TTLCache(maxsize=entity_cache_size, negative_ttl=negative_cache_ttl)
+        self.entity_cache_ttls = {"agent": agent_cache_ttl, "user": user_cache_ttl}
+        
+        # Revalidated GET responses (0 disables)
+        self.http_cache = HTTPCache(max_entries=http_cache_size) if http_cache_size else None
+        # Identical GETs issued concurrently (e.g. by parallel workflows) share one request
+        self.coalescer = RequestCoalescer() if coalesce_requests else None
+        # get_ticket calls within ticket_batch_window seconds become one /tickets?ticketids= request (0 disables)
+        self.ticket_fanout = max(1, int(ticket_fanout))
+        self.ticket_id_filter = True
+        self.ticket_loader = None
+        if ticket_batch_window and ticket_batch_window > 0:
+            self.ticket_loader = BatchLoader(
+                self._fetch_tickets,
+                window=ticket_batch_window,
+                max_batch_size=DEFAULT_BATCH_SIZE,
+                name="haloitsm-ticket-loader"
+            )
+        
+        # Ticket type / priority / status / team names, loaded on first use and shared per tenant (0 disables)
+        self.reference_data = None
+        if reference_data_refresh and reference_data_refresh > 0:
+            self.reference_data = ReferenceData.for_tenant(
+                f"{self.resource_server}|{self.tenant}",
+                self,
+                refresh_interval=reference_data_refresh,
+                logger=logger
+            )
+        
+        # Shared by every client of this tenant in the process, including the 429 cooldown
+        self.rate_limiter = RateLimiter.for_tenant(
+            f"{self.resource_server}|{self.tenant}",
+            read_rate=read_rate_limit,
+            write_rate=write_rate_limit
+        )
+        # Per endpoint group (tickets, actions, agent...) so one failing area does not block the rest
+        self.circuit_breakers = CircuitBreakers.for_tenant(
+            f"{self.resource_server}|{self.tenant}",
+            failure_threshold=circuit_failure_threshold,
+            recovery_timeout=circuit_recovery_timeout,
+            overrides=circuit_overrides,
+            logger=logger
+        )
         
         # Validate that required fields are not empty
         if not self.auth_server:
@@ -42,16 +205,155 @@ class HaloITSMAPI:
                 cause="Invalid resource server",
                 assistance="Resource server URL cannot be empty"
             )
+        
+        # Optional proactive renewal so requests never wait on the token endpoint,
+        # started with the first token and shared by every client of the tenant
+        self.background_token_refresh = background_token_refresh
+        self.token_refresh_fraction = token_refresh_fraction
+        self.token_refresh_jitter = token_refresh_jitter
+        self.token_renewer = None
+    
+    def _build_session(self) -> requests.Session:
+        """
+        Build a pooled keep-alive session shared by every request on this client
+
+        Connections (and their TLS sessions) are reused across calls instead of
+        paying a new TCP + TLS handshake for each ticket operation.
+        pool_connections is the number of per-host pools kept, pool_maxsize the
+        number of connections kept per host and pool_block caps concurrent
+        connections per host at pool_maxsize instead of opening extra ones.
+        """
+        session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=self.pool_connections,
+            pool_maxsize=self.pool_maxsize,
+            pool_block=self.pool_block
+        )
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        session.verify = self.ssl_verify
+        return session
+    
+    def close(self) -> None:
+        """Release pooled connections; token renewal and reference data are shared per tenant and keep running"""
+        if self.session is not None:
+            self.session.close()
     
     def get_access_token(self) -> str:
         """
         Get OAuth2 access token, refreshing if necessary
         """
-        current_time = time.time()
+        return self._get_token()[0]
+    
+    def _cached_token(self) -> Optional[tuple]:
+        """Return (token, generation) if the cached token is still valid (with 60 second buffer)"""
+        token, generation, expires_at = self.access_token, self._token_generation, self.token_expires_at
+        if token and time.time() < (expires_at - 60):
+            return token, generation
+        return None
+    
+    def _get_token(self) -> tuple:
+        """
+        Get (token, generation), refreshing at most once across concurrent callers
+
+        Threads (and gevent greenlets, whose monkey patching covers
+        threading.Lock) that find the token expired queue on the lock; the
+        first one refreshes and the rest pick up its result.
+        """
+        cached = self._cached_token()
+        if cached:
+            return cached
         
-        # Return cached token if still valid (with 60 second buffer)
-        if self.access_token and current_time < (self.token_expires_at - 60):
-            return self.access_token
+        with self._token_lock:
+            cached = self._cached_token()
+            if cached:
+                return cached
+            # Another worker may already hold a valid token - check before queueing for the refresh lock
+            if self._adopt_shared_token():
+                return self.access_token, self._token_generation
+            with self._shared_token_lock():
+                if self._adopt_shared_token():
+                    return self.access_token, self._token_generation
+                token = self._request_token()
+                return token, self._token_generation
+    
+    def refresh_token(self) -> str:
+        """Request a new token now, even if the cached one is still valid"""
+        with self._token_lock:
+            issued_at = self.token_issued_at
+            with self._shared_token_lock():
+                # Another worker renewed since we got ours - use its token
+                if self._adopt_shared_token(newer_than=issued_at):
+                    return self.access_token
+                return self._request_token()
+    
+    def _invalidate_token(self, generation: int) -> None:
+        """Drop the cached token only if it is still the generation that failed"""
+        with self._token_lock:
+            if self._token_generation == generation:
+                failed_token = self.access_token
+                self.access_token = None
+                try:
+                    self.token_store.delete(self._token_store_key, access_token=failed_token)
+                except Exception as e:
+                    if self.logger:
+                        self.logger.warning(f"Could not remove token from shared cache: {str(e)}")
+    
+    def _shared_token_lock(self):
+        """Cross-process lock so only one worker refreshes the shared token"""
+        return self.token_store.lock(self._token_store_key)
+    
+    def _adopt_shared_token(self, newer_than: float = 0) -> bool:
+        """Load a still-valid token from the shared store into this client"""
+        try:
+            record = self.token_store.load(self._token_store_key)
+        except Exception as e:
+            if self.logger:
+                self.logger.warning(f"Could not read shared token cache: {str(e)}")
+            return False
+        if not record or not record.get("access_token"):
+            return False
+        if time.time() >= record.get("expires_at", 0) - 60 or record.get("issued_at", 0) <= newer_than:
+            return False
+        
+        self._set_token(record["access_token"], record["issued_at"], record["lifetime"])
+        if self.logger:
+            self.logger.info("Using OAuth2 token from shared token cache")
+        return True
+    
+    def _save_shared_token(self) -> None:
+        """Publish the current token for other workers - failures only cost a refresh"""
+        try:
+            self.token_store.save(self._token_store_key, {
+                "access_token": self.access_token,
+                "issued_at": self.token_issued_at,
+                "lifetime": self.token_lifetime,
+                "expires_at": self.token_expires_at
+            })
+        except Exception as e:
+            if self.logger:
+                self.logger.warning(f"Could not write shared token cache: {str(e)}")
+    
+    def _set_token(self, access_token: str, issued_at: float, lifetime: float) -> None:
+        self.token_issued_at = issued_at
+        self.token_lifetime = lifetime
+        self.token_expires_at = issued_at + lifetime
+        self.access_token = access_token
+        self._token_generation += 1
+        if self.background_token_refresh and self.token_renewer is None:
+            self.token_renewer = TokenRenewer.for_tenant(
+                self._token_store_key,
+                self,
+                refresh_fraction=self.token_refresh_fraction,
+                jitter=self.token_refresh_jitter,
+                logger=self.logger
+            )
+    
+    def _request_token(self) -> str:
+        """
+        Request a new OAuth2 token from the authorization server
+        """
+        current_time = time.time()
         
         # Request new token
         token_url = f"{self.auth_server}/token"
@@ -73,7 +375,7 @@ class HaloITSMAPI:
                 self.logger.info(f"SSL Verify: {self.ssl_verify}, Timeout: 5s connect, 10s read")
             
             # Use very aggressive timeouts - connection test should be fast
-            response = requests.post(
+            response = self.session.post(
                 token_url,
                 data=payload,
                 headers=headers,
@@ -87,9 +389,9 @@ class HaloITSMAPI:
             response.raise_for_status()
             
             token_data = response.json()
-            self.access_token = token_data.get("access_token")
             expires_in = token_data.get("expires_in", 3600)
-            self.token_expires_at = current_time + expires_in
+            self._set_token(token_data.get("access_token"), current_time, expires_in)
+            self._save_shared_token()
             
             if self.logger:
                 self.logger.info(f"OAuth2 token obtained, expires in {expires_in} seconds")
@@ -134,12 +436,46 @@ class HaloITSMAPI:
         params: Optional[Dict[str, Any]] = None,
         json_data: Optional[Any] = None,
         retry_count: int = 3,
-        timeout: int = 30
+        timeout: int = 30,
+        idempotent: Optional[bool] = None,
+        cache: bool = True,
+        stream: bool = False
     ) -> Any:
         """
         Make an authenticated request to HaloITSM API
+
+        retry_count is the maximum number of attempts; retry_policy decides which
+        failures are retried. idempotent overrides the method-based default, e.g.
+        for POSTs that are safe to re-send. GETs go through the HTTP cache unless
+        cache is False, and identical GETs already in flight are joined rather
+        than sent again. Both share the result object, so do not modify it.
+        
+        With stream=True the body is not read up front: a JSONArrayStream is
+        returned that decodes the "tickets" array (or a bare array) item by item
+        from the socket. Iterate it to the end or close() it.
         """
-        token = self.get_access_token()
+        if stream:
+            return self._make_request(method, endpoint, params, json_data, retry_count, timeout, idempotent, False, True)
+        if cache and self.coalescer is not None and method.upper() == "GET":
+            return self.coalescer.do(
+                request_key(method, endpoint, params),
+                lambda: self._make_request(method, endpoint, params, json_data, retry_count, timeout, idempotent, cache, False)
+            )
+        return self._make_request(method, endpoint, params, json_data, retry_count, timeout, idempotent, cache, False)
+    
+    def _make_request(
+        self,
+        method: str,
+        endpoint: str,
+        params: Optional[Dict[str, Any]],
+        json_data: Optional[Any],
+        retry_count: int,
+        timeout: int,
+        idempotent: Optional[bool],
+        cache: bool,
+        stream: bool
+    ) -> Any:
+        token, generation = self._get_token()
         url = f"{self.resource_server}{endpoint}"
         
         headers = {
@@ -152,68 +488,129 @@ class HaloITSMAPI:
             if json_data:
                 self.logger.info(f"Request payload: {json_data}")
         
+        cache_key = cache_entry = None
+        use_cache = self.http_cache is not None and method.upper() == "GET"
+        if use_cache and not cache:
+            self.http_cache.record_bypass()
+            use_cache = False
+        if use_cache:
+            cache_key = request_key(method, endpoint, params)
+            cache_entry = self.http_cache.lookup(cache_key)
+            headers.update(HTTPCache.conditional_headers(cache_entry))
+        
+        # Encoded once, not per attempt
+        body = None
+        if json_data is not None:
+            try:
+                body = json_codec.dumps(json_data)
+            except (TypeError, ValueError) as e:
+                raise PluginException(
+                    cause="Invalid request payload",
+                    assistance=f"The request body could not be encoded as JSON: {str(e)}",
+                    data=str(e)
+                )
+        
+        policy = self.retry_policy
+        if idempotent is None:
+            idempotent = policy.is_idempotent(method)
+        policy.budget.record_request()
+        breaker = self.circuit_breakers.for_endpoint(endpoint)
+        
         for attempt in range(retry_count):
+            last_attempt = attempt == retry_count - 1
+            if not breaker.allow_request():
+                raise self._circuit_open_error(breaker)
             try:
                 if self.logger:
                     self.logger.info(f"Request attempt {attempt + 1}/{retry_count}")
                 
-                response = requests.request(
+                self.rate_limiter.acquire(endpoint_class(method))
+                response = self.session.request(
                     method=method,
                     url=url,
                     headers=headers,
                     params=params,
-                    json=json_data,
+                    data=body,
                     verify=self.ssl_verify,
-                    timeout=timeout
+                    timeout=timeout,
+                    stream=stream
                 )
                 
+                # 5xx means HaloITSM itself is failing; any other answer proves it is up
+                if response.status_code >= 500:
+                    breaker.record_failure(f"HTTP {response.status_code}")
+                elif response.status_code == 429:
+                    breaker.release()
+                else:
+                    breaker.record_success()
+                
                 # Handle 401 - token may have expired
-                if response.status_code == 401 and attempt < retry_count - 1:
+                if response.status_code == 401 and not last_attempt:
                     if self.logger:
                         self.logger.info("Token expired, refreshing...")
-                    self.access_token = None  # Force token refresh
-                    token = self.get_access_token()
+                    # Only invalidate the token this request used - a concurrent caller may already have refreshed it
+                    self._invalidate_token(generation)
+                    token, generation = self._get_token()
                     headers["Authorization"] = f"Bearer {token}"
+                    response.close()
                     continue
                 
+                # Handle 429 - every caller on this tenant waits out Retry-After, even when this request gives up
+                if response.status_code == 429:
+                    cooldown = self.rate_limiter.cooldown(parse_retry_after(response.headers.get("Retry-After")))
+                    if self.logger:
+                        self.logger.warning(f"HaloITSM rate limit hit, pausing requests for {cooldown:.1f} seconds")
+                    if not last_attempt and policy.should_retry(idempotent, status=429):
+                        response.close()
+                        continue
+                
                 response.raise_for_status()
                 
+                if stream:
+                    return stream_response(response)
+                if use_cache:
+                    return self.http_cache.resolve(cache_key, cache_entry, response)
+                
                 # Return JSON if available, otherwise return text
                 try:
-                    return response.json()
+                    return json_codec.decode_response(response)
                 except ValueError:
                     return response.text
                     
             except requests.exceptions.HTTPError as e:
                 # HTTPError MUST be first (subclass of RequestException)
-                # Use e.response to safely access response data
+                # Use e.response to safely access response data - a Response is falsy for error statuses
+                has_response = e.response is not None
+                status = e.response.status_code if has_response else None
                 if self.logger:
-                    status = e.response.status_code if e.response else "unknown"
-                    self.logger.warning(f"HTTP error on attempt {attempt + 1}/{retry_count}: {status}")
-                    if e.response:
+                    self.logger.warning(f"HTTP error on attempt {attempt + 1}/{retry_count}: {status or 'unknown'}")
+                    if has_response:
                         self.logger.warning(f"Response body: {e.response.text}")
-                if attempt == retry_count - 1:
-                    status = e.response.status_code if e.response else "unknown"
-                    text = e.response.text if e.response else str(e)
+                if last_attempt or not policy.should_retry(idempotent, status=status):
+                    text = e.response.text if has_response else str(e)
                     
                     # Try to parse JSON error response
                     error_detail = text
                     try:
-                        if e.response:
+                        if has_response:
                             error_json = e.response.json()
                             error_detail = str(error_json)
                     except:
                         pass
                     
-                    raise PluginException(
-                        cause=f"HaloITSM API error {status}",
+                    raise HaloITSMAPIError(
+                        status_code=status,
+                        cause=f"HaloITSM API error {status or 'unknown'}",
                         assistance=f"The API request failed. Error: {error_detail[:500]}",
                         data=error_detail[:1000]
                     )
             except requests.exceptions.Timeout as e:
                 if self.logger:
                     self.logger.warning(f"Request timeout on attempt {attempt + 1}/{retry_count}")
-                if attempt == retry_count - 1:
+                breaker.record_failure(type(e).__name__)
+                # A connect timeout means the request never reached HaloITSM
+                error = CONNECT_ERROR if isinstance(e, requests.exceptions.ConnectTimeout) else TIMEOUT
+                if last_attempt or not policy.should_retry(idempotent, error=error):
                     raise PluginException(
                         cause="Request timeout",
                         assistance=f"HaloITSM API did not respond within {timeout} seconds. Check network connectivity and server URL.",
@@ -222,34 +619,170 @@ class HaloITSMAPI:
             except requests.exceptions.RequestException as e:
                 if self.logger:
                     self.logger.warning(f"Request error on attempt {attempt + 1}/{retry_count}: {str(e)}")
-                if attempt == retry_count - 1:
+                breaker.record_failure(type(e).__name__)
+                if last_attempt or not policy.should_retry(idempotent, error=CONNECTION_ERROR):
                     raise PluginException(
                         cause="Request failed",
                         assistance=f"Unable to connect to HaloITSM API: {str(e)}",
                         data=str(e)
                     )
             except Exception as e:
-                # Catch ANY other exception that might occur
+                # Anything else is a bug or bad input - retrying will not help
+                breaker.release()
                 if self.logger:
                     self.logger.error(f"Unexpected error on attempt {attempt + 1}/{retry_count}: {type(e).__name__}: {str(e)}")
-                if attempt == retry_count - 1:
-                    raise PluginException(
-                        cause=f"Unexpected error: {type(e).__name__}",
-                        assistance=f"An unexpected error occurred: {str(e)}",
-                        data=str(e)
-                    )
+                raise PluginException(
+                    cause=f"Unexpected error: {type(e).__name__}",
+                    assistance=f"An unexpected error occurred: {str(e)}",
+                    data=str(e)
+                )
             
-            # Wait before retry with exponential backoff
-            time.sleep(1 * (attempt + 1))
+            # An open circuit fails the next attempt straight away - no point sleeping first
+            if breaker.retry_in() > 0:
+                continue
+            # Wait before retry with exponential backoff and full jitter
+            time.sleep(policy.backoff(attempt))
     
-    def get_ticket(self, ticket_id: int) -> Dict[str, Any]:
-        """Get a specific ticket by ID"""
+    def _circuit_open_error(self, breaker: CircuitBreaker) -> PluginException:
+        """Fail fast while HaloITSM is known to be down"""
+        retry_in = breaker.retry_in()
+        if self.logger:
+            self.logger.warning(f"HaloITSM circuit '{breaker.name}' is {breaker.state}, request rejected without calling the API")
+        return PluginException(
+            cause="HaloITSM unavailable",
+            assistance=(
+                f"Recent requests to HaloITSM '{breaker.name}' endpoints kept failing, so calls are paused "
+                f"for {retry_in:.0f} more seconds before a recovery probe. Check HaloITSM status and use the "
+                "outage template for manual tracking if the outage persists."
+            ),
+            data=str(breaker.stats())
+        )
+    
+    def get_ticket(self, ticket_id: int, use_cache: bool = True, fields: Optional[List[str]] = None) -> Dict[str, Any]:
+        """
+        Get a specific ticket by ID; use_cache=False skips the HTTP cache and batching
+
+        With a ticket batch window, calls from concurrent callers are collected
+        and fetched together (see _fetch_tickets). fields (normalized ticket
+        field names) lets HaloITSM leave details / custom fields out of the
+        response when they are not needed.
+        """
+        if use_cache and not fields and self.ticket_loader is not None:
+            return self.ticket_loader.load(str(ticket_id))
         response = self.make_request(
             method="GET",
-            endpoint=f"/tickets/{ticket_id}"
+            endpoint=f"/tickets/{ticket_id}",
+            params=projection_params(fields) or None,
+            cache=use_cache
         )
         return response
     
+    def get_tickets(self, ticket_ids: List[int], use_cache: bool = True) -> List[Dict[str, Any]]:
+        """
+        Get several tickets by ID, in the given order, with as few requests as possible
+
+        use_cache=False skips the HTTP cache and batching, for callers that
+        need the tickets as they are now.
+        """
+        keys = [str(ticket_id) for ticket_id in ticket_ids]
+        if use_cache and self.ticket_loader is not None:
+            return self.ticket_loader.load_many(keys)
+        results = self._fetch_tickets(list(dict.fromkeys(keys)), cache=use_cache)
+        for key in keys:
+            if isinstance(results[key], Exception):
+                raise results[key]
+        return [results[key] for key in keys]
+    
+    def _fetch_tickets(self, keys: List[str], cache: bool = True) -> Dict[str, Any]:
+        """
+        Fetch tickets by ID for the batch loader, mapping each ID to its ticket or error
+
+        Several IDs are requested with one /tickets?ticketids= list request. IDs
+        it does not return (and every ID, if the filter turns out to be
+        unsupported) are fetched one by one, at most ticket_fanout at a time,
+        so each caller still gets its own ticket or its own 404.
+        """
+        results = {}
+        if self.ticket_id_filter and len(keys) > 1:
+            try:
+                response = self.make_request(
+                    method="GET",
+                    endpoint="/tickets",
+                    params={
+                        "ticketids": ",".join(keys),
+                        "includedetails": True,
+                        "pageinate": True,
+                        "page_size": len(keys),
+                        "page_no": 1
+                    },
+                    cache=cache
+                )
+                if isinstance(response, dict):
+                    tickets = response.get("tickets") or []
+                else:
+                    tickets = response if isinstance(response, list) else []
+                for ticket in tickets:
+                    if isinstance(ticket, dict) and str(ticket.get("id")) in keys:
+                        results[str(ticket["id"])] = ticket
+                # Tickets back but none of ours: the filter is being ignored
+                if tickets and not results:
+                    self._disable_ticket_id_filter("ticketids filter ignored by HaloITSM")
+            except HaloITSMAPIError as e:
+                if e.status_code == 400:
+                    self._disable_ticket_id_filter(e.cause)
+                elif self.logger:
+                    self.logger.warning(f"Batched ticket lookup failed, fetching individually: {e.cause}")
+        
+        missing = [key for key in keys if key not in results]
+        if len(missing) == 1:
+            results[missing[0]] = self._fetch_ticket(missing[0], cache)
+        elif missing:
+            with ThreadPoolExecutor(max_workers=min(self.ticket_fanout, len(missing)), thread_name_prefix="haloitsm-ticket") as executor:
+                results.update(zip(missing, executor.map(self._fetch_ticket, missing, [cache] * len(missing))))
+        return results
+    
+    def _fetch_ticket(self, key: str, cache: bool = True) -> Any:
+        try:
+            return self.make_request(method="GET", endpoint=f"/tickets/{key}", cache=cache)
+        except Exception as e:
+            return e
+    
+    def _disable_ticket_id_filter(self, reason: str) -> None:
+        self.ticket_id_filter = False
+        if self.logger:
+            self.logger.warning(f"Batched ticket lookups fall back to parallel single requests: {reason}")
+    
+    def get_agent(self, agent_id: int, use_cache: bool = True) -> Optional[Dict[str, Any]]:
+        """Get an agent by ID through the entity cache; None if it does not exist"""
+        return self._get_entity("agent", f"/agent/{agent_id}", agent_id, use_cache)
+    
+    def get_user(self, user_id: int, use_cache: bool = True) -> Optional[Dict[str, Any]]:
+        """Get an end user by ID through the entity cache; None if it does not exist"""
+        return self._get_entity("user", f"/users/{user_id}", user_id, use_cache)
+    
+    def invalidate_entity(self, kind: str, entity_id: Optional[int] = None) -> int:
+        """Drop one cached agent/user, or every cached entity of that kind when entity_id is None"""
+        if entity_id is not None:
+            return int(self.entity_cache.invalidate((kind, str(entity_id))))
+        return self.entity_cache.invalidate_where(lambda key: key[0] == kind)
+    
+    def _get_entity(self, kind: str, endpoint: str, entity_id: int, use_cache: bool) -> Optional[Dict[str, Any]]:
+        def load():
+            try:
+                response = self.make_request(method="GET", endpoint=endpoint)
+            except HaloITSMAPIError as e:
+                if e.status_code == 404:
+                    return None
+                raise
+            if not response:
+                return None
+            # Handle both single entity and array response
+            return response[0] if isinstance(response, list) else response
+        
+        if not use_cache:
+            return load()
+        return self.entity_cache.get_or_load((kind, str(entity_id)), load, ttl=self.entity_cache_ttls.get(kind))
+    
     def create_ticket(self, ticket_data: Dict[str, Any]) -> Dict[str, Any]:
         """Create a new ticket"""
         if self.logger:
@@ -279,17 +812,118 @@ class HaloITSMAPI:
                 assistance="Ticket data must include an 'id' field to update"
             )
         
-        # HaloITSM uses POST for both create and update
+        # HaloITSM uses POST for both create and update. An update carries its id,
+        # so re-sending it after a timeout rewrites the same ticket rather than creating one
         response = self.make_request(
             method="POST",
             endpoint="/tickets",
-            json_data=[ticket_data]
+            json_data=[ticket_data],
+            idempotent=True
         )
         
         if isinstance(response, list) and len(response) > 0:
             return response[0]
         return response
     
+    def create_tickets(self, tickets: List[Dict[str, Any]], batch_size: int = DEFAULT_BATCH_SIZE) -> List[Dict[str, Any]]:
+        """
+        Create many tickets, posting up to batch_size per request
+
+        Returns one result per input, in input order:
+        {"index": i, "success": bool, "item": ticket dict or None, "error": str or None}.
+        A failed batch fails all of its tickets - creates are not re-sent one by
+        one because HaloITSM may already have stored part of the batch.
+        """
+        return self._post_batches("/tickets", tickets, batch_size)
+    
+    def update_tickets(self, tickets: List[Dict[str, Any]], batch_size: int = DEFAULT_BATCH_SIZE) -> List[Dict[str, Any]]:
+        """
+        Update many tickets, posting up to batch_size per request
+
+        Returns per-input results like create_tickets. Updates carry their id so
+        a batch HaloITSM rejects for its content (BATCH_REJECTION_STATUSES) is
+        safely re-sent ticket by ticket to find which ones failed. Any other
+        failure fails the batch's tickets as is - re-sending each one would
+        only repeat the timeout or outage once per ticket.
+        """
+        results = [None] * len(tickets)
+        valid = []
+        for index, ticket in enumerate(tickets):
+            if ticket.get("id") is None:
+                results[index] = self._batch_result(index, error="Ticket data must include an 'id' field to update")
+            else:
+                valid.append(index)
+        
+        for _, batch_indexes in self._batches(valid, batch_size):
+            batch = [tickets[index] for index in batch_indexes]
+            try:
+                response = self.make_request(method="POST", endpoint="/tickets", json_data=batch, idempotent=True)
+                batch_results = self._map_batch_response(0, batch, response, match_ids=True)
+            except PluginException as e:
+                if len(batch) == 1 or getattr(e, "status_code", None) not in BATCH_REJECTION_STATUSES:
+                    batch_results = self._batch_failure(0, len(batch), e)
+                else:
+                    if self.logger:
+                        self.logger.warning(f"Update batch of {len(batch)} tickets failed ({e.cause}), retrying individually")
+                    batch_results = [
+                        self.update_tickets([ticket], batch_size=1)[0] for ticket in batch
+                    ]
+            for index, result in zip(batch_indexes, batch_results):
+                result["index"] = index
+                results[index] = result
+        return results
+    
+    def _post_batches(self, endpoint: str, items: List[Dict[str, Any]], batch_size: int) -> List[Dict[str, Any]]:
+        """POST non-idempotent items in chunks; a failed chunk fails all of its items"""
+        results = []
+        for start, batch in self._batches(items, batch_size):
+            try:
+                response = self.make_request(method="POST", endpoint=endpoint, json_data=batch)
+            except PluginException as e:
+                results.extend(self._batch_failure(start, len(batch), e))
+                continue
+            results.extend(self._map_batch_response(start, batch, response))
+        return results
+    
+    @staticmethod
+    def _batches(items: List[Any], batch_size: int):
+        """Yield (start index, chunk) pairs of at most batch_size items"""
+        batch_size = max(1, int(batch_size or DEFAULT_BATCH_SIZE))
+        for start in range(0, len(items), batch_size):
+            yield start, items[start:start + batch_size]
+    
+    @staticmethod
+    def _batch_result(index: int, item: Optional[Dict[str, Any]] = None, error: Optional[str] = None) -> Dict[str, Any]:
+        return {"index": index, "success": error is None, "item": item, "error": error}
+    
+    def _batch_failure(self, start: int, count: int, error: PluginException) -> List[Dict[str, Any]]:
+        message = f"{error.cause}. {error.assistance}"
+        return [self._batch_result(start + offset, error=message) for offset in range(count)]
+    
+    def _map_batch_response(
+        self,
+        start: int,
+        batch: List[Dict[str, Any]],
+        response: Any,
+        match_ids: bool = False
+    ) -> List[Dict[str, Any]]:
+        """Pair each submitted ticket with its entry in the (same order) response array"""
+        returned = response if isinstance(response, list) else [response] if isinstance(response, dict) else []
+        by_id = {}
+        if match_ids:
+            by_id = {item.get("id"): item for item in returned if isinstance(item, dict)}
+        
+        results = []
+        for offset, ticket in enumerate(batch):
+            match = by_id.get(ticket.get("id")) if match_ids else None
+            if match is None and offset < len(returned) and len(returned) == len(batch):
+                match = returned[offset]
+            if isinstance(match, dict):
+                results.append(self._batch_result(start + offset, item=match))
+            else:
+                results.append(self._batch_result(start + offset, error="HaloITSM returned no result for this item"))
+        return results
+    
     def test_connection(self) -> bool:
         """Test API connectivity by fetching minimal ticket data"""
         response = self.make_request(
@@ -300,8 +934,10 @@ class HaloITSMAPI:
         # If we get here without exception, connection works
         return True
     
-    def search_tickets(self, filters: Dict[str, Any]) -> list:
-        """Search for tickets with filters"""
+    def search_tickets(self, filters: Dict[str, Any], fields: Optional[List[str]] = None) -> list:
+        """Search for tickets with filters; fields limits what HaloITSM sends (see get_ticket)"""
+        if fields:
+            filters = dict(filters or {}, **projection_params(fields))
         response = self.make_request(
             method="GET",
             endpoint="/tickets",
@@ -314,6 +950,180 @@ class HaloITSMAPI:
             return response
         return []
     
+    def get_tickets_page(
+        self,
+        filters: Optional[Dict[str, Any]],
+        page_no: int,
+        page_size: int = DEFAULT_PAGE_SIZE
+    ) -> Tuple[List[Dict[str, Any]], Optional[int]]:
+        """Fetch one page of /tickets, returning (tickets, record_count if reported)"""
+        params = self._page_params(filters, page_no, page_size)
+        response = self.make_request(method="GET", endpoint="/tickets", params=params)
+        
+        if isinstance(response, dict):
+            return response.get("tickets") or [], response.get("record_count")
+        if isinstance(response, list):
+            return response, None
+        return [], None
+    
+    def stream_tickets_page(
+        self,
+        filters: Optional[Dict[str, Any]],
+        page_no: int,
+        page_size: int = DEFAULT_PAGE_SIZE
+    ) -> JSONArrayStream:
+        """
+        Open one page of /tickets as a stream of tickets decoded as they arrive
+
+        record_count is available in the stream's meta once it is exhausted.
+        """
+        params = self._page_params(filters, page_no, page_size)
+        return self.make_request(method="GET", endpoint="/tickets", params=params, stream=True)
+    
+    @staticmethod
+    def _page_params(filters: Optional[Dict[str, Any]], page_no: int, page_size: int) -> Dict[str, Any]:
+        params = {key: value for key, value in (filters or {}).items() if key not in PAGING_PARAMS}
+        params.update({"pageinate": True, "page_size": page_size, "page_no": page_no})
+        return params
+    
+    def iter_tickets(
+        self,
+        filters: Optional[Dict[str, Any]] = None,
+        page_size: int = DEFAULT_PAGE_SIZE,
+        limit: Optional[int] = None,
+        normalize: bool = True,
+        prefetch: int = 0,
+        stream: bool = False,
+        fields: Optional[List[str]] = None
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Lazily page through /tickets, yielding one ticket at a time
+
+        Only the current page is held in memory, so arbitrarily large result
+        sets can be streamed. Stops after limit tickets (None for all), on a
+        short page, or once record_count has been reached.
+
+        With prefetch > 0 and a record_count on the first page, the remaining
+        pages are fetched concurrently, up to prefetch pages ahead of the
+        consumer; tickets still come out in page order.
+
+        With stream=True each page is decoded incrementally from the socket,
+        so memory stays at about one ticket even for huge pages (prefetch is
+        ignored).
+
+        fields projects normalized tickets onto those fields and lets HaloITSM
+        leave out details / custom fields that are not wanted.
+        """
+        page_size = max(1, int(page_size or DEFAULT_PAGE_SIZE))
+        if fields:
+            filters = dict(filters or {}, **projection_params(fields))
+        if stream:
+            tickets = self._iter_streamed_tickets(filters, page_size)
+        else:
+            tickets = (ticket for page in self._iter_ticket_pages(filters, page_size, limit, prefetch) for ticket in page)
+        
+        yielded = 0
+        try:
+            for ticket in tickets:
+                if limit is not None and yielded >= limit:
+                    return
+                yield project_ticket(self._normalize_ticket(ticket), fields) if normalize else ticket
+                yielded += 1
+                # Stop before the next page is requested
+                if limit is not None and yielded >= limit:
+                    return
+        finally:
+            tickets.close()
+    
+    def _iter_streamed_tickets(self, filters: Optional[Dict[str, Any]], page_size: int) -> Iterator[Dict[str, Any]]:
+        page_no = 1
+        previous_first_id = None
+        while True:
+            page = self.stream_tickets_page(filters, page_no, page_size)
+            count = 0
+            try:
+                for ticket in page:
+                    if count == 0:
+                        first_id = ticket.get("id") if isinstance(ticket, dict) else None
+                        if self._repeated_page(page_no, first_id, previous_first_id):
+                            return
+                        previous_first_id = first_id
+                    count += 1
+                    yield ticket
+            finally:
+                page.close()
+            
+            record_count = page.meta.get("record_count")
+            if count < page_size or (record_count is not None and page_no * page_size >= record_count):
+                return
+            page_no += 1
+    
+    def _iter_ticket_pages(
+        self,
+        filters: Optional[Dict[str, Any]],
+        page_size: int,
+        limit: Optional[int],
+        prefetch: int
+    ) -> Iterator[List[Dict[str, Any]]]:
+        tickets, record_count = self.get_tickets_page(filters, 1, page_size)
+        if not tickets:
+            return
+        
+        if prefetch and record_count is not None:
+            wanted = record_count if limit is None else min(record_count, limit)
+            last_page_no = -(-wanted // page_size)
+            previous_first_id = self._first_ticket_id(tickets)
+            yield tickets
+            tickets = None
+            pages = prefetch_pages(
+                lambda page_no: self.get_tickets_page(filters, page_no, page_size)[0],
+                2,
+                last_page_no,
+                window=prefetch
+            )
+            try:
+                for page_no, tickets in enumerate(pages, start=2):
+                    if not tickets:
+                        return
+                    first_id = self._first_ticket_id(tickets)
+                    if self._repeated_page(page_no, first_id, previous_first_id):
+                        return
+                    previous_first_id = first_id
+                    yield tickets
+            finally:
+                # Cancels the pages still queued once the guard stops early
+                pages.close()
+            return
+        
+        page_no = 1
+        previous_first_id = None
+        while tickets:
+            first_id = self._first_ticket_id(tickets)
+            if self._repeated_page(page_no, first_id, previous_first_id):
+                return
+            previous_first_id = first_id
+            
+            last_page = len(tickets) < page_size or (record_count is not None and page_no * page_size >= record_count)
+            yield tickets
+            if last_page:
+                return
+            page_no += 1
+            # Release the finished page before fetching the next one
+            tickets = None
+            tickets, record_count = self.get_tickets_page(filters, page_no, page_size)
+    
+    @staticmethod
+    def _first_ticket_id(tickets: List[Dict[str, Any]]) -> Any:
+        return tickets[0].get("id") if isinstance(tickets[0], dict) else None
+    
+    def _repeated_page(self, page_no: int, first_id: Any, previous_first_id: Any) -> bool:
+        # A server that ignores paging returns the same page forever
+        if page_no > 1 and first_id is not None and first_id == previous_first_id:
+            if self.logger:
+                self.logger.warning("HaloITSM returned the same page twice, stopping pagination")
+            return True
+        return False
+    
     def delete_ticket(self, ticket_id: int) -> bool:
         """Delete a ticket"""
         self.make_request(
@@ -334,6 +1144,15 @@ class HaloITSMAPI:
             return response[0]
         return response
     
+    def add_comments(self, notes: List[Dict[str, Any]], batch_size: int = DEFAULT_BATCH_SIZE) -> List[Dict[str, Any]]:
+        """
+        Add many notes, posting up to batch_size per request to /ticketnotes
+
+        Returns one result per note like create_tickets, with the created note as
+        "item". Notes are not idempotent, so a failed batch is not re-sent.
+        """
+        return self._post_batches("/ticketnotes", notes, batch_size)
+    
     def _normalize_ticket(self, ticket: Dict[str, Any]) -> Dict[str, Any]:
         """Normalize ticket data to consistent format"""
         if not ticket:
@@ -344,16 +1163,16 @@ class HaloITSMAPI:
                 "id": ticket.get("id"),
                 "summary": ticket.get("summary", ""),
                 "details": ticket.get("details", ""),
-                "status_name": self._get_nested_name(ticket.get("status")),
+                "status_name": self._reference_name("status", ticket.get("status"), ticket.get("status_id")),
                 "status_id": ticket.get("status_id"),
-                "priority_name": self._get_nested_name(ticket.get("priority")),
+                "priority_name": self._reference_name("priority", ticket.get("priority"), ticket.get("priority_id")),
                 "priority_id": ticket.get("priority_id"),
-                "ticket_type_name": self._get_nested_name(ticket.get("tickettype")),
+                "ticket_type_name": self._reference_name("ticket_type", ticket.get("tickettype"), ticket.get("tickettype_id")),
                 "ticket_type_id": ticket.get("tickettype_id"),
                 "agent_name": self._get_nested_name(ticket.get("agent")),
                 "agent_id": ticket.get("agent_id"),
                 "agent_email": self._get_nested_field(ticket.get("agent"), "emailaddress"),
-                "team_name": self._get_nested_name(ticket.get("team")),
+                "team_name": self._reference_name("team", ticket.get("team"), ticket.get("team_id")),
                 "team_id": ticket.get("team_id"),
                 "date_created": ticket.get("dateoccurred", ""),
                 "date_updated": ticket.get("dateupdated", ""),
@@ -391,6 +1210,13 @@ class HaloITSMAPI:
             return obj
         return ""
     
+    def _reference_name(self, kind: str, nested: Any, entity_id: Any) -> str:
+        """Name embedded in the ticket, else resolved from reference data when enabled"""
+        name = self._get_nested_name(nested)
+        if not name and self.reference_data is not None:
+            name = self.reference_data.name_for(kind, entity_id)
+        return name
+    
     def _get_nested_field(self, obj: Any, field: str) -> str:
         """Extract a specific field from nested object"""
         if isinstance(obj, dict):
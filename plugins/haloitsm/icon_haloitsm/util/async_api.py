@@ -0,0 +1,393 @@
+import asyncio
+import time
+import aiohttp
+from typing import Dict, Any, Optional, List
+from insightconnect_plugin_runtime.exceptions import PluginException
+from icon_haloitsm.util.api import HaloITSMAPI
+from icon_haloitsm.util.rate_limiter import parse_retry_after
+from icon_haloitsm.util.reference_data import ReferenceData
+from icon_haloitsm.util.retry import RetryPolicy, CONNECT_ERROR, TIMEOUT, CONNECTION_ERROR
+from icon_haloitsm.util import json_codec
+
+# Upper bound on requests in flight at once from a single client
+DEFAULT_MAX_CONCURRENCY = 100
+
+
+class AsyncHaloITSMAPI:
+    """
+    asyncio twin of HaloITSMAPI
+
+    Exposes the same surface as the sync client as coroutines. Retries wait with
+    asyncio.sleep instead of parking a thread, and a semaphore bounds how many
+    requests a single client keeps in flight at once.
+    """
+
+    def __init__(
+        self,
+        client_id: str,
+        client_secret: str,
+        auth_server: str,
+        resource_server: str,
+        tenant: str,
+        ssl_verify: bool = True,
+        logger=None,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        retry_policy: Optional[RetryPolicy] = None,
+        reference_data: Optional[ReferenceData] = None
+    ):
+        self.client_id = client_id
+        self.client_secret = client_secret
+        # Safe rstrip - check for None first
+        self.auth_server = auth_server.rstrip('/') if auth_server else ""
+        self.resource_server = resource_server.rstrip('/') if resource_server else ""
+        self.tenant = tenant
+        self.ssl_verify = ssl_verify
+        self.logger = logger
+
+        self.access_token = None
+        self.token_expires_at = 0
+        # Single-flight refresh: one /token request at a time, bumped per new token
+        self._token_lock = None
+        self._token_generation = 0
+
+        self.retry_policy = retry_policy if retry_policy is not None else RetryPolicy()
+        # Tables shared with a sync client (e.g. HaloITSMAPI.reference_data). Lookups
+        # never load them on the event loop - see load_reference_data
+        self.reference_data = reference_data
+
+        self.max_concurrency = max_concurrency
+        self._semaphore = None
+        self._session = None
+
+        # Validate that required fields are not empty
+        if not self.auth_server:
+            raise PluginException(
+                cause="Invalid authorization server",
+                assistance="Authorization server URL cannot be empty"
+            )
+        if not self.resource_server:
+            raise PluginException(
+                cause="Invalid resource server",
+                assistance="Resource server URL cannot be empty"
+            )
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        await self.close()
+
+    def _ensure_primitives(self) -> None:
+        """Create asyncio primitives lazily so they bind to the running loop"""
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+            self._token_lock = asyncio.Lock()
+
+    def _get_session(self) -> aiohttp.ClientSession:
+        """Create the pooled session lazily so it binds to the running loop"""
+        if self._session is None or self._session.closed:
+            connector = aiohttp.TCPConnector(
+                limit=self.max_concurrency,
+                ssl=None if self.ssl_verify else False
+            )
+            self._session = aiohttp.ClientSession(connector=connector)
+        return self._session
+
+    async def close(self) -> None:
+        """Release pooled connections held by this client"""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+
+    async def load_reference_data(self) -> bool:
+        """Load or refresh the reference data tables in a worker thread; False if unavailable"""
+        if self.reference_data is None:
+            return False
+        return await asyncio.get_running_loop().run_in_executor(None, self.reference_data.ensure_loaded)
+
+    async def get_access_token(self) -> str:
+        """
+        Get OAuth2 access token, refreshing if necessary
+        """
+        return (await self._get_token())[0]
+
+    def _cached_token(self) -> Optional[tuple]:
+        """Return (token, generation) if the cached token is still valid (with 60 second buffer)"""
+        if self.access_token and time.time() < (self.token_expires_at - 60):
+            return self.access_token, self._token_generation
+        return None
+
+    async def _get_token(self) -> tuple:
+        """Get (token, generation), refreshing at most once across concurrent tasks"""
+        cached = self._cached_token()
+        if cached:
+            return cached
+
+        self._ensure_primitives()
+        async with self._token_lock:
+            cached = self._cached_token()
+            if cached:
+                return cached
+            token = await self._request_token()
+            return token, self._token_generation
+
+    def _invalidate_token(self, generation: int) -> None:
+        """Drop the cached token only if it is still the generation that failed"""
+        if self._token_generation == generation:
+            self.access_token = None
+
+    async def _request_token(self) -> str:
+        """
+        Request a new OAuth2 token from the authorization server
+        """
+        current_time = time.time()
+        token_url = f"{self.auth_server}/token"
+        payload = {
+            "grant_type": "client_credentials",
+            "client_id": self.client_id,
+            "client_secret": self.client_secret,
+            "scope": "all"
+        }
+
+        try:
+            if self.logger:
+                self.logger.info(f"Requesting OAuth token from: {token_url}")
+
+            async with self._get_session().post(
+                token_url,
+                data=payload,
+                timeout=aiohttp.ClientTimeout(total=15, connect=5)
+            ) as response:
+                if self.logger:
+                    self.logger.info(f"OAuth response received: status={response.status}")
+                if response.status >= 400:
+                    response_text = await response.text()
+                    if self.logger:
+                        self.logger.error(f"OAuth request failed with HTTP {response.status}")
+                        self.logger.error(f"Response: {response_text}")
+                    raise PluginException(
+                        cause=f"OAuth authentication failed with HTTP {response.status}",
+                        assistance=f"Check your client credentials. Server response: {response_text[:200]}"
+                    )
+                token_data = await response.json(content_type=None)
+
+            expires_in = token_data.get("expires_in", 3600)
+            self.token_expires_at = current_time + expires_in
+            self.access_token = token_data.get("access_token")
+            self._token_generation += 1
+
+            if self.logger:
+                self.logger.info(f"OAuth2 token obtained, expires in {expires_in} seconds")
+
+            return self.access_token
+
+        except asyncio.TimeoutError:
+            raise PluginException(
+                cause="OAuth token request timed out",
+                assistance=f"The authorization server did not respond within 15 seconds. Check network connectivity and server URL: {token_url}"
+            )
+        except aiohttp.ClientError as e:
+            if self.logger:
+                self.logger.error(f"OAuth token request failed: {type(e).__name__}: {str(e)}")
+            raise PluginException(
+                cause="Failed to obtain OAuth2 token",
+                assistance=f"Check your client credentials and authorization server URL. Error: {type(e).__name__}: {str(e)}"
+            )
+
+    @staticmethod
+    def _encode_params(params: Optional[Dict[str, Any]]) -> Optional[Dict[str, str]]:
+        """aiohttp rejects bool/None query values - encode them like requests does"""
+        if not params:
+            return params
+        encoded = {}
+        for key, value in params.items():
+            if value is None:
+                continue
+            encoded[key] = str(value).lower() if isinstance(value, bool) else str(value)
+        return encoded
+
+    async def make_request(
+        self,
+        method: str,
+        endpoint: str,
+        params: Optional[Dict[str, Any]] = None,
+        json_data: Optional[Any] = None,
+        retry_count: int = 3,
+        timeout: int = 30,
+        idempotent: Optional[bool] = None
+    ) -> Any:
+        """
+        Make an authenticated request to HaloITSM API
+        """
+        url = f"{self.resource_server}{endpoint}"
+        query = self._encode_params(params)
+        body = json_codec.dumps(json_data) if json_data is not None else None
+        self._ensure_primitives()
+
+        if self.logger:
+            self.logger.info(f"Making {method} request to {url}")
+
+        policy = self.retry_policy
+        if idempotent is None:
+            idempotent = policy.is_idempotent(method)
+        policy.budget.record_request()
+
+        for attempt in range(retry_count):
+            last_attempt = attempt == retry_count - 1
+            retry_after = None
+            try:
+                token, generation = await self._get_token()
+                headers = {
+                    "Authorization": f"Bearer {token}",
+                    "Content-Type": "application/json"
+                }
+
+                # Only hold a concurrency slot while the request is on the wire
+                async with self._semaphore:
+                    async with self._get_session().request(
+                        method,
+                        url,
+                        headers=headers,
+                        params=query,
+                        data=body,
+                        timeout=aiohttp.ClientTimeout(total=timeout)
+                    ) as response:
+                        status = response.status
+                        content = await response.read()
+                        if status in (429, 503):
+                            retry_after = parse_retry_after(response.headers.get("Retry-After"))
+
+                # Handle 401 - token may have expired
+                if status == 401 and not last_attempt:
+                    if self.logger:
+                        self.logger.info("Token expired, refreshing...")
+                    # Only invalidate the token this request used - another task may already have refreshed it
+                    self._invalidate_token(generation)
+                    continue
+
+                if status >= 400:
+                    if self.logger:
+                        self.logger.warning(f"HTTP error on attempt {attempt + 1}/{retry_count}: {status}")
+                    if last_attempt or not policy.should_retry(idempotent, status=status):
+                        text = content.decode("utf-8", "replace")
+                        raise PluginException(
+                            cause=f"HaloITSM API error {status}",
+                            assistance=f"The API request failed. Error: {text[:500]}",
+                            data=text[:1000]
+                        )
+                else:
+                    # Return JSON if available, otherwise return text
+                    try:
+                        return json_codec.loads(content)
+                    except ValueError:
+                        return content.decode("utf-8", "replace")
+
+            except PluginException:
+                raise
+            except asyncio.TimeoutError as e:
+                if self.logger:
+                    self.logger.warning(f"Request timeout on attempt {attempt + 1}/{retry_count}")
+                if last_attempt or not policy.should_retry(idempotent, error=TIMEOUT):
+                    raise PluginException(
+                        cause="Request timeout",
+                        assistance=f"HaloITSM API did not respond within {timeout} seconds. Check network connectivity and server URL.",
+                        data=str(e)
+                    )
+            except aiohttp.ClientError as e:
+                if self.logger:
+                    self.logger.warning(f"Request error on attempt {attempt + 1}/{retry_count}: {str(e)}")
+                # A connector error means the request never reached HaloITSM
+                error = CONNECT_ERROR if isinstance(e, aiohttp.ClientConnectorError) else CONNECTION_ERROR
+                if last_attempt or not policy.should_retry(idempotent, error=error):
+                    raise PluginException(
+                        cause="Request failed",
+                        assistance=f"Unable to connect to HaloITSM API: {str(e)}",
+                        data=str(e)
+                    )
+
+            # Wait before retry (jittered backoff, or longer if HaloITSM asked) without blocking the event loop
+            await asyncio.sleep(max(policy.backoff(attempt), retry_after or 0))
+
+    async def get_ticket(self, ticket_id: int) -> Dict[str, Any]:
+        """Get a specific ticket by ID"""
+        return await self.make_request(
+            method="GET",
+            endpoint=f"/tickets/{ticket_id}"
+        )
+
+    async def get_tickets(self, ticket_ids: List[int]) -> List[Dict[str, Any]]:
+        """Fetch several tickets concurrently, in the order requested"""
+        return await asyncio.gather(*(self.get_ticket(ticket_id) for ticket_id in ticket_ids))
+
+    async def create_ticket(self, ticket_data: Dict[str, Any]) -> Dict[str, Any]:
+        """Create a new ticket"""
+        # HaloITSM expects an array of tickets
+        response = await self.make_request(
+            method="POST",
+            endpoint="/tickets",
+            json_data=[ticket_data]
+        )
+
+        # Return first ticket from response
+        if isinstance(response, list) and len(response) > 0:
+            return response[0]
+        return response
+
+    async def update_ticket(self, ticket_data: Dict[str, Any]) -> Dict[str, Any]:
+        """Update an existing ticket"""
+        # Ensure ticket has an ID
+        if "id" not in ticket_data:
+            raise PluginException(
+                cause="Ticket ID missing",
+                assistance="Ticket data must include an 'id' field to update"
+            )
+
+        # HaloITSM uses POST for both create and update; an update carries its id so it is safe to re-send
+        response = await self.make_request(
+            method="POST",
+            endpoint="/tickets",
+            json_data=[ticket_data],
+            idempotent=True
+        )
+
+        if isinstance(response, list) and len(response) > 0:
+            return response[0]
+        return response
+
+    async def search_tickets(self, filters: Dict[str, Any]) -> list:
+        """Search for tickets with filters"""
+        response = await self.make_request(
+            method="GET",
+            endpoint="/tickets",
+            params=filters
+        )
+
+        if isinstance(response, dict) and "tickets" in response:
+            return response["tickets"]
+        elif isinstance(response, list):
+            return response
+        return []
+
+    async def add_comment(self, note_data: Dict[str, Any]) -> Dict[str, Any]:
+        """Add a comment/note to a ticket"""
+        response = await self.make_request(
+            method="POST",
+            endpoint="/ticketnotes",
+            json_data=[note_data]
+        )
+
+        if isinstance(response, list) and len(response) > 0:
+            return response[0]
+        return response
+
+    # Normalization is shared with the sync client
+    _normalize_ticket = HaloITSMAPI._normalize_ticket
+    _get_nested_name = HaloITSMAPI._get_nested_name
+    _get_nested_field = HaloITSMAPI._get_nested_field
+
+    def _reference_name(self, kind: str, nested: Any, entity_id: Any) -> str:
+        """Name embedded in the ticket, else from reference data already loaded"""
+        name = self._get_nested_name(nested)
+        if not name and self.reference_data is not None:
+            name = self.reference_data.name_for(kind, entity_id, load=False)
+        return name
@@ -0,0 +1,111 @@
+import threading
+from concurrent.futures import Future
+from typing import Any, Callable, Dict, Hashable, List
+
+# Seconds calls are collected before one batch request is sent
+DEFAULT_BATCH_WINDOW = 0.005
+DEFAULT_MAX_BATCH_SIZE = 50
+
+
+class BatchLoader:
+    """
+    DataLoader-style micro-batching of single-key lookups
+
+    load(key) calls made within `window` seconds of each other are collected
+    and handed to batch_fn(keys) in one go; each caller then receives the
+    value (or exception) for its own key. A batch is sent early once it holds
+    max_batch_size keys, and the same key requested twice in one window is
+    fetched once.
+
+    batch_fn returns a dict mapping each key to its value or to an Exception
+    instance for that key; keys missing from the dict fail with KeyError.
+    """
+
+    def __init__(
+        self,
+        batch_fn: Callable[[List[Hashable]], Dict[Hashable, Any]],
+        window: float = DEFAULT_BATCH_WINDOW,
+        max_batch_size: int = DEFAULT_MAX_BATCH_SIZE,
+        name: str = "haloitsm-batch-loader"
+    ):
+        self.batch_fn = batch_fn
+        self.window = window
+        self.max_batch_size = max(1, int(max_batch_size))
+        self.name = name
+
+        self._lock = threading.Lock()
+        self._pending = {}
+        self._timer = None
+
+        self.loads = 0
+        self.batches = 0
+        self.keys_loaded = 0
+
+    def load(self, key: Hashable, timeout: float = None) -> Any:
+        """Value for key, fetched together with other keys requested in the same window"""
+        return self.submit(key).result(timeout)
+
+    def load_many(self, keys: List[Hashable], timeout: float = None) -> List[Any]:
+        futures = [self.submit(key) for key in keys]
+        return [future.result(timeout) for future in futures]
+
+    def submit(self, key: Hashable) -> Future:
+        flush_now = None
+        with self._lock:
+            self.loads += 1
+            future = self._pending.get(key)
+            if future is None:
+                future = self._pending[key] = Future()
+            if len(self._pending) >= self.max_batch_size:
+                flush_now = self._take_pending()
+            elif self._timer is None:
+                self._timer = threading.Timer(self.window, self.flush)
+                self._timer.name = self.name
+                self._timer.daemon = True
+                self._timer.start()
+        if flush_now:
+            self._dispatch(flush_now)
+        return future
+
+    def flush(self) -> None:
+        """Send whatever is pending now instead of waiting for the window"""
+        with self._lock:
+            batch = self._take_pending()
+        if batch:
+            self._dispatch(batch)
+
+    def _take_pending(self) -> Dict[Hashable, Future]:
+        # Caller holds the lock
+        batch, self._pending = self._pending, {}
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        return batch
+
+    def _dispatch(self, batch: Dict[Hashable, Future]) -> None:
+        with self._lock:
+            self.batches += 1
+            self.keys_loaded += len(batch)
+        try:
+            results = self.batch_fn(list(batch))
+        except BaseException as e:
+            for future in batch.values():
+                future.set_exception(e)
+            return
+        for key, future in batch.items():
+            if key not in results:
+                future.set_exception(KeyError(key))
+            elif isinstance(results[key], BaseException):
+                future.set_exception(results[key])
+            else:
+                future.set_result(results[key])
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "loads": self.loads,
+                "batches": self.batches,
+                "keys_loaded": self.keys_loaded,
+                "average_batch_size": self.keys_loaded / self.batches if self.batches else 0.0,
+                "pending": len(self._pending)
+            }
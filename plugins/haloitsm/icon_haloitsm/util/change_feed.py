@@ -0,0 +1,303 @@
+import queue
+import threading
+from typing import Any, Dict, Iterable, Iterator, NamedTuple, Optional
+from insightconnect_plugin_runtime.exceptions import PluginException
+from icon_haloitsm.util.poller import DEFAULT_POLL_INTERVAL, TicketPoller
+from icon_haloitsm.util.snapshot_store import SnapshotStore, TicketSnapshot, snapshot_of
+
+# The feed never polls more often than this, however small a subscriber's interval
+MIN_POLL_INTERVAL = 10
+# /tickets list filters a subscriber's pushdown can use, by raw ticket field
+PUSHDOWN_PARAMS = {
+    "id": "ticketids",
+    "tickettype_id": "requesttype",
+    "status_id": "status",
+    "priority_id": "priority"
+}
+# Longer value lists are filtered locally rather than sent in the URL
+MAX_PUSHDOWN_VALUES = 100
+
+_CLOSED = object()
+
+
+class TicketChange(NamedTuple):
+    """One changed ticket as delivered to subscribers"""
+    ticket: Dict[str, Any]
+    created: bool
+    # Snapshot from before this change, None the first time the ticket is seen
+    previous: Optional[TicketSnapshot]
+    current: TicketSnapshot
+
+
+class Subscription:
+    """
+    One subscriber's view of a ChangeFeed
+
+    Iterating yields a TicketChange for every change polled while the
+    subscription is open, blocking between polls, until close() is called.
+    Asking for the next change acknowledges the previous one; reject() hands
+    it back instead, and the feed offers it again with its next poll. The feed
+    waits for every subscriber to settle a change before delivering the next,
+    so at most one change is in flight per subscriber and a slow subscriber
+    slows the feed down rather than queueing up changes. Tickets are shared
+    with the other subscribers and must be treated as read-only.
+    """
+
+    def __init__(self, feed: "ChangeFeed", interval: float, pushdown: Optional[Dict[str, Iterable[Any]]] = None):
+        self.feed = feed
+        self.interval = interval
+        # Ticket field -> values; the subscriber drops every other ticket anyway
+        self.pushdown = {
+            field: frozenset(values) for field, values in (pushdown or {}).items()
+            if field in PUSHDOWN_PARAMS and values
+        }
+        self.delivered = 0
+        self.rejected = 0
+        # One change in flight plus the close marker
+        self._queue = queue.Queue(maxsize=2)
+        self._settled = threading.Condition()
+        self._pending = False
+        self._failed = False
+        self._closed = False
+
+    def deliver(self, change: TicketChange) -> bool:
+        """Hand a change to the subscriber; False if the subscription is closed"""
+        with self._settled:
+            if self._closed:
+                return False
+            self.delivered += 1
+            self._pending = True
+            self._failed = False
+            self._queue.put(change)
+        return True
+
+    def wait(self) -> bool:
+        """Block until the delivered change is settled; True if it was acknowledged"""
+        with self._settled:
+            self._settled.wait_for(lambda: not self._pending or self._closed)
+            return not self._pending and not self._failed
+
+    def reject(self) -> None:
+        """Hand the current change back to the feed, to be offered again with the next poll"""
+        with self._settled:
+            if self._pending:
+                self.rejected += 1
+                self._pending = False
+                self._failed = True
+                self._settled.notify_all()
+
+    def _acknowledge(self) -> None:
+        with self._settled:
+            if self._pending:
+                self._pending = False
+                self._settled.notify_all()
+
+    def __iter__(self) -> Iterator[TicketChange]:
+        while True:
+            item = self._queue.get()
+            if item is _CLOSED:
+                return
+            yield item
+            self._acknowledge()
+
+    def close(self) -> None:
+        """Stop receiving changes and end the iteration (safe to call more than once)"""
+        with self._settled:
+            if self._closed:
+                return
+            # A change still in flight counts as not delivered
+            self._closed = True
+            self._settled.notify_all()
+        self.feed.unsubscribe(self)
+        self._queue.put(_CLOSED)
+
+
+class ChangeFeed:
+    """
+    One poller per connection, fanned out to every subscribed trigger
+
+    A background thread polls /tickets through a single TicketPoller and
+    hands each change to every open Subscription, which applies its own
+    filters locally; filters all subscribers share are also pushed into the
+    /tickets query (see query_filters), so narrowly filtered triggers do not
+    transfer tickets nobody wants. Each change carries the ticket's previous
+    snapshot from the SnapshotStore, so status and assignment changes are
+    known without asking HaloITSM for history. The snapshot and the poller's
+    watermark only move past a change once every subscriber has acknowledged
+    it, so a rejected or unfinished change is polled and offered again:
+    delivery is at least once, and subscribers that did handle it may see it
+    twice. The request rate to HaloITSM depends only on the smallest
+    subscriber interval (never below MIN_POLL_INTERVAL), not on how many
+    triggers or filter combinations are running. The thread starts with the
+    first subscription and stops with the last one; with background=False the
+    caller drives poll_once() instead.
+    """
+
+    def __init__(
+        self,
+        poller: TicketPoller,
+        snapshots: Optional[SnapshotStore] = None,
+        min_interval: float = MIN_POLL_INTERVAL,
+        background: bool = True,
+        seed: bool = True,
+        logger=None
+    ):
+        self.poller = poller
+        self.snapshots = snapshots if snapshots is not None else SnapshotStore()
+        self.min_interval = min_interval
+        self.background = background
+        self.logger = logger
+        # Seed an empty snapshot store before the first poll
+        self._unseeded = seed
+        self._subscriptions = []
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread = None
+
+        self.polls = 0
+        self.failures = 0
+
+    def subscribe(self, interval: Optional[float] = None, pushdown: Optional[Dict[str, Iterable[Any]]] = None) -> Subscription:
+        """
+        Open a subscription and make sure the feed is polling
+
+        pushdown maps ticket fields (keys of PUSHDOWN_PARAMS) to the values the
+        subscriber accepts. Only pass fields whose other values the subscriber
+        never needs to see - e.g. not the status for a status-change trigger,
+        which must observe a ticket before it enters the wanted status.
+        """
+        subscription = Subscription(self, interval or DEFAULT_POLL_INTERVAL, pushdown)
+        with self._lock:
+            self._subscriptions.append(subscription)
+            self._stop.clear()
+            if self.background and self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="haloitsm-change-feed", daemon=True)
+                self._thread.start()
+        return subscription
+
+    def unsubscribe(self, subscription: Subscription) -> None:
+        with self._lock:
+            if subscription in self._subscriptions:
+                self._subscriptions.remove(subscription)
+            if not self._subscriptions:
+                self._stop.set()
+
+    def interval(self) -> float:
+        """Seconds until the next poll - the smallest subscriber interval, bounded below"""
+        with self._lock:
+            wanted = min((subscription.interval for subscription in self._subscriptions), default=DEFAULT_POLL_INTERVAL)
+        return max(self.min_interval, wanted)
+
+    def query_filters(self) -> Dict[str, str]:
+        with self._lock:
+            subscriptions = list(self._subscriptions)
+        return self._pushdown_filters(subscriptions)
+
+    @staticmethod
+    def _pushdown_filters(subscriptions) -> Dict[str, str]:
+        """
+        /tickets filters that keep every open subscription's tickets
+
+        A field is pushed down only when every subscriber restricts it, as the
+        union of their values - a subscriber without a restriction needs all
+        values. The result matches a superset of what each subscriber wants;
+        subscribers still filter locally, also in case HaloITSM ignores one.
+        """
+        filters = {}
+        if not subscriptions:
+            return filters
+        for field, param in PUSHDOWN_PARAMS.items():
+            if not all(field in subscription.pushdown for subscription in subscriptions):
+                continue
+            values = set().union(*(subscription.pushdown[field] for subscription in subscriptions))
+            if len(values) <= MAX_PUSHDOWN_VALUES:
+                filters[param] = ",".join(sorted(str(value) for value in values))
+        return filters
+
+    def seed(self) -> int:
+        """
+        Snapshot every ticket outside the poll window into an empty store
+
+        Without a snapshot a ticket's first change has no previous state, so
+        e.g. its first status change after deployment could not be reported.
+        A store that already holds snapshots is left alone. Returns the number
+        of tickets stored.
+        """
+        if len(self.snapshots):
+            return 0
+        seeded = 0
+
+        def snapshots():
+            nonlocal seeded
+            for ticket in self.poller.settled_tickets():
+                seeded += 1
+                yield ticket["id"], snapshot_of(ticket)
+
+        self.snapshots.put_many(snapshots())
+        self.snapshots.commit()
+        if self.logger:
+            self.logger.info(f"ChangeFeed: Stored the snapshots of {seeded} existing tickets")
+        return seeded
+
+    def poll_once(self) -> int:
+        """Poll HaloITSM once and deliver every change to the open subscriptions"""
+        if self._unseeded:
+            self.seed()
+            self._unseeded = False
+        with self._lock:
+            subscriptions = list(self._subscriptions)
+        filters = self._pushdown_filters(subscriptions)
+
+        def dispatch(ticket, created):
+            current = snapshot_of(ticket)
+            change = TicketChange(ticket, created, self.snapshots.get(ticket["id"]), current)
+            delivered = [subscription for subscription in subscriptions if subscription.deliver(change)]
+            failed = [subscription for subscription in delivered if not subscription.wait()]
+            if failed:
+                # Stops the poll before the watermark passes this change
+                raise PluginException(
+                    cause=f"Ticket {ticket['id']} change was not handled by {len(failed)} trigger(s)",
+                    assistance="The change is offered again with the next poll"
+                )
+            self.snapshots.put(ticket["id"], current)
+
+        try:
+            return self.poller.poll(dispatch, filters)
+        finally:
+            self.snapshots.commit()
+
+    def _run(self) -> None:
+        while True:
+            with self._lock:
+                if not self._subscriptions:
+                    # Decided under the lock, so a concurrent subscribe starts a new thread
+                    self._thread = None
+                    return
+            try:
+                self.polls += 1
+                self.poll_once()
+            except Exception as e:
+                self.failures += 1
+                if self.logger:
+                    self.logger.error(f"ChangeFeed: Poll failed: {type(e).__name__}: {str(e)}")
+            self._stop.wait(self.interval())
+
+    def close(self) -> None:
+        """Stop polling and end every open subscription"""
+        with self._lock:
+            subscriptions = list(self._subscriptions)
+        for subscription in subscriptions:
+            subscription.close()
+        self._stop.set()
+        thread = self._thread
+        if thread is not None and thread is not threading.current_thread():
+            thread.join(timeout=5)
+        self.snapshots.close()
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            subscribers = len(self._subscriptions)
+        stats = {"subscribers": subscribers, "polls": self.polls, "failures": self.failures}
+        stats.update(self.poller.stats())
+        stats["snapshots"] = self.snapshots.stats()
+        return stats
@@ -0,0 +1,203 @@
+import threading
+import time
+from typing import Dict, Any, Optional
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+# Consecutive failures that open a circuit
+DEFAULT_FAILURE_THRESHOLD = 5
+# Seconds an open circuit fails fast before letting a probe through
+DEFAULT_RECOVERY_TIMEOUT = 30.0
+
+_registry = {}
+_registry_lock = threading.Lock()
+
+
+def endpoint_group(endpoint: str) -> str:
+    """Group an API path by its first segment, e.g. /tickets/12 -> tickets"""
+    segment = endpoint.strip("/").split("/", 1)[0].split("?", 1)[0]
+    return segment.lower() or "root"
+
+
+class CircuitBreaker:
+    """
+    Closed / open / half-open breaker for one endpoint group
+
+    Closed: requests flow and consecutive failures are counted. Once they reach
+    failure_threshold the circuit opens and every request fails fast for
+    recovery_timeout seconds. After that a single probe is let through
+    (half-open); success closes the circuit, failure opens it again.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        failure_threshold: int = DEFAULT_FAILURE_THRESHOLD,
+        recovery_timeout: float = DEFAULT_RECOVERY_TIMEOUT,
+        logger=None
+    ):
+        self.name = name
+        self.failure_threshold = max(1, int(failure_threshold))
+        self.recovery_timeout = float(recovery_timeout)
+        self.logger = logger
+
+        self._lock = threading.Lock()
+        self._state = CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._probe_in_flight = False
+
+        self.opened = 0
+        self.rejected = 0
+        self.total_failures = 0
+        self.total_successes = 0
+        self.last_error = None
+
+    @property
+    def state(self) -> str:
+        with self._lock:
+            return self._state
+
+    def retry_in(self) -> float:
+        """Seconds until an open circuit lets a probe through"""
+        with self._lock:
+            if self._state != OPEN:
+                return 0.0
+            return max(0.0, self._opened_at + self.recovery_timeout - time.monotonic())
+
+    def allow_request(self) -> bool:
+        """Whether a request may be sent now; claims the probe slot when half-open"""
+        with self._lock:
+            if self._state == OPEN and time.monotonic() - self._opened_at >= self.recovery_timeout:
+                self._transition(HALF_OPEN)
+            if self._state == CLOSED:
+                return True
+            if self._state == HALF_OPEN and not self._probe_in_flight:
+                self._probe_in_flight = True
+                return True
+            self.rejected += 1
+            return False
+
+    def record_success(self) -> None:
+        with self._lock:
+            self.total_successes += 1
+            self._failures = 0
+            self._probe_in_flight = False
+            if self._state != CLOSED:
+                self._transition(CLOSED)
+
+    def record_failure(self, error: Optional[str] = None) -> None:
+        with self._lock:
+            self.total_failures += 1
+            self.last_error = error
+            self._failures += 1
+            if self._state == HALF_OPEN:
+                self._probe_in_flight = False
+                self._open()
+            elif self._state == CLOSED and self._failures >= self.failure_threshold:
+                self._open()
+
+    def release(self) -> None:
+        """Give back a probe slot when the request outcome says nothing about server health"""
+        with self._lock:
+            self._probe_in_flight = False
+
+    def _open(self) -> None:
+        self._opened_at = time.monotonic()
+        self.opened += 1
+        self._transition(OPEN)
+
+    def _transition(self, state: str) -> None:
+        previous, self._state = self._state, state
+        if self.logger and previous != state:
+            message = f"HaloITSM circuit '{self.name}' {previous} -> {state}"
+            if state == OPEN:
+                self.logger.warning(
+                    f"{message} after {self._failures} consecutive failures "
+                    f"(last error: {self.last_error}); failing fast for {self.recovery_timeout:.0f} seconds"
+                )
+            else:
+                self.logger.info(message)
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "state": self._state,
+                "consecutive_failures": self._failures,
+                "opened": self.opened,
+                "rejected": self.rejected,
+                "failures": self.total_failures,
+                "successes": self.total_successes,
+                "last_error": self.last_error
+            }
+
+
+class CircuitBreakers:
+    """
+    The per endpoint group breakers of one HaloITSM tenant
+
+    overrides maps a group name (see endpoint_group) to its own
+    failure_threshold / recovery_timeout; other groups use the defaults.
+    """
+
+    def __init__(
+        self,
+        failure_threshold: int = DEFAULT_FAILURE_THRESHOLD,
+        recovery_timeout: float = DEFAULT_RECOVERY_TIMEOUT,
+        overrides: Optional[Dict[str, Dict[str, float]]] = None,
+        logger=None
+    ):
+        self.logger = logger
+        self._breakers = {}
+        self._lock = threading.Lock()
+        self.configure(failure_threshold, recovery_timeout, overrides)
+
+    @classmethod
+    def for_tenant(cls, tenant: str, **config) -> "CircuitBreakers":
+        """Return the breakers shared by every client of this tenant in the process"""
+        with _registry_lock:
+            breakers = _registry.get(tenant)
+            if breakers is None:
+                breakers = cls(**config)
+                _registry[tenant] = breakers
+            else:
+                breakers.configure(
+                    config.get("failure_threshold", DEFAULT_FAILURE_THRESHOLD),
+                    config.get("recovery_timeout", DEFAULT_RECOVERY_TIMEOUT),
+                    config.get("overrides")
+                )
+            return breakers
+
+    def configure(self, failure_threshold=DEFAULT_FAILURE_THRESHOLD, recovery_timeout=DEFAULT_RECOVERY_TIMEOUT, overrides=None) -> None:
+        """Apply settings to existing and future breakers without resetting their state"""
+        with self._lock:
+            self.failure_threshold = failure_threshold or DEFAULT_FAILURE_THRESHOLD
+            self.recovery_timeout = recovery_timeout or DEFAULT_RECOVERY_TIMEOUT
+            self.overrides = dict(overrides or {})
+            for name, breaker in self._breakers.items():
+                settings = self._settings(name)
+                breaker.failure_threshold = max(1, int(settings["failure_threshold"]))
+                breaker.recovery_timeout = float(settings["recovery_timeout"])
+
+    def _settings(self, group: str) -> Dict[str, float]:
+        settings = {"failure_threshold": self.failure_threshold, "recovery_timeout": self.recovery_timeout}
+        settings.update(self.overrides.get(group, {}))
+        return settings
+
+    def get(self, group: str) -> CircuitBreaker:
+        with self._lock:
+            breaker = self._breakers.get(group)
+            if breaker is None:
+                breaker = CircuitBreaker(group, logger=self.logger, **self._settings(group))
+                self._breakers[group] = breaker
+            return breaker
+
+    def for_endpoint(self, endpoint: str) -> CircuitBreaker:
+        return self.get(endpoint_group(endpoint))
+
+    def stats(self) -> Dict[str, Dict[str, Any]]:
+        with self._lock:
+            breakers = list(self._breakers.items())
+        return {name: breaker.stats() for name, breaker in breakers}
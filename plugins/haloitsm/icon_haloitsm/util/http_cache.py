@@ -0,0 +1,165 @@
+import hashlib
+import re
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, Optional
+from icon_haloitsm.util import json_codec
+
+DEFAULT_MAX_ENTRIES = 256
+# Larger bodies (e.g. full /tickets pages) are not kept
+DEFAULT_MAX_ENTRY_BYTES = 256 * 1024
+
+_DATEUPDATED = re.compile(rb'"dateupdated"\s*:\s*"([^"]*)"')
+
+
+def request_key(method: str, endpoint: str, params: Optional[Dict[str, Any]] = None) -> Hashable:
+    """Canonical key of a request - the same query in any parameter order maps to the same key"""
+    canonical = tuple(sorted((str(key), str(value)) for key, value in (params or {}).items() if value is not None))
+    return method.upper(), endpoint, canonical
+
+
+def body_fingerprint(content: bytes) -> str:
+    """
+    Cheap change marker of a response body, compared without parsing it
+
+    A single "dateupdated" value identifies the ticket revision; anything else
+    (lists, bodies without or with several timestamps) falls back to a hash.
+    """
+    stamps = _DATEUPDATED.findall(content)
+    if len(stamps) == 1:
+        return "dateupdated:" + stamps[0].decode("utf-8", "replace")
+    return "blake2b:" + hashlib.blake2b(content, digest_size=16).hexdigest()
+
+
+class _Entry:
+    __slots__ = ("data", "etag", "last_modified", "fingerprint")
+
+    def __init__(self, data: Any, etag: Optional[str], last_modified: Optional[str], fingerprint: Optional[str]):
+        self.data = data
+        self.etag = etag
+        self.last_modified = last_modified
+        self.fingerprint = fingerprint
+
+
+class HTTPCache:
+    """
+    Bounded LRU cache of GET responses, revalidated on every request
+
+    When HaloITSM sends an ETag or Last-Modified the next request for the same
+    URL is conditional and a 304 is answered from the cache without a body.
+    Otherwise the new body's fingerprint (see body_fingerprint) is compared
+    with the cached one and, if equal, the cached object is returned without
+    parsing the JSON again. Every answer is still confirmed by HaloITSM, so a
+    hit is never stale.
+
+    Cached objects are shared between callers and must be treated as read-only.
+    """
+
+    def __init__(self, max_entries: int = DEFAULT_MAX_ENTRIES, max_entry_bytes: int = DEFAULT_MAX_ENTRY_BYTES):
+        self.max_entries = max(1, int(max_entries))
+        self.max_entry_bytes = max_entry_bytes
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+        self.not_modified = 0
+        self.fingerprint_hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.bypassed = 0
+        self.too_large = 0
+
+    def lookup(self, key: Hashable) -> Optional[_Entry]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+            return entry
+
+    @staticmethod
+    def conditional_headers(entry: Optional[_Entry]) -> Dict[str, str]:
+        """Validator headers to send for a cached entry"""
+        headers = {}
+        if entry is not None:
+            if entry.etag:
+                headers["If-None-Match"] = entry.etag
+            if entry.last_modified:
+                headers["If-Modified-Since"] = entry.last_modified
+        return headers
+
+    def resolve(self, key: Hashable, entry: Optional[_Entry], response) -> Any:
+        """Return the body of a successful response, from the cache where it is unchanged"""
+        if response.status_code == 304 and entry is not None:
+            with self._lock:
+                self.not_modified += 1
+            return entry.data
+
+        content = response.content
+        etag = _header(response, "ETag")
+        last_modified = _header(response, "Last-Modified")
+        fingerprint = None
+        if isinstance(content, bytes) and not (etag or last_modified):
+            fingerprint = body_fingerprint(content)
+            if entry is not None and entry.fingerprint == fingerprint:
+                with self._lock:
+                    self.fingerprint_hits += 1
+                    if key in self._entries:
+                        self._entries.move_to_end(key)
+                return entry.data
+
+        try:
+            data = json_codec.decode_response(response)
+        except ValueError:
+            return response.text
+
+        with self._lock:
+            self.misses += 1
+            if not isinstance(content, bytes) or not (etag or last_modified or fingerprint):
+                return data
+            if len(content) > self.max_entry_bytes:
+                self.too_large += 1
+                self._entries.pop(key, None)
+                return data
+            self._entries[key] = _Entry(data, etag, last_modified, fingerprint)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+        return data
+
+    def record_bypass(self) -> None:
+        with self._lock:
+            self.bypassed += 1
+
+    def invalidate(self, key: Hashable) -> bool:
+        with self._lock:
+            return self._entries.pop(key, None) is not None
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            hits = self.not_modified + self.fingerprint_hits
+            total = hits + self.misses
+            return {
+                "size": len(self._entries),
+                "max_entries": self.max_entries,
+                "hits": hits,
+                "not_modified": self.not_modified,
+                "fingerprint_hits": self.fingerprint_hits,
+                "misses": self.misses,
+                "hit_ratio": hits / total if total else 0.0,
+                "evictions": self.evictions,
+                "bypassed": self.bypassed,
+                "too_large": self.too_large
+            }
+
+
+def _header(response, name: str) -> Optional[str]:
+    value = response.headers.get(name) if response.headers is not None else None
+    return value if isinstance(value, str) and value else None
@@ -0,0 +1,37 @@
+import json
+from typing import Any, Union
+
+try:
+    import orjson
+except ImportError:  # requirements not installed (e.g. a bare source checkout) - fall back to stdlib json
+    orjson = None
+
+# Name of the codec in use, for logs and benchmarks
+BACKEND = "orjson" if orjson is not None else "json"
+
+
+def loads(data: Union[bytes, bytearray, str]) -> Any:
+    """
+    Decode a JSON document, raising ValueError if it is not valid JSON
+
+    Accepts the raw response bytes, so the body is never decoded to str first.
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def dumps(obj: Any) -> bytes:
+    """Encode obj as compact UTF-8 JSON"""
+    if orjson is not None:
+        try:
+            return orjson.dumps(obj)
+        except TypeError:
+            # e.g. integer dict keys or big ints orjson refuses - stdlib handles them
+            pass
+    return json.dumps(obj, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+
+
+def decode_response(response) -> Any:
+    """JSON body of a requests.Response; ValueError if the body is not JSON"""
+    return loads(response.content)
@@ -0,0 +1,179 @@
+import re
+from typing import Any, Iterable, Iterator, Optional
+from icon_haloitsm.util import json_codec
+
+# Bytes read from the socket at a time in streaming mode
+DEFAULT_CHUNK_SIZE = 64 * 1024
+
+_HEADER, _ITEMS, _TRAILER = range(3)
+# Outside strings only these bytes matter
+_STRUCTURE = re.compile(rb'[{}\[\]"]')
+_ITEM_STRUCTURE = re.compile(rb'[{}\[\]",]')
+_QUOTE, _BACKSLASH, _COMMA = ord('"'), ord("\\"), ord(",")
+_OPEN, _CLOSE = frozenset(b"{["), frozenset(b"}]")
+# Returned for an empty slot (e.g. in "[]"), since null is a valid item
+_EMPTY = object()
+
+
+class JSONArrayStream:
+    """
+    Incrementally decode the items of one array in a JSON document
+
+    Items of the array under the top-level `key` (or of the document itself
+    when it is a bare array) are decoded and yielded one at a time as their
+    bytes arrive, so only the item being read is held in memory - never the
+    whole body or its text. Everything outside the array (e.g. record_count)
+    is collected into `meta`, complete once the stream is exhausted.
+
+    The scanner only tracks nesting depth and string boundaries, jumping
+    between structural bytes with regular expressions, and leaves the actual
+    decoding of each item to json_codec.
+    """
+
+    def __init__(self, chunks: Iterable[bytes], key: Optional[str] = "tickets", on_close=None):
+        self._chunks = chunks
+        self._target = key.encode() if key else None
+        self._on_close = on_close
+        self.meta = {}
+        self.items = 0
+
+        self._buf = bytearray()
+        self._pos = 0
+        self._phase = _HEADER
+        self._depth = 0
+        self._base = None
+        self._in_string = False
+        self._escape = False
+        self._string_start = 0
+        self._last_string = None
+        self._item_start = 0
+        self._outside = bytearray()
+
+    def __iter__(self) -> Iterator[Any]:
+        try:
+            for chunk in self._chunks:
+                if not chunk:
+                    continue
+                self._buf += chunk
+                yield from self._scan()
+            self._finish()
+        finally:
+            self.close()
+
+    def close(self) -> None:
+        """Release the underlying response (safe to call more than once)"""
+        if self._on_close is not None:
+            on_close, self._on_close = self._on_close, None
+            on_close()
+
+    def _scan(self) -> Iterator[Any]:
+        buf, i = self._buf, self._pos
+        end = len(buf)
+        while i < end:
+            if self._in_string:
+                if self._escape:
+                    self._escape = False
+                    i += 1
+                    continue
+                # memchr-speed jumps over long strings such as details HTML
+                quote = buf.find(b'"', i)
+                backslash = buf.find(b"\\", i, end if quote < 0 else quote)
+                if backslash >= 0:
+                    i = backslash
+                elif quote >= 0:
+                    i = quote
+                else:
+                    i = end
+                    break
+                if buf[i] == _BACKSLASH:
+                    self._escape = True
+                else:
+                    self._in_string = False
+                    if self._phase == _HEADER and self._depth == 1:
+                        self._last_string = bytes(buf[self._string_start:i])
+                i += 1
+                continue
+
+            pattern = _ITEM_STRUCTURE if self._phase == _ITEMS else _STRUCTURE
+            match = pattern.search(buf, i)
+            if match is None:
+                i = end
+                break
+            i = match.start()
+            char = buf[i]
+            if char == _QUOTE:
+                self._in_string = True
+                self._string_start = i + 1
+            elif char in _OPEN:
+                self._depth += 1
+                if self._phase == _HEADER and char == ord("[") and self._is_target():
+                    # Array found - keep the header for meta, then read items
+                    self._outside += buf[:i + 1]
+                    self._phase = _ITEMS
+                    self._base = self._depth
+                    self._item_start = i + 1
+            elif char in _CLOSE:
+                self._depth -= 1
+                if self._phase == _ITEMS and self._depth < self._base:
+                    item = self._take_item(i)
+                    if item is not _EMPTY:
+                        yield item
+                    self._phase = _TRAILER
+                    self._outside += b"]"
+                    self._item_start = i + 1
+            elif char == _COMMA and self._depth == self._base:
+                item = self._take_item(i)
+                if item is not _EMPTY:
+                    yield item
+                self._item_start = i + 1
+            i += 1
+
+        # Drop what has been consumed so memory stays at about one item
+        if self._phase == _ITEMS:
+            keep = self._item_start
+        elif self._phase == _TRAILER:
+            self._outside += buf[self._item_start:i]
+            keep = self._item_start = i
+        else:
+            keep = 0
+        if keep:
+            del buf[:keep]
+            i -= keep
+            self._item_start -= keep
+        self._pos = i
+
+    def _is_target(self) -> bool:
+        if self._depth == 1:
+            # The document itself is the array
+            return True
+        return self._depth == 2 and self._target is not None and self._last_string == self._target
+
+    def _take_item(self, end: int) -> Any:
+        raw = bytes(self._buf[self._item_start:end])
+        if not raw.strip():
+            return _EMPTY
+        self.items += 1
+        return json_codec.loads(raw)
+
+    def _finish(self) -> None:
+        if self._in_string or self._phase == _ITEMS:
+            raise ValueError("Truncated JSON response")
+        if self._phase == _HEADER:
+            # No array in the document - nothing was consumed, decode it whole
+            document = bytes(self._buf)
+            meta = json_codec.loads(document) if document.strip() else {}
+        else:
+            self._outside += self._buf
+            self._buf.clear()
+            meta = json_codec.loads(bytes(self._outside))
+        self.meta = meta if isinstance(meta, dict) else {}
+
+
+def iter_json_array(chunks: Iterable[bytes], key: Optional[str] = "tickets") -> Iterator[Any]:
+    """Yield the items of the array under key as they arrive (see JSONArrayStream)"""
+    return iter(JSONArrayStream(chunks, key))
+
+
+def stream_response(response, key: Optional[str] = "tickets", chunk_size: int = DEFAULT_CHUNK_SIZE) -> JSONArrayStream:
+    """JSONArrayStream over a requests response opened with stream=True"""
+    return JSONArrayStream(response.iter_content(chunk_size=chunk_size), key, on_close=response.close)
@@ -0,0 +1,48 @@
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Iterator, TypeVar
+
+T = TypeVar("T")
+
+# Pages requested ahead of the consumer by default
+DEFAULT_PREFETCH_WINDOW = 4
+
+
+def prefetch_pages(
+    fetch_page: Callable[[int], T],
+    first_page_no: int,
+    last_page_no: int,
+    window: int = DEFAULT_PREFETCH_WINDOW
+) -> Iterator[T]:
+    """
+    Fetch pages first_page_no..last_page_no concurrently, yielding them in page order
+
+    At most `window` pages are in flight or waiting to be consumed, so a slow
+    consumer holds back further requests instead of buffering the whole result.
+    Closing the iterator early cancels the pages that have not started yet.
+    """
+    window = max(1, int(window))
+    if last_page_no < first_page_no:
+        return
+
+    executor = ThreadPoolExecutor(max_workers=window, thread_name_prefix="haloitsm-page")
+    pending = deque()
+    next_page_no = first_page_no
+    try:
+        while True:
+            # Top the window up - only ever `window` pages ahead of the page being consumed
+            while len(pending) < window and next_page_no <= last_page_no:
+                pending.append(executor.submit(fetch_page, next_page_no))
+                next_page_no += 1
+            if not pending:
+                return
+            # Block on the oldest page so output order never depends on timing
+            future = pending.popleft()
+            if next_page_no <= last_page_no:
+                pending.append(executor.submit(fetch_page, next_page_no))
+                next_page_no += 1
+            yield future.result()
+    finally:
+        for future in pending:
+            future.cancel()
+        executor.shutdown(wait=False)
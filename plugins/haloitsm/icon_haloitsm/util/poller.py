@@ -0,0 +1,297 @@
+import hashlib
+import json
+import os
+import tempfile
+import threading
+import time
+from itertools import islice
+from datetime import datetime, timedelta, timezone
+from typing import Any, Callable, Dict, Iterator, Optional
+from icon_haloitsm.util.api import DEFAULT_PAGE_SIZE
+
+# Seconds between two polls of /tickets
+DEFAULT_POLL_INTERVAL = 60
+# Each poll re-reads this many seconds before the watermark, for clock skew
+# between HaloITSM's database and its API nodes and for late commits
+DEFAULT_OVERLAP = 120
+# Default location of the persisted watermarks (writable by the nobody user in the plugin image)
+DEFAULT_POLL_STATE_DIR = os.path.join(tempfile.gettempdir(), "haloitsm-poll-state")
+
+
+def poll_state_key(resource_server: str, tenant: str, name: str, params: Optional[Dict[str, Any]] = None) -> str:
+    """Stable key of one poller - the same trigger with the same inputs resumes where it stopped"""
+    raw = json.dumps([resource_server, tenant, name, params or {}], sort_keys=True, default=str)
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+
+def parse_halo_date(value: Any) -> Optional[datetime]:
+    """
+    Parse a HaloITSM timestamp as an aware UTC datetime, None when it is missing or invalid
+
+    HaloITSM returns UTC times with or without a trailing Z and with up to 7
+    fraction digits ("2025-11-06T15:00:00.0000000"), which fromisoformat
+    does not accept as is.
+    """
+    if not isinstance(value, str) or not value:
+        return None
+    text = value.strip()
+    if text.endswith("Z"):
+        text = text[:-1]
+    offset = ""
+    for sign in ("+", "-"):
+        position = text.rfind(sign)
+        if position > 10:
+            text, offset = text[:position], text[position:]
+            break
+    if "." in text:
+        text, fraction = text.split(".", 1)
+        text += "." + fraction[:6].ljust(6, "0")
+    try:
+        parsed = datetime.fromisoformat(text + offset)
+    except ValueError:
+        return None
+    if parsed.tzinfo is None:
+        return parsed.replace(tzinfo=timezone.utc)
+    return parsed.astimezone(timezone.utc)
+
+
+def format_halo_date(value: datetime) -> str:
+    """Format an aware datetime the way HaloITSM query parameters expect (UTC)"""
+    return value.astimezone(timezone.utc).strftime("%Y-%m-%dT%H:%M:%S.%f")[:-3] + "Z"
+
+
+class PollStateStore:
+    """Where pollers keep their watermark between polls and restarts"""
+
+    def load(self, key: str) -> Optional[Dict[str, Any]]:
+        raise NotImplementedError
+
+    def save(self, key: str, record: Dict[str, Any]) -> None:
+        raise NotImplementedError
+
+
+class MemoryPollStateStore(PollStateStore):
+    """Process-local store - state is lost when the plugin restarts"""
+
+    def __init__(self):
+        self._records = {}
+        self._lock = threading.Lock()
+
+    def load(self, key: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            record = self._records.get(key)
+            return json.loads(record) if record else None
+
+    def save(self, key: str, record: Dict[str, Any]) -> None:
+        with self._lock:
+            self._records[key] = json.dumps(record)
+
+
+class FilePollStateStore(PollStateStore):
+    """
+    File-backed store that survives container restarts
+
+    Each key gets a JSON file replaced atomically (temp file + os.replace), so
+    a crash mid-write leaves the previous watermark rather than a torn one.
+    """
+
+    def __init__(self, directory: str = DEFAULT_POLL_STATE_DIR):
+        self.directory = directory
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, f"{key}.json")
+
+    def load(self, key: str) -> Optional[Dict[str, Any]]:
+        try:
+            with open(self._path(key), "r") as state_file:
+                record = json.load(state_file)
+        except (OSError, ValueError):
+            return None
+        return record if isinstance(record, dict) else None
+
+    def save(self, key: str, record: Dict[str, Any]) -> None:
+        os.makedirs(self.directory, mode=0o700, exist_ok=True)
+        fd, temp_path = tempfile.mkstemp(dir=self.directory, prefix=f".{key}.", suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w") as temp_file:
+                json.dump(record, temp_file)
+            os.replace(temp_path, self._path(key))
+        except Exception:
+            if os.path.exists(temp_path):
+                os.unlink(temp_path)
+            raise
+
+
+class TicketPoller:
+    """
+    Incremental reader of changed tickets, driven by a persisted high-water mark
+
+    Every poll asks /tickets for records whose dateupdated is at or after the
+    watermark minus `overlap` seconds, oldest first, and hands each change to
+    the caller once. The watermark moves to dateupdated values HaloITSM
+    returned rather than to the local clock, so skew between the two does
+    not lose changes; the overlap re-reads a short window for writes that
+    commit late. Changes inside the window are remembered as id -> dateupdated
+    so the re-read ones are not emitted twice, and that memory is saved with
+    the watermark in one atomic write after every page.
+
+    A poll narrowed by extra filters only sees the tickets it asked for, so
+    a quiet filter would hold the watermark still and a later, wider poll
+    would replay everything since. After such a poll the watermark is also
+    moved up to the local time the query was sent minus `overlap`; with the
+    re-read window that keeps twice the overlap of skew covered.
+
+    The first poll of a new key starts at `start` (default: now), so the
+    backlog of older updates is not replayed.
+    """
+
+    def __init__(
+        self,
+        client,
+        key: str,
+        store: Optional[PollStateStore] = None,
+        overlap: float = DEFAULT_OVERLAP,
+        page_size: int = DEFAULT_PAGE_SIZE,
+        filters: Optional[Dict[str, Any]] = None,
+        start: Optional[datetime] = None,
+        logger=None,
+        clock: Callable[[], float] = time.time
+    ):
+        self.client = client
+        self.key = key
+        self.store = store if store is not None else MemoryPollStateStore()
+        self.overlap = timedelta(seconds=max(0, overlap))
+        self.page_size = page_size
+        self.filters = dict(filters or {})
+        self.logger = logger
+        self.clock = clock
+        self._lock = threading.Lock()
+
+        record = self.store.load(key) or {}
+        self.watermark = parse_halo_date(record.get("watermark"))
+        if self.watermark is None:
+            self.watermark = start or datetime.fromtimestamp(clock(), timezone.utc)
+        self._seen = {str(ticket_id): stamp for ticket_id, stamp in (record.get("seen") or {}).items()}
+
+        self.polls = 0
+        self.fetched = 0
+        self.emitted = 0
+        self.duplicates = 0
+
+    def query_params(self, since: datetime, filters: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """/tickets filters selecting the tickets updated since `since`, oldest first"""
+        params = dict(self.filters)
+        params.update(filters or {})
+        params.update({
+            "datesearch": "dateupdated",
+            "startdate": format_halo_date(since),
+            "order": "dateupdated",
+            "orderdesc": False
+        })
+        return params
+
+    def settled_tickets(self) -> Iterator[Dict[str, Any]]:
+        """
+        Every ticket last updated before the next poll's window, raw
+
+        A full scan of /tickets under the poller's own filters. The tickets
+        inside the window are left out, since poll still reports them.
+        """
+        since = self.watermark - self.overlap
+        for ticket in self.client.iter_tickets(dict(self.filters), page_size=self.page_size, normalize=False):
+            updated = parse_halo_date(ticket.get("dateupdated"))
+            if ticket.get("id") is not None and updated is not None and updated < since:
+                yield ticket
+
+    def poll(self, emit: Callable[[Dict[str, Any], bool], None], filters: Optional[Dict[str, Any]] = None) -> int:
+        """
+        Fetch the tickets changed since the watermark and call emit(ticket, created) for each
+
+        Tickets are raw (not normalized), oldest change first, and are handed
+        over page by page as they arrive. created is True for tickets first
+        seen in this window whose dateoccurred falls inside it. The watermark
+        advances past every change that emit accepted and is saved after each
+        page, as long as HaloITSM keeps the requested order - if emit raises,
+        the poll stops and that change is offered again next time.
+        filters narrows this poll's query on top of the poller's own filters;
+        it only saves transfer, so emit must still check what it needs. A
+        narrowed poll that completes also advances the watermark by the clock.
+        Returns the number of changes emitted.
+        """
+        with self._lock:
+            sent = datetime.fromtimestamp(self.clock(), timezone.utc)
+            since = self.watermark - self.overlap
+            tickets = self.client.iter_tickets(self.query_params(since, filters), page_size=self.page_size, normalize=False)
+
+            emitted = 0
+            watermark = self.watermark
+            # Saving mid-poll is only safe while no page holds changes older than the pages before it
+            ordered = True
+            floor = since
+            try:
+                while True:
+                    page = list(islice(tickets, max(1, self.page_size)))
+                    if not page:
+                        break
+                    self.fetched += len(page)
+                    changes = []
+                    for ticket in page:
+                        updated = parse_halo_date(ticket.get("dateupdated"))
+                        if ticket.get("id") is None or updated is None or updated < since:
+                            # Outside the window - the server ignored part of the query
+                            continue
+                        changes.append((updated, ticket))
+                    changes.sort(key=lambda change: change[0])
+                    if changes:
+                        ordered = ordered and changes[0][0] >= floor
+                        floor = max(floor, changes[-1][0])
+
+                    for updated, ticket in changes:
+                        ticket_id = str(ticket["id"])
+                        previous = parse_halo_date(self._seen.get(ticket_id))
+                        if previous is not None and updated <= previous:
+                            self.duplicates += 1
+                            continue
+                        occurred = parse_halo_date(ticket.get("dateoccurred"))
+                        created = previous is None and occurred is not None and occurred >= since
+                        emit(ticket, created)
+                        self._seen[ticket_id] = format_halo_date(updated)
+                        watermark = max(watermark, updated)
+                        emitted += 1
+                    if ordered:
+                        self._advance(watermark)
+                if filters:
+                    # Tickets outside the filters were not asked for, not absent
+                    watermark = max(watermark, sent - self.overlap)
+            finally:
+                self.polls += 1
+                self.emitted += emitted
+                self._advance(watermark)
+            return emitted
+
+    def _advance(self, watermark: datetime) -> None:
+        """Move the watermark, forget changes that left the overlap window and persist both"""
+        self.watermark = watermark
+        horizon = watermark - self.overlap
+        self._seen = {
+            ticket_id: stamp for ticket_id, stamp in self._seen.items()
+            if (parse_halo_date(stamp) or datetime.min.replace(tzinfo=timezone.utc)) >= horizon
+        }
+        try:
+            self.store.save(self.key, {"watermark": format_halo_date(watermark), "seen": self._seen})
+        except OSError as e:
+            # Keep polling from memory - only a restart would replay the window
+            if self.logger:
+                self.logger.warning(f"TicketPoller: Could not persist watermark: {str(e)}")
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "watermark": format_halo_date(self.watermark),
+                "polls": self.polls,
+                "fetched": self.fetched,
+                "emitted": self.emitted,
+                "duplicates": self.duplicates,
+                "window": len(self._seen)
+            }
+
@@ -0,0 +1,164 @@
+import threading
+import time
+from email.utils import parsedate_to_datetime
+from typing import Dict, Any, Optional
+
+READ = "read"
+WRITE = "write"
+
+# Cooldown applied after a 429 that carries no usable Retry-After header
+DEFAULT_COOLDOWN = 5.0
+# Never honour a Retry-After longer than this (seconds)
+MAX_COOLDOWN = 300.0
+
+_registry = {}
+_registry_lock = threading.Lock()
+
+
+def endpoint_class(method: str) -> str:
+    """Classify a request as a read or a write for rate limiting"""
+    return READ if method.upper() in ("GET", "HEAD", "OPTIONS") else WRITE
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Parse a Retry-After header (delta-seconds or HTTP-date) into seconds"""
+    if not value or not isinstance(value, str):
+        return None
+    value = value.strip()
+    try:
+        seconds = float(value)
+    except ValueError:
+        try:
+            seconds = parsedate_to_datetime(value).timestamp() - time.time()
+        except (TypeError, ValueError, IndexError, OverflowError):
+            return None
+    return min(max(seconds, 0.0), MAX_COOLDOWN)
+
+
+class TokenBucket:
+    """Thread-safe token bucket; callers reserve a slot and sleep until it is due"""
+
+    def __init__(self, rate: float, capacity: Optional[float] = None):
+        self.rate = float(rate)
+        self.capacity = float(capacity if capacity else max(1.0, rate))
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def reserve(self) -> float:
+        """Take one token, returning how long the caller must wait for it"""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            self._tokens -= 1
+            if self._tokens >= 0:
+                return 0.0
+            # Negative balance queues callers in arrival order
+            return -self._tokens / self.rate
+
+    def matches(self, rate: float, capacity: Optional[float] = None) -> bool:
+        """Whether this bucket already runs at the given rate and capacity"""
+        return self.rate == float(rate) and self.capacity == float(capacity if capacity else max(1.0, rate))
+
+
+class RateLimiter:
+    """
+    Client-side request limiter for one HaloITSM tenant
+
+    Reads and writes draw from separate token buckets (a rate of None or 0
+    means unlimited). A 429 puts every caller sharing the limiter into a common
+    cooldown for the server's Retry-After before anyone sends again.
+    """
+
+    def __init__(
+        self,
+        read_rate: Optional[float] = None,
+        write_rate: Optional[float] = None,
+        read_burst: Optional[float] = None,
+        write_burst: Optional[float] = None
+    ):
+        self._buckets = {}
+        self.configure(read_rate, write_rate, read_burst, write_burst)
+
+        self._lock = threading.Lock()
+        self._cooldown_until = 0.0
+        self.throttled_seconds = {READ: 0.0, WRITE: 0.0}
+        self.throttled_requests = {READ: 0, WRITE: 0}
+        self.cooldowns = 0
+
+    @classmethod
+    def for_tenant(cls, tenant: str, **config) -> "RateLimiter":
+        """
+        Return the limiter shared by every client of this tenant in the process
+
+        Clients are built per action in cloud mode, so the limiter outlives them:
+        a client asking for the same rates keeps the buckets' current balance.
+        """
+        with _registry_lock:
+            limiter = _registry.get(tenant)
+            if limiter is None:
+                limiter = cls(**config)
+                _registry[tenant] = limiter
+            else:
+                limiter.configure(
+                    config.get("read_rate"),
+                    config.get("write_rate"),
+                    config.get("read_burst"),
+                    config.get("write_burst")
+                )
+            return limiter
+
+    def configure(self, read_rate=None, write_rate=None, read_burst=None, write_burst=None) -> None:
+        """Apply rates and bursts, only replacing the buckets whose settings changed"""
+        buckets = {}
+        for request_class, rate, burst in ((READ, read_rate, read_burst), (WRITE, write_rate, write_burst)):
+            bucket = self._buckets.get(request_class)
+            if not rate:
+                bucket = None
+            elif bucket is None or not bucket.matches(rate, burst):
+                bucket = TokenBucket(rate, burst)
+            buckets[request_class] = bucket
+        self._buckets = buckets
+
+    def acquire(self, request_class: str = READ) -> float:
+        """Block until a request of this class may be sent; returns seconds waited"""
+        waited = 0.0
+
+        # Honour any shared 429 cooldown first - it may be extended while we sleep
+        while True:
+            remaining = self._cooldown_until - time.monotonic()
+            if remaining <= 0:
+                break
+            time.sleep(remaining)
+            waited += remaining
+
+        bucket = self._buckets.get(request_class)
+        if bucket is not None:
+            delay = bucket.reserve()
+            if delay > 0:
+                time.sleep(delay)
+                waited += delay
+
+        if waited > 0:
+            with self._lock:
+                self.throttled_seconds[request_class] += waited
+                self.throttled_requests[request_class] += 1
+        return waited
+
+    def cooldown(self, seconds: Optional[float]) -> float:
+        """Pause all callers after a 429; returns the cooldown applied"""
+        seconds = DEFAULT_COOLDOWN if seconds is None else seconds
+        with self._lock:
+            self._cooldown_until = max(self._cooldown_until, time.monotonic() + seconds)
+            self.cooldowns += 1
+        return seconds
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "throttled_seconds": dict(self.throttled_seconds),
+                "throttled_requests": dict(self.throttled_requests),
+                "cooldowns": self.cooldowns,
+                "cooldown_remaining": max(0.0, self._cooldown_until - time.monotonic())
+            }
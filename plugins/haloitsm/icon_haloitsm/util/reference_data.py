@@ -0,0 +1,214 @@
+import threading
+import time
+from typing import Any, Dict, List, Optional
+from insightconnect_plugin_runtime.exceptions import PluginException
+
+# Lookup tables: kind -> (endpoint, id field of its records, ticket field holding the id)
+REFERENCE_RESOURCES = {
+    "ticket_type": ("/tickettype", "id", "tickettype_id"),
+    # /priority returns one row per SLA, each with its own "id" - tickets use priorityid
+    "priority": ("/priority", "priorityid", "priority_id"),
+    "status": ("/status", "id", "status_id"),
+    "team": ("/team", "id", "team_id")
+}
+# Reload the tables this often (seconds)
+DEFAULT_REFRESH_INTERVAL = 3600
+# Wait this long before retrying a failed load
+DEFAULT_RETRY_INTERVAL = 30
+
+_registry = {}
+_registry_lock = threading.Lock()
+
+
+class ReferenceData:
+    """
+    Ticket types, priorities, statuses and teams of one tenant, resolved id <-> name locally
+
+    The tables are loaded on first use and then reloaded every refresh_interval
+    by a background thread, so lookups never wait on HaloITSM after the first.
+    A failed reload keeps the previous tables. While nothing could be loaded,
+    names resolve to "" and validation lets every id through rather than
+    blocking tickets because the lookup endpoints are down.
+    """
+
+    def __init__(
+        self,
+        client,
+        refresh_interval: float = DEFAULT_REFRESH_INTERVAL,
+        retry_interval: float = DEFAULT_RETRY_INTERVAL,
+        background: bool = True,
+        logger=None
+    ):
+        self.client = client
+        self.refresh_interval = refresh_interval
+        self.retry_interval = retry_interval
+        self.background = background
+        self.logger = logger
+
+        # kind -> {id: name}; replaced wholesale so readers never see a half-built table
+        self._names = {}
+        self._ids = {}
+        self.loaded_at = 0.0
+        self.loads = 0
+        self.failures = 0
+        self.last_error = None
+
+        self._lock = threading.Lock()
+        self._next_attempt = 0.0
+        self._stop_event = threading.Event()
+        self._thread = None
+
+    @classmethod
+    def for_tenant(cls, tenant: str, client, **config) -> "ReferenceData":
+        """
+        Return the tables shared by every client of this tenant in the process
+
+        Clients are built per action in cloud mode, so sharing means the
+        tables are loaded once and refreshed by a single thread per tenant.
+        """
+        with _registry_lock:
+            reference_data = _registry.get(tenant)
+            if reference_data is None:
+                reference_data = cls(client, **config)
+                _registry[tenant] = reference_data
+            else:
+                reference_data.refresh_interval = config.get("refresh_interval", reference_data.refresh_interval)
+                reference_data.logger = config.get("logger") or reference_data.logger
+            return reference_data
+
+    @property
+    def is_loaded(self) -> bool:
+        return bool(self.loaded_at)
+
+    @property
+    def is_running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def ensure_loaded(self) -> bool:
+        """Load the tables if they are missing or stale; returns whether any are available"""
+        now = time.monotonic()
+        if self.is_loaded and (self.is_running or now - self.loaded_at < self.refresh_interval):
+            return True
+        if now < self._next_attempt:
+            return self.is_loaded
+        # Single flight: concurrent callers wait for one load instead of repeating it
+        with self._lock:
+            if self.is_loaded and time.monotonic() - self.loaded_at < self.refresh_interval:
+                return True
+            if time.monotonic() >= self._next_attempt:
+                self.refresh()
+        if self.background and self.is_loaded:
+            self.start()
+        return self.is_loaded
+
+    def refresh(self) -> bool:
+        """Reload every table; on failure the previous tables stay in use"""
+        try:
+            names = {kind: self._load(endpoint, id_field) for kind, (endpoint, id_field, _) in REFERENCE_RESOURCES.items()}
+        except Exception as e:
+            self.failures += 1
+            self.last_error = str(e)
+            self._next_attempt = time.monotonic() + self.retry_interval
+            if self.logger:
+                self.logger.warning(f"Reference data load failed: {type(e).__name__}: {str(e)}")
+            return False
+
+        self._ids = {
+            kind: {name.lower(): entity_id for entity_id, name in table.items() if name}
+            for kind, table in names.items()
+        }
+        self._names = names
+        self.loaded_at = time.monotonic()
+        self.loads += 1
+        self.last_error = None
+        if self.logger:
+            sizes = ", ".join(f"{len(table)} {kind}" for kind, table in names.items())
+            self.logger.info(f"Reference data loaded: {sizes}")
+        return True
+
+    def _load(self, endpoint: str, id_field: str) -> Dict[int, str]:
+        response = self.client.make_request(method="GET", endpoint=endpoint)
+        # Usually a bare list; some endpoints wrap it, e.g. {"record_count": n, "teams": [...]}
+        if isinstance(response, dict):
+            response = next((value for value in response.values() if isinstance(value, list)), [])
+        table = {}
+        for item in response or []:
+            if not isinstance(item, dict):
+                continue
+            entity_id = item.get(id_field)
+            if entity_id is None:
+                continue
+            # Priorities repeat per SLA - keep the first name seen for an id
+            table.setdefault(int(entity_id), str(item.get("name", "")))
+        return table
+
+    def name_for(self, kind: str, entity_id: Any, load: bool = True) -> str:
+        """Name of the given id, or "" if unknown; load=False only looks in tables already loaded"""
+        if entity_id is None or not (self.ensure_loaded() if load else self.is_loaded):
+            return ""
+        try:
+            return self._names.get(kind, {}).get(int(entity_id), "")
+        except (TypeError, ValueError):
+            return ""
+
+    def id_for(self, kind: str, name: str) -> Optional[int]:
+        """Id of the given name (case-insensitive), or None if unknown"""
+        if not name or not self.ensure_loaded():
+            return None
+        return self._ids.get(kind, {}).get(str(name).strip().lower())
+
+    def names(self, kind: str) -> Dict[int, str]:
+        self.ensure_loaded()
+        return dict(self._names.get(kind, {}))
+
+    def validate(self, kind: str, entity_id: Any) -> None:
+        """Raise a PluginException if entity_id is not a known id of this kind"""
+        if entity_id is None or not self.ensure_loaded() or kind not in self._names:
+            return
+        table = self._names[kind]
+        try:
+            if int(entity_id) in table:
+                return
+        except (TypeError, ValueError):
+            pass
+        known = ", ".join(f"{known_id} ({name})" for known_id, name in sorted(table.items())[:20])
+        raise PluginException(
+            cause=f"Unknown {kind.replace('_', ' ')} ID {entity_id}",
+            assistance=f"Use one of the IDs configured in HaloITSM: {known or 'none found'}"
+        )
+
+    def validate_ticket(self, ticket_data: Dict[str, Any], kinds: Optional[List[str]] = None) -> None:
+        """Validate every reference id present in a ticket payload"""
+        for kind, (_, _, field) in REFERENCE_RESOURCES.items():
+            if kinds is None or kind in kinds:
+                self.validate(kind, ticket_data.get(field))
+
+    def start(self) -> None:
+        """Start reloading in the background (no-op if already running)"""
+        if self.is_running or self.refresh_interval <= 0:
+            return
+        self._stop_event.clear()
+        self._thread = threading.Thread(target=self._run, name="haloitsm-reference-data", daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: float = 5) -> None:
+        self._stop_event.set()
+        if self._thread is not None and self._thread is not threading.current_thread():
+            self._thread.join(timeout)
+        self._thread = None
+
+    def _run(self) -> None:
+        delay = self.refresh_interval
+        while not self._stop_event.wait(delay):
+            delay = self.refresh_interval if self.refresh() else self.retry_interval
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "loaded": self.is_loaded,
+            "age": time.monotonic() - self.loaded_at if self.loaded_at else None,
+            "sizes": {kind: len(table) for kind, table in self._names.items()},
+            "loads": self.loads,
+            "failures": self.failures,
+            "last_error": self.last_error,
+            "running": self.is_running
+        }
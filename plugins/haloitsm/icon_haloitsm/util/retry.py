@@ -0,0 +1,121 @@
+import random
+import threading
+import time
+from typing import Dict, Any, Optional
+
+# Transport failure kinds, independent of the HTTP library in use
+CONNECT_ERROR = "connect"        # connection never established - request was not sent
+TIMEOUT = "timeout"              # sent, no answer in time - server may have processed it
+CONNECTION_ERROR = "connection"  # connection dropped mid-request - server may have processed it
+
+# Statuses worth another attempt; everything else (400, 403, 404, 422...) fails immediately
+RETRYABLE_STATUSES = frozenset([408, 425, 429, 500, 502, 503, 504])
+IDEMPOTENT_METHODS = frozenset(["GET", "HEAD", "OPTIONS", "PUT", "DELETE"])
+
+DEFAULT_BASE_DELAY = 0.5
+DEFAULT_MAX_DELAY = 10.0
+DEFAULT_BUDGET_RATIO = 0.2
+DEFAULT_BUDGET_MIN_PER_SECOND = 1.0
+
+
+class RetryBudget:
+    """
+    Caps retries at a fraction of request traffic
+
+    Every request deposits `ratio` of a retry and every retry withdraws one, so
+    sustained failures can add at most ratio * requests extra load. A small
+    time-based allowance keeps retries possible when traffic is light.
+    """
+
+    def __init__(
+        self,
+        ratio: float = DEFAULT_BUDGET_RATIO,
+        min_per_second: float = DEFAULT_BUDGET_MIN_PER_SECOND,
+        max_balance: float = 100.0
+    ):
+        self.ratio = ratio
+        self.min_per_second = min_per_second
+        self.max_balance = max_balance
+        self._balance = max(1.0, min_per_second)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+        self.requests = 0
+        self.retries = 0
+        self.exhausted = 0
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self._balance = min(self.max_balance, self._balance + (now - self._updated) * self.min_per_second)
+        self._updated = now
+
+    def record_request(self) -> None:
+        with self._lock:
+            self._refill()
+            self.requests += 1
+            self._balance = min(self.max_balance, self._balance + self.ratio)
+
+    def try_withdraw(self) -> bool:
+        """Spend one retry from the budget; False when the budget is exhausted"""
+        with self._lock:
+            self._refill()
+            if self._balance >= 1.0:
+                self._balance -= 1.0
+                self.retries += 1
+                return True
+            self.exhausted += 1
+            return False
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "requests": self.requests,
+                "retries": self.retries,
+                "exhausted": self.exhausted,
+                "balance": round(self._balance, 2)
+            }
+
+
+class RetryPolicy:
+    """
+    Decides whether and when a failed HaloITSM request is retried
+
+    Client errors are never retried. Non-idempotent writes (POST without an
+    idempotency guard) are only re-sent when the server provably did not
+    process them: the connection was never established, or a 429. Delays use
+    exponential backoff with full jitter and every retry is charged to a
+    shared RetryBudget.
+    """
+
+    def __init__(
+        self,
+        base_delay: float = DEFAULT_BASE_DELAY,
+        max_delay: float = DEFAULT_MAX_DELAY,
+        retryable_statuses=RETRYABLE_STATUSES,
+        budget: Optional[RetryBudget] = None
+    ):
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.retryable_statuses = frozenset(retryable_statuses)
+        self.budget = budget if budget is not None else RetryBudget()
+
+    @staticmethod
+    def is_idempotent(method: str) -> bool:
+        return method.upper() in IDEMPOTENT_METHODS
+
+    def classify(self, idempotent: bool, status: Optional[int] = None, error: Optional[str] = None) -> bool:
+        """Whether this failure is safe and useful to retry (ignoring the budget)"""
+        if status is not None:
+            if status not in self.retryable_statuses:
+                return False
+            return idempotent or status == 429
+        if error is None:
+            return False
+        return idempotent or error == CONNECT_ERROR
+
+    def should_retry(self, idempotent: bool, status: Optional[int] = None, error: Optional[str] = None) -> bool:
+        return self.classify(idempotent, status=status, error=error) and self.budget.try_withdraw()
+
+    def backoff(self, attempt: int) -> float:
+        """Full-jitter exponential backoff for the given (0-based) attempt"""
+        return random.uniform(0, min(self.max_delay, self.base_delay * (2 ** attempt)))
@@ -0,0 +1,208 @@
+import hashlib
+import sqlite3
+import threading
+from typing import Any, Dict, Iterable, List, NamedTuple, Optional, Tuple
+from insightconnect_plugin_runtime.exceptions import PluginException
+from icon_haloitsm.util import json_codec
+from icon_haloitsm.util.poller import parse_halo_date
+
+# Left out of the content hash - they change on every write without the content changing
+VOLATILE_FIELDS = frozenset(("dateupdated", "lastactiondate", "last_update", "datemodified"))
+# Normalized ticket fields whose changes can be told apart - append only, the
+# order of the hashed ones is the order of their hashes in TicketSnapshot.field_hashes
+WATCHABLE_FIELDS = (
+    "summary", "details", "status_id", "priority_id", "ticket_type_id", "agent_id", "team_id",
+    "client_id", "site_id", "user_id", "category_1", "category_2", "category_3", "category_4",
+    "resolution", "customfields"
+)
+# Watchable fields a snapshot keeps as exact integers, compared without hashing
+_SCALAR_FIELDS = ("status_id", "agent_id", "team_id", "priority_id")
+_HASHED_FIELDS = tuple(field for field in WATCHABLE_FIELDS if field not in _SCALAR_FIELDS)
+# Raw /tickets names of the watchable fields that are renamed by normalization
+_RAW_FIELD_NAMES = {"ticket_type_id": "tickettype_id"}
+# Bytes of hash per hashed field - a change goes unnoticed only on a 1 in 2^32 collision
+_FIELD_HASH_SIZE = 4
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS snapshot (
+    id INTEGER PRIMARY KEY,
+    status_id INTEGER,
+    agent_id INTEGER,
+    team_id INTEGER,
+    priority_id INTEGER,
+    dateupdated INTEGER,
+    digest INTEGER,
+    field_hashes BLOB NOT NULL
+)
+"""
+
+
+class TicketSnapshot(NamedTuple):
+    """What is remembered of a ticket between polls - dateupdated in epoch milliseconds"""
+    status_id: Optional[int]
+    agent_id: Optional[int]
+    team_id: Optional[int]
+    priority_id: Optional[int]
+    dateupdated: Optional[int]
+    digest: int
+    # _FIELD_HASH_SIZE bytes per watchable field not kept above, see field_hashes()
+    field_hashes: bytes
+
+
+def content_digest(ticket: Dict[str, Any]) -> int:
+    """64-bit hash of a ticket's content, independent of key order and of the volatile timestamps"""
+    content = {key: value for key, value in ticket.items() if key not in VOLATILE_FIELDS}
+    encoded = json_codec.dumps(_canonical(content))
+    return int.from_bytes(hashlib.blake2b(encoded, digest_size=8).digest(), "big", signed=True)
+
+
+def field_hashes(ticket: Dict[str, Any]) -> bytes:
+    """Short hash of every watchable field of a raw ticket that is not kept as an integer, in WATCHABLE_FIELDS order"""
+    hashes = bytearray()
+    for field in _HASHED_FIELDS:
+        encoded = json_codec.dumps(_canonical(ticket.get(_RAW_FIELD_NAMES.get(field, field))))
+        hashes += hashlib.blake2b(encoded, digest_size=_FIELD_HASH_SIZE).digest()
+    return bytes(hashes)
+
+
+def changed_fields(previous: TicketSnapshot, current: TicketSnapshot, fields: Iterable[str] = WATCHABLE_FIELDS) -> List[str]:
+    """Watched fields whose value differs between two snapshots of the same ticket"""
+    changed = []
+    for field in fields:
+        if field in _SCALAR_FIELDS:
+            if getattr(previous, field) != getattr(current, field):
+                changed.append(field)
+            continue
+        index = _HASHED_FIELDS.index(field) * _FIELD_HASH_SIZE
+        window = slice(index, index + _FIELD_HASH_SIZE)
+        if previous.field_hashes[window] != current.field_hashes[window]:
+            changed.append(field)
+    return changed
+
+
+def validate_watched_fields(fields: Optional[List[str]]) -> List[str]:
+    """Return the watched fields (all of WATCHABLE_FIELDS when empty), raising a PluginException for unknown names"""
+    fields = [str(field).strip() for field in fields or [] if str(field).strip()]
+    unknown = [field for field in fields if field not in WATCHABLE_FIELDS]
+    if unknown:
+        raise PluginException(
+            cause=f"Unknown watched field(s): {', '.join(unknown)}",
+            assistance=f"Valid fields are: {', '.join(WATCHABLE_FIELDS)}"
+        )
+    return fields or list(WATCHABLE_FIELDS)
+
+
+def snapshot_of(ticket: Dict[str, Any]) -> TicketSnapshot:
+    """Snapshot of a raw ticket as returned by /tickets"""
+    updated = parse_halo_date(ticket.get("dateupdated"))
+    return TicketSnapshot(
+        _int_or_none(ticket.get("status_id")),
+        _int_or_none(ticket.get("agent_id")),
+        _int_or_none(ticket.get("team_id")),
+        _int_or_none(ticket.get("priority_id")),
+        int(updated.timestamp() * 1000) if updated is not None else None,
+        content_digest(ticket),
+        field_hashes(ticket)
+    )
+
+
+class SnapshotStore:
+    """
+    Last known state of every ticket the change feed has seen, id -> TicketSnapshot
+
+    Rows are small integer tuples plus 48 bytes of field hashes in one SQLite
+    table keyed by the ticket id, which SQLite stores as the rowid and packs
+    with variable-length integers, so a million tickets take about 80 MB on
+    disk and only the page cache in memory. The file survives restarts, so
+    status and assignment changes are computed locally even for the first
+    poll after one. path=":memory:" keeps the table in memory instead.
+
+    Writes are buffered in a transaction until commit(), called once per poll.
+    """
+
+    def __init__(self, path: str = ":memory:", cache_kb: int = 2048):
+        self.path = path
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(path, check_same_thread=False, isolation_level="DEFERRED")
+        self._db.execute(f"PRAGMA cache_size = -{int(cache_kb)}")
+        if path != ":memory:":
+            self._db.execute("PRAGMA journal_mode = WAL")
+            self._db.execute("PRAGMA synchronous = NORMAL")
+        self._db.execute(_SCHEMA)
+        self._db.commit()
+
+        self.lookups = 0
+        self.writes = 0
+
+    def get(self, ticket_id: int) -> Optional[TicketSnapshot]:
+        with self._lock:
+            self.lookups += 1
+            row = self._db.execute(
+                "SELECT status_id, agent_id, team_id, priority_id, dateupdated, digest, field_hashes FROM snapshot WHERE id = ?",
+                (int(ticket_id),)
+            ).fetchone()
+        return _snapshot(row)
+
+    def swap(self, ticket_id: int, snapshot: TicketSnapshot) -> Optional[TicketSnapshot]:
+        """Store the new snapshot of a ticket and return the previous one (None when first seen)"""
+        with self._lock:
+            self.lookups += 1
+            self.writes += 1
+            row = self._db.execute(
+                "SELECT status_id, agent_id, team_id, priority_id, dateupdated, digest, field_hashes FROM snapshot WHERE id = ?",
+                (int(ticket_id),)
+            ).fetchone()
+            self._db.execute("INSERT OR REPLACE INTO snapshot VALUES (?, ?, ?, ?, ?, ?, ?, ?)", (int(ticket_id), *snapshot))
+        return _snapshot(row)
+
+    def put(self, ticket_id: int, snapshot: TicketSnapshot) -> None:
+        with self._lock:
+            self.writes += 1
+            self._db.execute("INSERT OR REPLACE INTO snapshot VALUES (?, ?, ?, ?, ?, ?, ?, ?)", (int(ticket_id), *snapshot))
+
+    def put_many(self, snapshots: Iterable[Tuple[int, TicketSnapshot]]) -> None:
+        """Store many snapshots at once (e.g. seeding from a full scan)"""
+        with self._lock:
+            cursor = self._db.executemany(
+                "INSERT OR REPLACE INTO snapshot VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                ((int(ticket_id), *snapshot) for ticket_id, snapshot in snapshots)
+            )
+            self.writes += max(0, cursor.rowcount)
+
+    def commit(self) -> None:
+        with self._lock:
+            self._db.commit()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._db.execute("SELECT COUNT(*) FROM snapshot").fetchone()[0]
+
+    def close(self) -> None:
+        with self._lock:
+            self._db.commit()
+            self._db.close()
+
+    def stats(self) -> Dict[str, Any]:
+        return {"tickets": len(self), "lookups": self.lookups, "writes": self.writes}
+
+
+def _snapshot(row: Optional[tuple]) -> Optional[TicketSnapshot]:
+    if row is None:
+        return None
+    return TicketSnapshot(*row)
+
+
+def _int_or_none(value: Any) -> Optional[int]:
+    try:
+        return int(value) if value is not None else None
+    except (TypeError, ValueError):
+        return None
+
+
+def _canonical(value: Any) -> Any:
+    """Sort dict keys recursively so the encoding does not depend on key order"""
+    if isinstance(value, dict):
+        return {str(key): _canonical(value[key]) for key in sorted(value, key=str)}
+    if isinstance(value, list):
+        return [_canonical(item) for item in value]
+    return value
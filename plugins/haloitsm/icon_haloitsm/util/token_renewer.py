@@ -0,0 +1,123 @@
+import random
+import threading
+import time
+from typing import Dict, Any
+
+# Refresh once this fraction of the token lifetime has elapsed
+DEFAULT_REFRESH_FRACTION = 0.75
+# Spread refreshes by +/- this fraction of the lifetime so workers don't align
+DEFAULT_REFRESH_JITTER = 0.05
+# Wait this long before retrying a failed refresh
+DEFAULT_RETRY_INTERVAL = 30
+# Lazy refresh in HaloITSMAPI kicks in this many seconds before expiry
+LAZY_REFRESH_BUFFER = 60
+
+_registry = {}
+_registry_lock = threading.Lock()
+
+
+class TokenRenewer:
+    """
+    Background thread that renews the client's OAuth2 token ahead of expiry
+
+    The token is refreshed at refresh_fraction of expires_in (plus jitter) so
+    the request path always finds a valid cached token. Under the gevent worker
+    the thread is a greenlet, since threading is monkey patched.
+    """
+
+    def __init__(
+        self,
+        client,
+        refresh_fraction: float = DEFAULT_REFRESH_FRACTION,
+        jitter: float = DEFAULT_REFRESH_JITTER,
+        retry_interval: float = DEFAULT_RETRY_INTERVAL,
+        logger=None
+    ):
+        self.client = client
+        self.refresh_fraction = refresh_fraction
+        self.jitter = jitter
+        self.retry_interval = retry_interval
+        self.logger = logger
+
+        self.refreshes = 0
+        self.failures = 0
+        self.last_error = None
+
+        self._stop_event = threading.Event()
+        self._thread = None
+
+    @classmethod
+    def for_tenant(cls, key: str, client, **config) -> "TokenRenewer":
+        """
+        Return the running renewer shared by every client with these credentials
+
+        Clients are built per action in cloud mode and never closed, so a
+        renewer per client would leak a thread each time. The first client's
+        renewer keeps the shared token store fresh for all later ones.
+        """
+        with _registry_lock:
+            renewer = _registry.get(key)
+            if renewer is None:
+                renewer = cls(client, **config)
+                _registry[key] = renewer
+            elif config.get("logger"):
+                renewer.logger = config["logger"]
+            renewer.start()
+            return renewer
+
+    @property
+    def is_running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self) -> None:
+        """Start renewing in the background (no-op if already running)"""
+        if self.is_running:
+            return
+        self._stop_event.clear()
+        self._thread = threading.Thread(target=self._run, name="haloitsm-token-renewer", daemon=True)
+        self._thread.start()
+        if self.logger:
+            self.logger.info("Background token renewal started")
+
+    def stop(self, timeout: float = 5) -> None:
+        """Stop the renewal thread and wait for it to exit"""
+        self._stop_event.set()
+        if self._thread is not None and self._thread is not threading.current_thread():
+            self._thread.join(timeout)
+        self._thread = None
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "refreshes": self.refreshes,
+            "failures": self.failures,
+            "last_error": self.last_error,
+            "running": self.is_running
+        }
+
+    def next_delay(self) -> float:
+        """Seconds until the next refresh is due for the client's current token"""
+        lifetime = self.client.token_lifetime
+        if not self.client.access_token or not lifetime:
+            return 0
+
+        offset = lifetime * self.refresh_fraction
+        offset += random.uniform(-self.jitter, self.jitter) * lifetime
+        # Always beat the lazy refresh in the request path
+        offset = min(offset, lifetime - LAZY_REFRESH_BUFFER - 1)
+        return max(0.0, self.client.token_issued_at + offset - time.time())
+
+    def _run(self) -> None:
+        delay = self.next_delay()
+        while not self._stop_event.wait(delay):
+            try:
+                self.client.refresh_token()
+                self.refreshes += 1
+                self.last_error = None
+                # Never spin, even if the server hands out very short-lived tokens
+                delay = max(1.0, self.next_delay())
+            except Exception as e:
+                self.failures += 1
+                self.last_error = str(e)
+                if self.logger:
+                    self.logger.warning(f"Background token renewal failed: {type(e).__name__}: {str(e)}")
+                delay = self.retry_interval
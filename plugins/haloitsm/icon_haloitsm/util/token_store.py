@@ -0,0 +1,143 @@
+import hashlib
+import json
+import os
+import tempfile
+import threading
+from contextlib import contextmanager
+from typing import Dict, Any, Optional
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - non-POSIX platforms fall back to in-process locking only
+    fcntl = None
+
+# Default location for the shared token cache (writable by the nobody user in the plugin image);
+# /tmp/haloitsm-token-cache unless TMPDIR points elsewhere. Tests and benchmarks pass their own store
+DEFAULT_TOKEN_CACHE_DIR = os.path.join(tempfile.gettempdir(), "haloitsm-token-cache")
+
+
+def token_store_key(auth_server: str, client_id: str, tenant: str, client_secret: str = "") -> str:
+    """
+    Stable cache key for one set of credentials - never embeds the secret
+
+    The secret only enters as a digest, so a client configured with a wrong
+    or revoked secret never picks up a token another client was issued.
+    """
+    secret = hashlib.sha256(client_secret.encode("utf-8")).hexdigest()
+    raw = f"{auth_server}|{client_id}|{tenant}|{secret}"
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+
+class TokenStore:
+    """
+    Pluggable store that lets several clients share one OAuth2 token
+
+    Records are dicts with access_token, issued_at, lifetime and expires_at.
+    lock(key) guards a refresh so only one holder hits /token at a time.
+    """
+
+    def load(self, key: str) -> Optional[Dict[str, Any]]:
+        raise NotImplementedError
+
+    def save(self, key: str, record: Dict[str, Any]) -> None:
+        raise NotImplementedError
+
+    def delete(self, key: str, access_token: Optional[str] = None) -> None:
+        """Remove the record, only if it still holds access_token when one is given"""
+        raise NotImplementedError
+
+    @contextmanager
+    def lock(self, key: str):
+        yield
+
+
+class MemoryTokenStore(TokenStore):
+    """Process-local store - shares a token between clients in the same worker"""
+
+    def __init__(self):
+        self._records = {}
+        self._lock = threading.Lock()
+
+    def load(self, key: str) -> Optional[Dict[str, Any]]:
+        record = self._records.get(key)
+        return dict(record) if record else None
+
+    def save(self, key: str, record: Dict[str, Any]) -> None:
+        self._records[key] = dict(record)
+
+    def delete(self, key: str, access_token: Optional[str] = None) -> None:
+        record = self._records.get(key)
+        if record and (access_token is None or record.get("access_token") == access_token):
+            self._records.pop(key, None)
+
+    @contextmanager
+    def lock(self, key: str):
+        with self._lock:
+            yield
+
+
+class FileTokenStore(TokenStore):
+    """
+    File-backed store shared across worker processes and container restarts
+
+    Each key gets a JSON file written atomically (temp file + os.replace) with
+    0600 permissions, and a sibling .lock file held with flock during refresh.
+    """
+
+    def __init__(self, directory: str = DEFAULT_TOKEN_CACHE_DIR):
+        self.directory = directory
+
+    def _path(self, key: str, suffix: str) -> str:
+        return os.path.join(self.directory, f"{key}{suffix}")
+
+    def _ensure_directory(self) -> None:
+        os.makedirs(self.directory, mode=0o700, exist_ok=True)
+
+    def load(self, key: str) -> Optional[Dict[str, Any]]:
+        try:
+            with open(self._path(key, ".json"), "r") as token_file:
+                record = json.load(token_file)
+        except (OSError, ValueError):
+            return None
+        return record if isinstance(record, dict) else None
+
+    def save(self, key: str, record: Dict[str, Any]) -> None:
+        self._ensure_directory()
+        fd, temp_path = tempfile.mkstemp(dir=self.directory, prefix=f".{key}.", suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w") as temp_file:
+                json.dump(record, temp_file)
+            os.replace(temp_path, self._path(key, ".json"))
+        except Exception:
+            if os.path.exists(temp_path):
+                os.unlink(temp_path)
+            raise
+
+    def delete(self, key: str, access_token: Optional[str] = None) -> None:
+        if access_token is not None:
+            record = self.load(key)
+            if not record or record.get("access_token") != access_token:
+                return
+        try:
+            os.unlink(self._path(key, ".json"))
+        except OSError:
+            pass
+
+    @contextmanager
+    def lock(self, key: str):
+        if fcntl is None:
+            yield
+            return
+        try:
+            self._ensure_directory()
+            lock_file = open(self._path(key, ".lock"), "a")
+        except OSError:
+            # Unwritable cache directory - fall back to in-process locking only
+            yield
+            return
+        with lock_file:
+            fcntl.flock(lock_file, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(lock_file, fcntl.LOCK_UN)
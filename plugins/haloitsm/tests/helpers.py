@@ -0,0 +1,40 @@
+import json
+from unittest.mock import Mock
+import requests
+from icon_haloitsm.util.api import HaloITSMAPI
+from icon_haloitsm.util.token_store import MemoryTokenStore
+
+RESOURCE_SERVER = "https://example.haloitsm.com/api"
+TOKEN_RESPONSE = {"access_token": "abc", "expires_in": 3600}
+
+
+def make_client(**kwargs) -> HaloITSMAPI:
+    """HaloITSMAPI for the example tenant with its own in-memory token store; kwargs override any argument"""
+    params = {
+        "client_id": "client",
+        "client_secret": "secret",
+        "auth_server": "https://example.haloitsm.com/auth",
+        "resource_server": RESOURCE_SERVER,
+        "tenant": "example",
+        "token_store": MemoryTokenStore()
+    }
+    params.update(kwargs)
+    return HaloITSMAPI(**params)
+
+
+def mock_session(client: HaloITSMAPI) -> Mock:
+    """Replace the client's pooled session with a Mock whose POSTs hand out a token"""
+    client.session = Mock()
+    client.session.post.return_value = make_response(json_data=TOKEN_RESPONSE)
+    return client.session
+
+
+def make_response(status_code: int = 200, json_data=None, headers=None) -> requests.Response:
+    """A real requests.Response with json_data as its body, as the session would return it"""
+    response = requests.Response()
+    response.status_code = status_code
+    response.headers.update(headers or {})
+    response.url = RESOURCE_SERVER
+    response._content = json.dumps(json_data).encode() if json_data is not None else b""
+    response._content_consumed = True
+    return response
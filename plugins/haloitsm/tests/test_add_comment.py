@@ -53,7 +53,7 @@ class TestAddComment(unittest.TestCase):
             "note_type_id": 1
         }
         self.action.connection.client.add_comment.assert_called_once_with(expected_note_data)
-        self.action.connection.client.get_ticket.assert_called_once_with(12345)
+        self.action.connection.client.get_ticket.assert_called_once_with(12345, use_cache=False)
         self.assertEqual(result[Output.TICKET], normalized_ticket)
         self.assertTrue(result[Output.SUCCESS])
     
@@ -0,0 +1,108 @@
+import sys
+import os
+sys.path.append(os.path.abspath('../'))
+
+import unittest
+from unittest.mock import Mock
+from insightconnect_plugin_runtime.exceptions import PluginException
+from icon_haloitsm.actions.add_comments.action import AddComments
+from icon_haloitsm.actions.add_comments.schema import Input, Output
+from tests.helpers import make_client
+
+
+class TestAddComments(unittest.TestCase):
+
+    def setUp(self):
+        self.action = AddComments()
+        self.action.connection = Mock()
+        self.action.logger = Mock()
+        self.action.connection.client.add_comments.side_effect = lambda notes, batch_size: [
+            {"index": i, "success": True, "item": dict(note, id=900 + i), "error": None}
+            for i, note in enumerate(notes)
+        ]
+
+    def test_add_comments_success(self):
+        """Test notes are sent in one call with defaults applied and no refetch"""
+        result = self.action.run({
+            Input.NOTES: [
+                {"ticket_id": 1, "note_html": "alert 1"},
+                {"ticket_id": 1, "note_html": "alert 2", "who_can_view_id": 2}
+            ],
+            Input.BATCH_SIZE: 10
+        })
+
+        notes, batch_size = self.action.connection.client.add_comments.call_args[0]
+        self.assertEqual(batch_size, 10)
+        self.assertEqual(notes[0], {"ticket_id": 1, "note_html": "alert 1", "outcome": "", "who_can_view_id": 1, "note_type_id": 1})
+        self.assertEqual(notes[1]["who_can_view_id"], 2)
+
+        self.assertTrue(result[Output.SUCCESS])
+        self.assertEqual(result[Output.ADDED_COUNT], 2)
+        self.assertEqual([r["note_id"] for r in result[Output.RESULTS]], [900, 901])
+        self.assertNotIn(Output.TICKETS, result)
+        self.action.connection.client.get_tickets.assert_not_called()
+
+    def test_invalid_notes_fail_individually(self):
+        """Test a note without content is reported without blocking the others"""
+        result = self.action.run({
+            Input.NOTES: [
+                {"ticket_id": 1, "note_html": "  "},
+                {"ticket_id": 2, "note_html": "alert"}
+            ]
+        })
+
+        self.assertEqual(result[Output.FAILED_COUNT], 1)
+        self.assertFalse(result[Output.RESULTS][0]["success"])
+        self.assertEqual(result[Output.RESULTS][1]["index"], 1)
+        self.assertEqual(result[Output.RESULTS][1]["ticket_id"], 2)
+        self.assertEqual(len(self.action.connection.client.add_comments.call_args[0][0]), 1)
+
+    def test_refetch_once_per_ticket(self):
+        """Test refetch fetches every commented ticket once, in one uncached call"""
+        self.action.connection.client.get_tickets.return_value = [{"id": 1}, {"id": 2}]
+        self.action.connection.client._normalize_ticket.side_effect = lambda ticket: ticket
+
+        result = self.action.run({
+            Input.NOTES: [
+                {"ticket_id": 1, "note_html": "a"},
+                {"ticket_id": 1, "note_html": "b"},
+                {"ticket_id": 2, "note_html": "c"}
+            ],
+            Input.REFETCH_TICKETS: True
+        })
+
+        self.action.connection.client.get_tickets.assert_called_once_with([1, 2], use_cache=False)
+        self.assertEqual(result[Output.TICKETS], [{"id": 1}, {"id": 2}])
+        self.assertTrue(result[Output.SUCCESS])
+
+    def test_refetch_failure_keeps_results(self):
+        """Test a failed refetch is logged without failing the added notes"""
+        self.action.connection.client.get_tickets.side_effect = Exception("gone")
+
+        result = self.action.run({
+            Input.NOTES: [{"ticket_id": 1, "note_html": "a"}],
+            Input.REFETCH_TICKETS: True
+        })
+
+        self.assertEqual(result[Output.TICKETS], [])
+        self.assertTrue(result[Output.SUCCESS])
+        self.action.logger.warning.assert_called_once()
+
+    def test_client_batches_notes(self):
+        """Test HaloITSMAPI.add_comments posts notes in chunks to /ticketnotes"""
+        client = make_client()
+        client.make_request = Mock(side_effect=[
+            [{"id": 1}, {"id": 2}],
+            PluginException(cause="Request timeout", assistance="slow")
+        ])
+
+        results = client.add_comments([{"note_html": str(i)} for i in range(3)], batch_size=2)
+
+        self.assertEqual(client.make_request.call_args_list[0].kwargs["endpoint"], "/ticketnotes")
+        self.assertEqual([result["success"] for result in results], [True, True, False])
+        self.assertEqual(results[1]["item"], {"id": 2})
+        self.assertIn("Request timeout", results[2]["error"])
+
+
+if __name__ == '__main__':
+    unittest.main()
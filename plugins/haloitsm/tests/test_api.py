@@ -0,0 +1,102 @@
+import sys
+import os
+sys.path.append(os.path.abspath('../'))
+
+import threading
+import time
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import Mock, patch
+import requests
+from tests.helpers import make_client, make_response
+
+
+class TestHaloITSMAPISession(unittest.TestCase):
+
+    def test_session_pool_configuration(self):
+        """Test the client owns a pooled keep-alive session"""
+        client = make_client(pool_connections=2, pool_maxsize=25, pool_block=True)
+
+        self.assertIsInstance(client.session, requests.Session)
+        adapter = client.session.get_adapter("https://example.haloitsm.com/api/tickets")
+        self.assertEqual(adapter._pool_connections, 2)
+        self.assertEqual(adapter._pool_maxsize, 25)
+        self.assertTrue(adapter._pool_block)
+
+    def test_requests_reuse_session(self):
+        """Test token and resource calls both go through the shared session"""
+        client = make_client()
+        client.session = Mock()
+        client.session.post.return_value = make_response(json_data={"access_token": "abc", "expires_in": 3600})
+        client.session.request.return_value = make_response(json_data={"id": 1})
+
+        with patch("requests.request") as module_request, patch("requests.post") as module_post:
+            client.get_ticket(1)
+            client.get_ticket(2)
+
+        module_request.assert_not_called()
+        module_post.assert_not_called()
+        self.assertEqual(client.session.post.call_count, 1)
+        self.assertEqual(client.session.request.call_count, 2)
+
+    def test_close_releases_session(self):
+        """Test close() closes the pooled session"""
+        client = make_client()
+        client.session = Mock()
+
+        client.close()
+
+        client.session.close.assert_called_once()
+
+
+class TestHaloITSMAPITokenRefresh(unittest.TestCase):
+
+    def setUp(self):
+        self.client = make_client()
+        self.client.session = Mock()
+        self.token_calls = 0
+        self.lock = threading.Lock()
+
+        def post(*args, **kwargs):
+            # Slow token endpoint so concurrent callers pile up behind the refresh
+            time.sleep(0.05)
+            with self.lock:
+                self.token_calls += 1
+                token = f"token-{self.token_calls}"
+            return make_response(json_data={"access_token": token, "expires_in": 3600})
+
+        self.client.session.post.side_effect = post
+
+    def test_single_token_request_under_concurrency(self):
+        """Test 100 parallel requests trigger exactly one token call"""
+        self.client.session.request.return_value = make_response(json_data={"id": 1})
+
+        with ThreadPoolExecutor(max_workers=100) as pool:
+            results = list(pool.map(lambda i: self.client.get_ticket(i), range(100)))
+
+        self.assertEqual(len(results), 100)
+        self.assertEqual(self.token_calls, 1)
+        self.assertEqual(self.client.session.request.call_count, 100)
+
+    def test_401_invalidates_only_failed_generation(self):
+        """Test concurrent 401s on the same token cause a single refresh"""
+        self.client.get_access_token()
+        self.assertEqual(self.token_calls, 1)
+
+        def request(*args, **kwargs):
+            if kwargs["headers"]["Authorization"] == "Bearer token-1":
+                return make_response(status_code=401)
+            return make_response(json_data={"id": 1})
+
+        self.client.session.request.side_effect = request
+
+        with ThreadPoolExecutor(max_workers=100) as pool:
+            results = list(pool.map(lambda i: self.client.get_ticket(i), range(100)))
+
+        self.assertTrue(all(result == {"id": 1} for result in results))
+        self.assertEqual(self.token_calls, 2)
+        self.assertEqual(self.client.access_token, "token-2")
+
+
+if __name__ == '__main__':
+    unittest.main()
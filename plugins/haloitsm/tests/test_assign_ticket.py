@@ -47,7 +47,7 @@ class TestAssignTicket(unittest.TestCase):
             "agent_id": 100
         }
         self.action.connection.client.update_ticket.assert_called_once_with(expected_assignment_data)
-        self.action.connection.client.get_ticket.assert_called_once_with(12345)
+        self.action.connection.client.get_ticket.assert_called_once_with(12345, use_cache=False)
         self.assertEqual(result[Output.TICKET], normalized_ticket)
         self.assertTrue(result[Output.SUCCESS])
     
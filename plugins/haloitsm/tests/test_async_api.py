@@ -0,0 +1,185 @@
+import sys
+import os
+sys.path.append(os.path.abspath('../'))
+
+import asyncio
+import time
+import unittest
+from unittest.mock import Mock, patch
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+from icon_haloitsm.util.async_api import AsyncHaloITSMAPI
+from icon_haloitsm.util.reference_data import ReferenceData
+from icon_haloitsm.util.retry import RetryPolicy
+from insightconnect_plugin_runtime.exceptions import PluginException
+from tests.helpers import make_client
+
+
+class StubHalo:
+    """Minimal aiohttp stand-in for the HaloITSM auth and resource servers"""
+
+    def __init__(self, delay=0.0, fail_first=0, fail_status=503, retry_after=None):
+        self.delay = delay
+        self.fail_first = fail_first
+        self.fail_status = fail_status
+        self.retry_after = retry_after
+        self.token_calls = 0
+        self.ticket_calls = 0
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def token(self, request):
+        self.token_calls += 1
+        return web.json_response({"access_token": "abc", "expires_in": 3600})
+
+    async def ticket(self, request):
+        self.ticket_calls += 1
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(self.delay)
+        finally:
+            self.in_flight -= 1
+        if self.ticket_calls <= self.fail_first:
+            headers = {"Retry-After": self.retry_after} if self.retry_after else None
+            return web.json_response({"error": "unavailable"}, status=self.fail_status, headers=headers)
+        ticket_id = int(request.match_info["ticket_id"])
+        return web.json_response({"id": ticket_id, "summary": f"Ticket {ticket_id}"})
+
+    def app(self):
+        app = web.Application()
+        app.router.add_post("/auth/token", self.token)
+        app.router.add_get("/api/tickets/{ticket_id}", self.ticket)
+        return app
+
+
+async def run_against(stub, scenario, **client_kwargs):
+    server = TestServer(stub.app())
+    await server.start_server()
+    base = str(server.make_url("")).rstrip("/")
+    try:
+        async with AsyncHaloITSMAPI(
+            client_id="client",
+            client_secret="secret",
+            auth_server=f"{base}/auth",
+            resource_server=f"{base}/api",
+            tenant="example",
+            **client_kwargs
+        ) as client:
+            return await scenario(client)
+    finally:
+        await server.close()
+
+
+class TestAsyncHaloITSMAPI(unittest.TestCase):
+
+    def test_get_tickets_fan_out_is_concurrent(self):
+        """Test 50 ticket fetches overlap instead of running serially"""
+        stub = StubHalo(delay=0.1)
+
+        start = time.monotonic()
+        tickets = asyncio.run(run_against(stub, lambda client: client.get_tickets(list(range(1, 51)))))
+        elapsed = time.monotonic() - start
+
+        self.assertEqual([ticket["id"] for ticket in tickets], list(range(1, 51)))
+        self.assertLess(elapsed, 2.5)
+        self.assertGreater(stub.max_in_flight, 1)
+
+    def test_concurrency_is_bounded(self):
+        """Test the semaphore caps requests in flight"""
+        stub = StubHalo(delay=0.02)
+
+        asyncio.run(run_against(stub, lambda client: client.get_tickets(list(range(1, 31))), max_concurrency=5))
+
+        self.assertLessEqual(stub.max_in_flight, 5)
+
+    def test_retry_does_not_block_event_loop(self):
+        """Test retries sleep with asyncio rather than time.sleep"""
+        stub = StubHalo(fail_first=1)
+
+        with patch("time.sleep") as blocking_sleep:
+            ticket = asyncio.run(run_against(stub, lambda client: client.get_ticket(7)))
+
+        blocking_sleep.assert_not_called()
+        self.assertEqual(ticket["id"], 7)
+        self.assertEqual(stub.ticket_calls, 2)
+
+    def test_retry_honours_retry_after(self):
+        """Test a 429 waits at least the Retry-After HaloITSM asked for"""
+        stub = StubHalo(fail_first=1, fail_status=429, retry_after="0.5")
+        policy = RetryPolicy()
+        policy.backoff = lambda attempt: 0
+
+        start = time.monotonic()
+        ticket = asyncio.run(run_against(stub, lambda client: client.get_ticket(7), retry_policy=policy))
+
+        self.assertGreaterEqual(time.monotonic() - start, 0.5)
+        self.assertEqual(ticket["id"], 7)
+        self.assertEqual(stub.ticket_calls, 2)
+
+    def test_error_raises_plugin_exception(self):
+        """Test exhausted retries surface a PluginException"""
+        stub = StubHalo(fail_first=10)
+
+        async def scenario(client):
+            return await client.make_request("GET", "/tickets/1", retry_count=1)
+
+        with self.assertRaises(PluginException) as context:
+            asyncio.run(run_against(stub, scenario))
+
+        self.assertIn("503", context.exception.cause)
+
+
+class TestAsyncNormalization(unittest.TestCase):
+
+    TICKET = {
+        "id": 5, "summary": "Disk full", "details": "On db01", "status_id": 1, "priority_id": 2,
+        "tickettype_id": 3, "team_id": 15, "agent_id": 42,
+        "agent": {"name": "Ann", "emailaddress": "ann@example.com"}, "client": {"name": "Acme"},
+        "dateoccurred": "2025-11-06T15:00:00Z", "dateupdated": "2025-11-06T15:05:00Z", "category_1": "Hardware"
+    }
+
+    def make_clients(self, reference_data=None):
+        kwargs = dict(client_id="client", client_secret="secret", auth_server="https://halo/auth", resource_server="https://halo/api", tenant="t")
+        sync_client = make_client(**kwargs)
+        self.addCleanup(sync_client.close)
+        sync_client.reference_data = reference_data
+        return sync_client, AsyncHaloITSMAPI(reference_data=reference_data, **kwargs)
+
+    def test_matches_sync_client(self):
+        """Test the async client normalizes a ticket exactly like the sync client"""
+        sync_client, async_client = self.make_clients()
+        normalized = async_client._normalize_ticket(self.TICKET)
+
+        self.assertEqual(normalized, sync_client._normalize_ticket(self.TICKET))
+        self.assertEqual((normalized["agent_name"], normalized["status_id"], normalized["client_name"]), ("Ann", 1, "Acme"))
+
+    def test_matches_sync_client_with_reference_data(self):
+        """Test names resolved from shared reference data appear in the async output too"""
+        halo = Mock()
+        halo.make_request.side_effect = lambda method, endpoint, **kwargs: {
+            "/tickettype": [{"id": 3, "name": "Incident"}],
+            "/priority": [{"priorityid": 2, "name": "High"}],
+            "/status": [{"id": 1, "name": "New"}],
+            "/team": [{"id": 15, "name": "SOC Team"}]
+        }[endpoint]
+        sync_client, async_client = self.make_clients(ReferenceData(halo, background=False))
+        self.assertTrue(asyncio.run(async_client.load_reference_data()))
+        normalized = async_client._normalize_ticket(self.TICKET)
+
+        self.assertEqual(normalized, sync_client._normalize_ticket(self.TICKET))
+        self.assertEqual((normalized["status_name"], normalized["priority_name"], normalized["team_name"]), ("New", "High", "SOC Team"))
+
+    def test_lookups_never_load_on_event_loop(self):
+        """Test normalizing before load_reference_data leaves names empty instead of loading"""
+        halo = Mock()
+        _, async_client = self.make_clients(ReferenceData(halo, background=False))
+
+        normalized = async_client._normalize_ticket(self.TICKET)
+
+        self.assertEqual(normalized["status_name"], "")
+        halo.make_request.assert_not_called()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,129 @@
+import sys
+import os
+sys.path.append(os.path.abspath('../'))
+
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import Mock
+from icon_haloitsm.util.api import HaloITSMAPIError
+from icon_haloitsm.util.batch_loader import BatchLoader
+from tests.helpers import make_client
+
+
+class TestBatchLoader(unittest.TestCase):
+
+    def test_calls_in_window_are_batched(self):
+        batch_fn = Mock(side_effect=lambda keys: {key: key * 2 for key in keys})
+        loader = BatchLoader(batch_fn, window=0.05)
+
+        with ThreadPoolExecutor(max_workers=20) as executor:
+            results = list(executor.map(loader.load, range(20)))
+
+        self.assertEqual(results, [key * 2 for key in range(20)])
+        self.assertEqual(batch_fn.call_count, 1)
+        self.assertEqual(sorted(batch_fn.call_args[0][0]), list(range(20)))
+
+    def test_full_batch_sent_early(self):
+        batch_fn = Mock(side_effect=lambda keys: {key: key for key in keys})
+        loader = BatchLoader(batch_fn, window=60, max_batch_size=3)
+
+        self.assertEqual(loader.load_many([1, 2, 3], timeout=1), [1, 2, 3])
+
+    def test_duplicate_keys_fetched_once(self):
+        batch_fn = Mock(side_effect=lambda keys: {key: key for key in keys})
+        loader = BatchLoader(batch_fn, window=0.01)
+
+        self.assertEqual(loader.load_many([1, 1, 2]), [1, 1, 2])
+        self.assertEqual(batch_fn.call_args[0][0], [1, 2])
+        self.assertEqual(loader.stats()["loads"], 3)
+
+    def test_errors_are_per_key(self):
+        loader = BatchLoader(lambda keys: {1: "ok", 2: ValueError("bad")}, window=0.01)
+        one, two, three = loader.submit(1), loader.submit(2), loader.submit(3)
+
+        self.assertEqual(one.result(1), "ok")
+        self.assertRaises(ValueError, two.result, 1)
+        self.assertRaises(KeyError, three.result, 1)
+
+
+class TestBatchedGetTicket(unittest.TestCase):
+
+    def setUp(self):
+        self.client = make_client(ticket_batch_window=0.05)
+
+    def _serve(self, list_response=None, missing=()):
+        def request(method, endpoint, params=None, **kwargs):
+            if endpoint == "/tickets":
+                if isinstance(list_response, Exception):
+                    raise list_response
+                ids = params["ticketids"].split(",")
+                return list_response or {"tickets": [{"id": int(i)} for i in ids if int(i) not in missing]}
+            ticket_id = int(endpoint.rsplit("/", 1)[1])
+            if ticket_id in missing:
+                raise HaloITSMAPIError(status_code=404, cause="HaloITSM API error 404", assistance="not found")
+            return {"id": ticket_id, "single": True}
+
+        self.client.make_request = Mock(side_effect=request)
+
+    def _get_concurrently(self, ticket_ids):
+        with ThreadPoolExecutor(max_workers=len(ticket_ids)) as executor:
+            futures = [executor.submit(self.client.get_ticket, ticket_id) for ticket_id in ticket_ids]
+            return [future.exception() or future.result() for future in futures]
+
+    def test_one_list_request(self):
+        """Test concurrent lookups become a single /tickets?ticketids= request"""
+        self._serve()
+
+        results = self._get_concurrently(list(range(1, 31)))
+
+        self.assertEqual([ticket["id"] for ticket in results], list(range(1, 31)))
+        self.client.make_request.assert_called_once()
+        params = self.client.make_request.call_args.kwargs["params"]
+        self.assertEqual(sorted(map(int, params["ticketids"].split(","))), list(range(1, 31)))
+
+    def test_missing_ticket_fails_only_its_caller(self):
+        self._serve(missing={2})
+
+        results = self._get_concurrently([1, 2, 3])
+
+        self.assertEqual(results[0], {"id": 1})
+        self.assertIsInstance(results[1], HaloITSMAPIError)
+        self.assertEqual(results[1].status_code, 404)
+        self.assertEqual(results[2], {"id": 3})
+
+    def test_fan_out_when_filter_rejected(self):
+        self._serve(list_response=HaloITSMAPIError(status_code=400, cause="HaloITSM API error 400", assistance="unknown parameter"))
+
+        results = self._get_concurrently([1, 2, 3])
+
+        self.assertTrue(all(ticket["single"] for ticket in results))
+        self.assertFalse(self.client.ticket_id_filter)
+
+    def test_fan_out_when_filter_ignored(self):
+        self._serve(list_response={"tickets": [{"id": 99}]})
+
+        self.assertEqual(self.client.get_tickets([1, 2]), [{"id": 1, "single": True}, {"id": 2, "single": True}])
+        self.assertFalse(self.client.ticket_id_filter)
+
+    def test_bypass(self):
+        self._serve()
+
+        self.client.get_ticket(5, use_cache=False)
+
+        self.assertEqual(self.client.make_request.call_args.kwargs["endpoint"], "/tickets/5")
+        self.assertEqual(self.client.ticket_loader.stats()["loads"], 0)
+
+    def test_get_tickets_bypass(self):
+        """Test use_cache=False fetches every ID with one uncached list request"""
+        self._serve()
+
+        self.assertEqual(self.client.get_tickets([2, 1, 2], use_cache=False), [{"id": 2}, {"id": 1}, {"id": 2}])
+
+        self.client.make_request.assert_called_once()
+        self.assertEqual(self.client.make_request.call_args.kwargs["params"]["ticketids"], "2,1")
+        self.assertFalse(self.client.make_request.call_args.kwargs["cache"])
+        self.assertEqual(self.client.ticket_loader.stats()["loads"], 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
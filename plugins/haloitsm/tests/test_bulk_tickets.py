@@ -0,0 +1,193 @@
+import sys
+import os
+sys.path.append(os.path.abspath('../'))
+
+import unittest
+from unittest.mock import Mock
+from insightconnect_plugin_runtime.exceptions import PluginException
+from icon_haloitsm.util.api import HaloITSMAPIError
+from icon_haloitsm.actions.create_tickets.action import CreateTickets
+from icon_haloitsm.actions.create_tickets.schema import Input as CreateInput, Output as CreateOutput
+from icon_haloitsm.actions.update_tickets.action import UpdateTickets
+from icon_haloitsm.actions.update_tickets.schema import Input as UpdateInput, Output as UpdateOutput
+from tests.helpers import make_client
+
+
+def echo_tickets(method, endpoint, json_data=None, **kwargs):
+    """Stand-in for POST /tickets: returns the submitted tickets with ids assigned"""
+    return [dict(ticket, id=ticket.get("id") or 1000 + index) for index, ticket in enumerate(json_data)]
+
+
+class TestBatchedTicketsAPI(unittest.TestCase):
+
+    def setUp(self):
+        self.client = make_client()
+        self.client.make_request = Mock(side_effect=echo_tickets)
+
+    def test_create_tickets_chunks_requests(self):
+        """Test tickets are sent batch_size per request and mapped back in order"""
+        tickets = [{"summary": f"alert {i}"} for i in range(7)]
+
+        results = self.client.create_tickets(tickets, batch_size=3)
+
+        self.assertEqual(self.client.make_request.call_count, 3)
+        self.assertEqual([len(call.kwargs["json_data"]) for call in self.client.make_request.call_args_list], [3, 3, 1])
+        self.assertEqual([result["index"] for result in results], list(range(7)))
+        self.assertTrue(all(result["success"] for result in results))
+        self.assertEqual(results[4]["item"]["summary"], "alert 4")
+
+    def test_create_batch_failure_fails_whole_batch(self):
+        """Test a failed create batch is reported per item and not re-sent"""
+        def fail_second_batch(method, endpoint, json_data=None, **kwargs):
+            if json_data[0]["summary"] == "alert 2":
+                raise PluginException(cause="HaloITSM API error 400", assistance="Invalid ticket type")
+            return echo_tickets(method, endpoint, json_data)
+
+        self.client.make_request.side_effect = fail_second_batch
+
+        results = self.client.create_tickets([{"summary": f"alert {i}"} for i in range(4)], batch_size=2)
+
+        self.assertEqual([result["success"] for result in results], [True, True, False, False])
+        self.assertIn("HaloITSM API error 400", results[3]["error"])
+        self.assertEqual(self.client.make_request.call_count, 2)
+
+    def test_short_response_marks_missing_items(self):
+        """Test tickets without a matching response entry are failures"""
+        self.client.make_request.side_effect = lambda *args, **kwargs: [{"id": 1}]
+
+        results = self.client.create_tickets([{"summary": "a"}, {"summary": "b"}])
+
+        self.assertFalse(results[0]["success"])
+        self.assertIn("no result", results[1]["error"])
+
+    def test_update_tickets_isolates_bad_items(self):
+        """Test a rejected update batch is retried per ticket to find the bad one"""
+        def reject_ticket_2(method, endpoint, json_data=None, **kwargs):
+            if any(ticket["id"] == 2 for ticket in json_data):
+                raise HaloITSMAPIError(status_code=400, cause="HaloITSM API error 400", assistance="Ticket 2 is closed")
+            return echo_tickets(method, endpoint, json_data)
+
+        self.client.make_request.side_effect = reject_ticket_2
+        tickets = [{"id": 1, "summary": "a"}, {"summary": "no id"}, {"id": 2}, {"id": 3}]
+
+        results = self.client.update_tickets(tickets, batch_size=10)
+
+        self.assertEqual([result["success"] for result in results], [True, False, False, True])
+        self.assertIn("'id'", results[1]["error"])
+        self.assertIn("Ticket 2 is closed", results[2]["error"])
+        self.assertEqual([result["index"] for result in results], [0, 1, 2, 3])
+        self.assertTrue(all(call.kwargs["idempotent"] for call in self.client.make_request.call_args_list))
+
+    def test_update_batch_transport_failure_is_not_split(self):
+        """Test a timed out or unavailable batch fails its tickets without re-sending each one"""
+        for error in [
+            PluginException(cause="Request timeout", assistance="HaloITSM did not answer"),
+            HaloITSMAPIError(status_code=503, cause="HaloITSM API error 503", assistance="Unavailable"),
+            HaloITSMAPIError(status_code=429, cause="HaloITSM API error 429", assistance="Slow down")
+        ]:
+            self.client.make_request = Mock(side_effect=error)
+
+            results = self.client.update_tickets([{"id": 1}, {"id": 2}, {"id": 3}], batch_size=10)
+
+            self.assertEqual(self.client.make_request.call_count, 1, error.cause)
+            self.assertEqual([result["success"] for result in results], [False] * 3)
+            self.assertEqual([result["index"] for result in results], [0, 1, 2])
+            self.assertIn(error.assistance, results[2]["error"])
+
+    def test_update_matches_by_id(self):
+        """Test update results are paired by ticket id when HaloITSM reorders them"""
+        self.client.make_request.side_effect = lambda *args, **kwargs: [{"id": 2, "summary": "two"}, {"id": 1, "summary": "one"}]
+
+        results = self.client.update_tickets([{"id": 1}, {"id": 2}])
+
+        self.assertEqual(results[0]["item"]["summary"], "one")
+        self.assertEqual(results[1]["item"]["summary"], "two")
+
+
+class TestBulkTicketActions(unittest.TestCase):
+
+    def make_connection(self):
+        connection = Mock()
+        connection.default_ticket_type_id = None
+        connection.default_priority_id = 3
+        connection.default_team_id = None
+        connection.default_agent_id = None
+        connection.default_category_id = None
+        connection.client.create_tickets.side_effect = lambda payloads, batch_size: [
+            {"index": i, "success": True, "item": dict(payload, id=500 + i), "error": None}
+            for i, payload in enumerate(payloads)
+        ]
+        return connection
+
+    def test_create_tickets_action(self):
+        """Test connection defaults apply per ticket and invalid tickets fail alone"""
+        action = CreateTickets()
+        action.connection = self.make_connection()
+        action.logger = Mock()
+
+        result = action.run({
+            CreateInput.TICKETS: [
+                {"summary": "a", "details": "x", "tickettype_id": 1},
+                {"summary": "b", "details": "y"},
+                {"summary": "c", "details": "z", "tickettype_id": 2}
+            ],
+            CreateInput.BATCH_SIZE: 25
+        })
+
+        payloads, batch_size = action.connection.client.create_tickets.call_args[0]
+        self.assertEqual(batch_size, 25)
+        self.assertEqual([payload["summary"] for payload in payloads], ["a", "c"])
+        self.assertEqual(payloads[0]["priority_id"], 3)
+
+        self.assertEqual(result[CreateOutput.CREATED_COUNT], 2)
+        self.assertEqual(result[CreateOutput.FAILED_COUNT], 1)
+        self.assertFalse(result[CreateOutput.SUCCESS])
+        self.assertEqual(result[CreateOutput.RESULTS][2]["index"], 2)
+        self.assertEqual(result[CreateOutput.RESULTS][2]["ticket"]["summary"], "c")
+        self.assertIn("Missing ticket type ID", result[CreateOutput.RESULTS][1]["error"])
+
+    def test_update_tickets_action(self):
+        action = UpdateTickets()
+        action.connection = Mock()
+        action.connection.client.update_tickets.return_value = [
+            {"index": 0, "success": True, "item": {"id": 7, "summary": "done"}, "error": None}
+        ]
+        action.logger = Mock()
+
+        result = action.run({UpdateInput.TICKETS: [{"ticket_id": 7, "status_id": 9}]})
+
+        payloads, batch_size = action.connection.client.update_tickets.call_args[0]
+        self.assertEqual(payloads, [{"id": 7, "actioncode": 1, "status_id": 9}])
+        self.assertEqual(batch_size, 50)
+        self.assertTrue(result[UpdateOutput.SUCCESS])
+        self.assertEqual(result[UpdateOutput.UPDATED_COUNT], 1)
+        self.assertEqual(result[UpdateOutput.RESULTS][0]["error"], "")
+
+    def test_update_tickets_action_validates_reference_ids(self):
+        """Test an unknown priority fails its own ticket like Update Ticket and the rest are still sent"""
+        action = UpdateTickets()
+        action.connection = Mock()
+
+        def validate_ticket(payload):
+            if payload.get("priority_id") == 99:
+                raise PluginException(cause="Unknown priority ID 99", assistance="Use 1")
+
+        action.connection.client.reference_data.validate_ticket.side_effect = validate_ticket
+        action.connection.client.update_tickets.side_effect = lambda payloads, batch_size: [
+            {"index": i, "success": True, "item": {"id": payload["id"]}, "error": None}
+            for i, payload in enumerate(payloads)
+        ]
+        action.logger = Mock()
+
+        result = action.run({UpdateInput.TICKETS: [{"ticket_id": 7, "priority_id": 99}, {"ticket_id": 8, "priority_id": 1}]})
+
+        payloads, _ = action.connection.client.update_tickets.call_args[0]
+        self.assertEqual([payload["id"] for payload in payloads], [8])
+        self.assertEqual([entry["index"] for entry in result[UpdateOutput.RESULTS]], [0, 1])
+        self.assertEqual(result[UpdateOutput.RESULTS][0]["error"], "Unknown priority ID 99. Use 1")
+        self.assertEqual(result[UpdateOutput.RESULTS][1]["ticket"]["id"], 8)
+        self.assertEqual(result[UpdateOutput.FAILED_COUNT], 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
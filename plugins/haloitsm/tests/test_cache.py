@@ -0,0 +1,121 @@
+import sys
+import os
+sys.path.append(os.path.abspath('../'))
+
+import unittest
+from unittest.mock import Mock, patch
+from insightconnect_plugin_runtime.exceptions import PluginException
+from icon_haloitsm.util.api import HaloITSMAPIError
+from icon_haloitsm.util.cache import TTLCache
+from tests.helpers import make_client
+
+
+class TestTTLCache(unittest.TestCase):
+
+    def test_lru_eviction(self):
+        cache = TTLCache(maxsize=2)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")
+        cache.set("c", 3)
+
+        self.assertEqual(cache.get("b"), (False, None))
+        self.assertEqual(cache.get("a"), (True, 1))
+        self.assertEqual(cache.stats()["evictions"], 1)
+
+    def test_ttl_expiry(self):
+        cache = TTLCache(ttl=10)
+        with patch("icon_haloitsm.util.cache.time.monotonic", return_value=100.0):
+            cache.set("a", 1)
+        with patch("icon_haloitsm.util.cache.time.monotonic", return_value=111.0):
+            self.assertEqual(cache.get("a"), (False, None))
+        self.assertEqual(cache.stats()["expirations"], 1)
+
+    def test_negative_entries_use_negative_ttl(self):
+        cache = TTLCache(ttl=300, negative_ttl=5)
+        loader = Mock(return_value=None)
+        with patch("icon_haloitsm.util.cache.time.monotonic", return_value=0.0):
+            self.assertIsNone(cache.get_or_load("missing", loader, ttl=300))
+            self.assertIsNone(cache.get_or_load("missing", loader, ttl=300))
+        self.assertEqual(loader.call_count, 1)
+        with patch("icon_haloitsm.util.cache.time.monotonic", return_value=6.0):
+            cache.get_or_load("missing", loader)
+        self.assertEqual(loader.call_count, 2)
+        self.assertEqual(cache.stats()["negative_hits"], 1)
+
+    def test_values_are_copied(self):
+        """Test a caller mutating a result does not change the cached entry"""
+        cache = TTLCache()
+        cache.get_or_load("a", lambda: {"name": "Alice"})["name"] = "changed"
+
+        self.assertEqual(cache.get("a"), (True, {"name": "Alice"}))
+
+    def test_invalidation(self):
+        cache = TTLCache()
+        cache.set(("agent", "1"), {})
+        cache.set(("agent", "2"), {})
+        cache.set(("user", "1"), {})
+
+        self.assertTrue(cache.invalidate(("user", "1")))
+        self.assertFalse(cache.invalidate(("user", "1")))
+        self.assertEqual(cache.invalidate_where(lambda key: key[0] == "agent"), 2)
+        self.assertEqual(len(cache), 0)
+        self.assertEqual(cache.stats()["invalidations"], 3)
+
+
+class TestEntityCache(unittest.TestCase):
+
+    def setUp(self):
+        self.client = make_client()
+        self.client.make_request = Mock(return_value=[{"id": 5, "name": "Alice"}])
+
+    def test_agent_read_through(self):
+        """Test an agent is requested once and then served from the cache"""
+        first = self.client.get_agent(5)
+        second = self.client.get_agent("5")
+
+        self.assertEqual(first, {"id": 5, "name": "Alice"})
+        self.assertEqual(second, first)
+        self.client.make_request.assert_called_once_with(method="GET", endpoint="/agent/5")
+        self.assertEqual(self.client.entity_cache.stats()["hits"], 1)
+
+    def test_agents_and_users_do_not_collide(self):
+        self.client.get_agent(5)
+        self.client.get_user(5)
+
+        self.assertEqual(self.client.make_request.call_count, 2)
+        self.assertEqual(self.client.make_request.call_args.kwargs["endpoint"], "/users/5")
+
+    def test_not_found_is_cached(self):
+        """Test a 404 is remembered instead of asking HaloITSM again"""
+        self.client.make_request.side_effect = HaloITSMAPIError(
+            status_code=404, cause="HaloITSM API error 404", assistance="not found"
+        )
+
+        self.assertIsNone(self.client.get_user(9))
+        self.assertIsNone(self.client.get_user(9))
+        self.assertEqual(self.client.make_request.call_count, 1)
+        self.assertEqual(self.client.entity_cache.stats()["negative_hits"], 1)
+
+    def test_other_errors_are_not_cached(self):
+        self.client.make_request.side_effect = [
+            HaloITSMAPIError(status_code=500, cause="HaloITSM API error 500", assistance="boom"),
+            {"id": 9}
+        ]
+
+        with self.assertRaises(PluginException):
+            self.client.get_user(9)
+        self.assertEqual(self.client.get_user(9), {"id": 9})
+
+    def test_invalidate_and_bypass(self):
+        self.client.get_agent(5)
+        self.client.invalidate_entity("agent", 5)
+        self.client.get_agent(5)
+        self.client.get_agent(5, use_cache=False)
+
+        self.assertEqual(self.client.make_request.call_count, 3)
+        self.assertEqual(self.client.invalidate_entity("agent"), 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
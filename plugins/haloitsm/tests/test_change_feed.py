@@ -0,0 +1,377 @@
+import sys
+import os
+sys.path.append(os.path.abspath('../'))
+
+import threading
+import unittest
+from datetime import datetime, timedelta, timezone
+from unittest.mock import Mock
+from insightconnect_plugin_runtime.exceptions import PluginException
+from icon_haloitsm.util.change_feed import ChangeFeed
+from icon_haloitsm.util.poller import MemoryPollStateStore, TicketPoller, format_halo_date
+from icon_haloitsm.util.snapshot_store import snapshot_of
+from icon_haloitsm.triggers.ticket_created.trigger import TicketCreated
+from icon_haloitsm.triggers.ticket_status_changed.trigger import TicketStatusChanged
+from icon_haloitsm.triggers.ticket_updated.trigger import TicketUpdated
+
+START = datetime(2025, 11, 6, 15, 0, 0, tzinfo=timezone.utc)
+
+
+class FakeHalo:
+    """Stands in for HaloITSMAPI.iter_tickets and counts the /tickets scans"""
+
+    def __init__(self):
+        self.tickets = []
+        self.scans = 0
+
+    def iter_tickets(self, filters, page_size, normalize):
+        self.scans += 1
+        self.last_filters = filters
+        ticket_ids = filters.get("ticketids")
+        if ticket_ids:
+            wanted = ticket_ids.split(",")
+            return iter([ticket for ticket in self.tickets if str(ticket["id"]) in wanted])
+        return iter(list(self.tickets))
+
+
+def collect(subscription):
+    """Consume a subscription on a thread, as a trigger would; join the thread after closing it"""
+    changes = []
+    thread = threading.Thread(target=lambda: changes.extend(subscription), daemon=True)
+    thread.start()
+    return changes, thread
+
+
+def make_feed(halo, background=False, seed=False):
+    poller = TicketPoller(halo, "feed", store=MemoryPollStateStore(), overlap=60, start=START)
+    return ChangeFeed(poller, min_interval=0, background=background, seed=seed)
+
+
+class TestChangeFeed(unittest.TestCase):
+
+    def setUp(self):
+        self.halo = FakeHalo()
+        self.feed = make_feed(self.halo)
+        self.addCleanup(self.feed.close)
+
+    def test_one_scan_fans_out_to_every_subscriber(self):
+        """Test each poll reads HaloITSM once however many subscribers there are"""
+        subscriptions = [self.feed.subscribe(3600) for _ in range(5)]
+        consumers = [collect(subscription) for subscription in subscriptions]
+        self.halo.tickets = [{"id": 1, "dateupdated": "2025-11-06T15:00:10Z", "dateoccurred": "2025-11-06T15:00:10Z"}]
+
+        self.feed.poll_once()
+
+        self.assertEqual(self.halo.scans, 1)
+        for subscription, (changes, thread) in zip(subscriptions, consumers):
+            subscription.close()
+            thread.join(timeout=5)
+            self.assertEqual([(change.ticket, change.created) for change in changes], [(self.halo.tickets[0], True)])
+
+    def test_interval_is_smallest_subscriber_interval(self):
+        """Test the feed polls at the fastest subscriber's pace, bounded below"""
+        self.feed.min_interval = 10
+        self.feed.subscribe(120)
+        self.feed.subscribe(30)
+        self.assertEqual(self.feed.interval(), 30)
+        self.feed.subscribe(1)
+        self.assertEqual(self.feed.interval(), 10)
+
+    def test_background_thread_polls_and_stops_with_last_subscriber(self):
+        """Test the first subscription starts polling and closing the last one stops it"""
+        self.feed.background = True
+        self.halo.tickets = [{"id": 1, "dateupdated": "2025-11-06T15:00:10Z"}]
+        subscription = self.feed.subscribe(3600)
+
+        change = next(iter(subscription))
+        self.assertEqual(change.ticket["id"], 1)
+        self.assertFalse(change.created)
+
+        thread = self.feed._thread
+        subscription.close()
+        thread.join(timeout=5)
+        self.assertFalse(thread.is_alive())
+        self.assertIsNone(self.feed._thread)
+        self.assertEqual(self.halo.scans, 1)
+
+    def test_changes_carry_previous_snapshot(self):
+        """Test the second change of a ticket knows its status and agent from before"""
+        subscription = self.feed.subscribe(3600)
+        changes, thread = collect(subscription)
+        self.halo.tickets = [{"id": 7, "dateupdated": "2025-11-06T15:00:10Z", "status_id": 1, "agent_id": 3}]
+        self.feed.poll_once()
+        self.halo.tickets = [{"id": 7, "dateupdated": "2025-11-06T15:00:40Z", "status_id": 2, "agent_id": 5}]
+        self.feed.poll_once()
+        subscription.close()
+        thread.join(timeout=5)
+
+        first, second = changes
+        self.assertIsNone(first.previous)
+        self.assertEqual((second.previous.status_id, second.previous.agent_id), (1, 3))
+        self.assertEqual((second.current.status_id, second.current.agent_id), (2, 5))
+        self.assertNotEqual(second.previous.digest, second.current.digest)
+
+    def test_rejected_change_is_offered_again(self):
+        """Test a change a subscriber rejects keeps the watermark and snapshot and comes back next poll"""
+        subscription = self.feed.subscribe(3600)
+        received = []
+
+        def consume():
+            for change in subscription:
+                received.append(change)
+                if len(received) == 1:
+                    subscription.reject()
+
+        thread = threading.Thread(target=consume, daemon=True)
+        thread.start()
+        self.halo.tickets = [{"id": 7, "dateupdated": "2025-11-06T15:00:10Z", "status_id": 1}]
+
+        with self.assertRaises(PluginException):
+            self.feed.poll_once()
+        self.assertEqual(self.feed.poller.watermark, START)
+        self.assertIsNone(self.feed.snapshots.get(7))
+
+        self.feed.poll_once()
+        subscription.close()
+        thread.join(timeout=5)
+        self.assertEqual([change.ticket["id"] for change in received], [7, 7])
+        self.assertEqual(self.feed.snapshots.get(7).status_id, 1)
+        self.assertEqual(subscription.rejected, 1)
+
+    def test_unfinished_change_is_not_lost_when_subscriber_stops(self):
+        """Test a subscriber closing mid-change leaves that change to be polled again"""
+        subscription = self.feed.subscribe(3600)
+        thread = threading.Thread(target=lambda: (next(iter(subscription)), subscription.close()), daemon=True)
+        thread.start()
+        self.halo.tickets = [{"id": 7, "dateupdated": "2025-11-06T15:00:10Z"}]
+
+        with self.assertRaises(PluginException):
+            self.feed.poll_once()
+        thread.join(timeout=5)
+        self.assertEqual(self.feed.poller.watermark, START)
+        self.assertIsNone(self.feed.snapshots.get(7))
+
+    def test_slow_subscriber_holds_one_change_at_a_time(self):
+        """Test the feed waits for each change to be handled before delivering the next"""
+        subscription = self.feed.subscribe(3600)
+        in_flight = []
+
+        def consume():
+            for change in subscription:
+                in_flight.append(subscription._queue.qsize())
+                threading.Event().wait(0.01)
+
+        thread = threading.Thread(target=consume, daemon=True)
+        thread.start()
+        self.halo.tickets = [{"id": ticket_id, "dateupdated": f"2025-11-06T15:00:{ticket_id:02d}Z"} for ticket_id in range(1, 21)]
+
+        self.assertEqual(self.feed.poll_once(), 20)
+        subscription.close()
+        thread.join(timeout=5)
+        self.assertEqual(in_flight, [0] * 20)
+        self.assertEqual(len(self.feed.snapshots), 20)
+
+    def test_pushdown_uses_union_of_fields_every_subscriber_filters(self):
+        """Test a field reaches the query only when all subscribers restrict it"""
+        self.feed.subscribe(60, {"id": [42], "priority_id": [2]})
+        self.feed.subscribe(60, {"id": [7, 42]})
+        self.assertEqual(self.feed.query_filters(), {"ticketids": "42,7"})
+
+        self.feed.poll_once()
+        self.assertEqual(self.halo.last_filters["ticketids"], "42,7")
+        self.assertNotIn("priority", self.halo.last_filters)
+
+        self.feed.subscribe(60)
+        self.assertEqual(self.feed.query_filters(), {})
+
+    def test_pushdown_skips_long_lists_and_unknown_fields(self):
+        """Test oversized value lists and fields the API cannot filter stay local"""
+        self.feed.subscribe(60, {"id": range(1, 500), "summary": ["x"], "tickettype_id": [3]})
+        self.assertEqual(self.feed.query_filters(), {"requesttype": "3"})
+
+    def test_narrowed_polls_advance_watermark_for_later_subscribers(self):
+        """Test a subscriber joining after a week of narrowed polls is not replayed that week"""
+        now = START + timedelta(days=7)
+        poller = TicketPoller(self.halo, "narrow", store=MemoryPollStateStore(), overlap=60, start=START, clock=now.timestamp)
+        feed = ChangeFeed(poller, min_interval=0, background=False, seed=False)
+        self.addCleanup(feed.close)
+        self.halo.tickets = [
+            {"id": day, "dateupdated": format_halo_date(START + timedelta(days=day - 1, hours=1)), "dateoccurred": format_halo_date(START)}
+            for day in range(1, 8)
+        ]
+
+        narrow = feed.subscribe(60, {"id": [42]})
+        feed.poll_once()
+        self.assertEqual(poller.watermark, now - timedelta(seconds=60))
+
+        wide = feed.subscribe(60)
+        feed.poll_once()
+        narrow.close()
+        wide.close()
+        self.assertEqual(list(narrow), [])
+        self.assertEqual(list(wide), [])
+
+    def test_first_poll_seeds_empty_store(self):
+        """Test the first poll snapshots the tickets outside its window, once, so their first change has a previous state"""
+        feed = make_feed(self.halo, seed=True)
+        self.addCleanup(feed.close)
+        self.halo.tickets = [
+            {"id": 1, "dateupdated": "2025-10-01T09:00:00Z", "status_id": 1},
+            {"id": 2, "dateupdated": "2025-11-06T14:59:30Z", "status_id": 1}
+        ]
+        subscription = feed.subscribe(3600)
+        changes, thread = collect(subscription)
+
+        feed.poll_once()
+        self.halo.tickets[0] = {"id": 1, "dateupdated": "2025-11-06T15:00:10Z", "status_id": 4}
+        feed.poll_once()
+        subscription.close()
+        thread.join(timeout=5)
+
+        self.assertEqual(self.halo.scans, 3)
+        self.assertEqual([(change.ticket["id"], change.previous is None) for change in changes], [(2, True), (1, False)])
+        self.assertEqual(changes[1].previous.status_id, 1)
+
+    def test_seed_leaves_filled_store_alone(self):
+        """Test a store that already holds snapshots is not rescanned"""
+        feed = make_feed(self.halo, seed=True)
+        self.addCleanup(feed.close)
+        feed.snapshots.put(9, snapshot_of({"id": 9}))
+
+        self.assertEqual(feed.seed(), 0)
+        self.assertEqual(self.halo.scans, 0)
+
+    def test_closed_subscription_gets_nothing_more(self):
+        """Test a closed subscription ends its iteration and is not delivered to"""
+        subscription = self.feed.subscribe(3600)
+        subscription.close()
+        subscription.deliver(Mock())
+        self.assertEqual(list(subscription), [])
+        self.assertEqual(self.feed.stats()["subscribers"], 0)
+
+
+class TestTriggersOnChangeFeed(unittest.TestCase):
+
+    def test_triggers_share_the_connection_feed_and_filter_locally(self):
+        """Test several triggers cost one scan per poll and each only sends what matches"""
+        halo = FakeHalo()
+        feed = make_feed(halo)
+        connection = Mock()
+        connection.change_feed.return_value = feed
+        connection.client._normalize_ticket.side_effect = lambda ticket: {"id": ticket["id"]}
+
+        triggers = []
+        for trigger, params in [
+            (TicketCreated(), {"priority_id": 2}),
+            (TicketCreated(), {"priority_id": 3}),
+            (TicketStatusChanged(), {"new_status_id": 4})
+        ]:
+            trigger.connection = connection
+            trigger.logger = Mock()
+            trigger.send = Mock()
+            thread = threading.Thread(target=trigger.run, args=(params,), daemon=True)
+            triggers.append((trigger, thread))
+
+        feed.poller.poll = Mock(side_effect=feed.poller.poll)
+        for _, thread in triggers:
+            thread.start()
+        while feed.stats()["subscribers"] < 3:
+            threading.Event().wait(0.01)
+
+        halo.tickets = [
+            {"id": 1, "dateupdated": "2025-11-06T15:00:10Z", "dateoccurred": "2025-11-06T15:00:10Z", "priority_id": 2, "status_id": 1},
+            {"id": 2, "dateupdated": "2025-11-06T15:00:20Z", "dateoccurred": "2025-11-06T15:00:20Z", "priority_id": 3, "status_id": 1}
+        ]
+        feed.poll_once()
+        halo.tickets.append({"id": 1, "dateupdated": "2025-11-06T15:00:30Z", "priority_id": 2, "status_id": 4})
+        feed.poll_once()
+        feed.close()
+        for _, thread in triggers:
+            thread.join(timeout=5)
+
+        self.assertEqual(triggers[0][0].send.call_args_list[0][0][0], {"ticket": {"id": 1}})
+        self.assertEqual(triggers[1][0].send.call_args_list[0][0][0], {"ticket": {"id": 2}})
+        self.assertEqual(triggers[2][0].send.call_args[0][0]["old_status_id"], 1)
+        self.assertEqual([trigger.send.call_count for trigger, _ in triggers], [1, 1, 1])
+        self.assertEqual(feed.poller.poll.call_count, 2)
+        # The status trigger filters nothing pushable, so nothing narrows the shared query
+        self.assertNotIn("priority", halo.last_filters)
+
+    def test_failed_send_is_retried_next_poll(self):
+        """Test a trigger whose send fails keeps running and gets the same change again"""
+        halo = FakeHalo()
+        feed = make_feed(halo)
+        connection = Mock()
+        connection.change_feed.return_value = feed
+        connection.client._normalize_ticket.side_effect = lambda ticket: {"id": ticket["id"]}
+        trigger = TicketCreated()
+        trigger.connection = connection
+        trigger.logger = Mock()
+        trigger.send = Mock(side_effect=[RuntimeError("orchestrator unavailable"), None])
+        thread = threading.Thread(target=trigger.run, args=({},), daemon=True)
+        thread.start()
+        while feed.stats()["subscribers"] < 1:
+            threading.Event().wait(0.01)
+
+        halo.tickets = [{"id": 1, "dateupdated": "2025-11-06T15:00:10Z", "dateoccurred": "2025-11-06T15:00:10Z"}]
+        with self.assertRaises(PluginException):
+            feed.poll_once()
+        self.assertEqual(feed.poll_once(), 1)
+        feed.close()
+        thread.join(timeout=5)
+
+        self.assertEqual([call[0][0] for call in trigger.send.call_args_list], [{"ticket": {"id": 1}}] * 2)
+
+    def test_status_changed_never_pushes_new_status(self):
+        """Test the new status filter stays local so the ticket is seen before it changes"""
+        halo = FakeHalo()
+        feed = make_feed(halo)
+        connection = Mock()
+        connection.change_feed.return_value = feed
+        trigger = TicketStatusChanged()
+        trigger.connection = connection
+        trigger.logger = Mock()
+        thread = threading.Thread(target=trigger.run, args=({"ticket_id": 5, "new_status_id": 4},), daemon=True)
+        thread.start()
+        while feed.stats()["subscribers"] < 1:
+            threading.Event().wait(0.01)
+
+        self.assertEqual(feed.query_filters(), {"ticketids": "5"})
+        feed.close()
+        thread.join(timeout=5)
+
+    def test_ticket_updated_suppresses_no_op_changes(self):
+        """Test TicketUpdated stays quiet when only dateupdated moved and reports what changed otherwise"""
+        halo = FakeHalo()
+        feed = make_feed(halo)
+        connection = Mock()
+        connection.change_feed.return_value = feed
+        connection.client._normalize_ticket.side_effect = lambda ticket: {"id": ticket["id"]}
+        trigger = TicketUpdated()
+        trigger.connection = connection
+        trigger.logger = Mock()
+        trigger.send = Mock()
+        thread = threading.Thread(target=trigger.run, args=({"watched_fields": ["status_id", "agent_id"]},), daemon=True)
+        thread.start()
+        while feed.stats()["subscribers"] < 1:
+            threading.Event().wait(0.01)
+
+        for updated, changes in [
+            ("2025-11-06T15:00:10Z", {}),
+            ("2025-11-06T15:00:20Z", {}),
+            ("2025-11-06T15:00:30Z", {"summary": "Edited"}),
+            ("2025-11-06T15:00:40Z", {"status_id": 2, "agent_id": 9})
+        ]:
+            halo.tickets = [dict({"id": 1, "dateupdated": updated, "status_id": 1, "agent_id": 3, "summary": "A"}, **changes)]
+            feed.poll_once()
+        feed.close()
+        thread.join(timeout=5)
+
+        outputs = [call[0][0] for call in trigger.send.call_args_list]
+        self.assertEqual([output["changed_fields"] for output in outputs], [[], ["status_id", "agent_id"]])
+        self.assertEqual(outputs[1]["previous_status_id"], 1)
+        self.assertEqual(trigger.suppressed, 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
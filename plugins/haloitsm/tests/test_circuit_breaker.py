@@ -0,0 +1,123 @@
+import sys
+import os
+sys.path.append(os.path.abspath('../'))
+
+import time
+import unittest
+import requests
+from insightconnect_plugin_runtime.exceptions import PluginException
+from icon_haloitsm.util.circuit_breaker import CircuitBreaker, CircuitBreakers, CLOSED, OPEN, HALF_OPEN, endpoint_group
+from icon_haloitsm.util.retry import RetryPolicy
+from tests.helpers import make_client, make_response, mock_session
+
+
+class TestCircuitBreaker(unittest.TestCase):
+
+    def test_endpoint_group(self):
+        self.assertEqual(endpoint_group("/tickets/12"), "tickets")
+        self.assertEqual(endpoint_group("/Tickets"), "tickets")
+        self.assertEqual(endpoint_group("/actions?ticket_id=1"), "actions")
+        self.assertEqual(endpoint_group("/"), "root")
+
+    def test_opens_after_threshold(self):
+        """Test consecutive failures open the circuit and successes reset the count"""
+        breaker = CircuitBreaker("tickets", failure_threshold=3, recovery_timeout=60)
+
+        breaker.record_failure("HTTP 503")
+        breaker.record_failure("HTTP 503")
+        breaker.record_success()
+        breaker.record_failure("HTTP 503")
+        breaker.record_failure("HTTP 503")
+        self.assertEqual(breaker.state, CLOSED)
+
+        breaker.record_failure("ReadTimeout")
+        self.assertEqual(breaker.state, OPEN)
+        self.assertFalse(breaker.allow_request())
+        self.assertEqual(breaker.stats()["rejected"], 1)
+        self.assertEqual(breaker.stats()["last_error"], "ReadTimeout")
+
+    def test_half_open_allows_single_probe(self):
+        """Test only one probe is let through after the recovery timeout"""
+        breaker = CircuitBreaker("tickets", failure_threshold=1, recovery_timeout=0.05)
+        breaker.record_failure()
+        time.sleep(0.06)
+
+        self.assertTrue(breaker.allow_request())
+        self.assertEqual(breaker.state, HALF_OPEN)
+        self.assertFalse(breaker.allow_request())
+
+        breaker.record_success()
+        self.assertEqual(breaker.state, CLOSED)
+        self.assertTrue(breaker.allow_request())
+
+    def test_failed_probe_reopens(self):
+        breaker = CircuitBreaker("tickets", failure_threshold=1, recovery_timeout=0.05)
+        breaker.record_failure()
+        time.sleep(0.06)
+
+        self.assertTrue(breaker.allow_request())
+        breaker.record_failure("HTTP 502")
+
+        self.assertEqual(breaker.state, OPEN)
+        self.assertEqual(breaker.stats()["opened"], 2)
+        self.assertGreater(breaker.retry_in(), 0)
+
+    def test_group_overrides(self):
+        """Test endpoint groups get their own breaker and settings"""
+        breakers = CircuitBreakers(failure_threshold=5, overrides={"actions": {"failure_threshold": 1}})
+
+        breakers.for_endpoint("/actions").record_failure()
+
+        self.assertEqual(breakers.get("actions").state, OPEN)
+        self.assertEqual(breakers.get("tickets").state, CLOSED)
+        self.assertEqual(breakers.get("tickets").failure_threshold, 5)
+        self.assertEqual(set(breakers.stats()), {"actions", "tickets"})
+
+
+class TestMakeRequestCircuit(unittest.TestCase):
+
+    def make_client(self, tenant):
+        client = make_client(
+            tenant=tenant,
+            retry_policy=RetryPolicy(base_delay=0.001, max_delay=0.001),
+            circuit_failure_threshold=2,
+            circuit_recovery_timeout=60
+        )
+        mock_session(client)
+        return client
+
+    def test_open_circuit_fails_fast(self):
+        """Test an outage stops hitting the server once the threshold is crossed"""
+        client = self.make_client("circuit-outage")
+        client.session.request.side_effect = requests.exceptions.ConnectTimeout("connect timed out")
+
+        with self.assertRaises(PluginException):
+            client.get_ticket(1)
+        self.assertEqual(client.session.request.call_count, 2)
+        self.assertEqual(client.circuit_breakers.get("tickets").state, OPEN)
+
+        with self.assertRaises(PluginException) as context:
+            client.get_ticket(2)
+        self.assertEqual(context.exception.cause, "HaloITSM unavailable")
+        self.assertEqual(client.session.request.call_count, 2)
+
+        # Other endpoint groups are unaffected
+        client.session.request.side_effect = None
+        client.session.request.return_value = make_response(json_data={"id": 9})
+        self.assertEqual(client.make_request("GET", "/agent/9"), {"id": 9})
+
+    def test_client_errors_do_not_trip(self):
+        """Test 4xx answers count as a healthy server"""
+        client = self.make_client("circuit-4xx")
+        client.session.request.return_value = make_response(404, {"error": "not found"})
+
+        for ticket_id in range(5):
+            with self.assertRaises(PluginException):
+                client.get_ticket(ticket_id)
+
+        self.assertEqual(client.circuit_breakers.get("tickets").state, CLOSED)
+        self.assertEqual(client.session.request.call_count, 5)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -52,7 +52,7 @@ class TestCloseTicket(unittest.TestCase):
             "details": "Ticket closed with resolution: Issue resolved successfully"
         }
         self.action.connection.client.update_ticket.assert_called_once_with(expected_close_data)
-        self.action.connection.client.get_ticket.assert_called_once_with(12345)
+        self.action.connection.client.get_ticket.assert_called_once_with(12345, use_cache=False)
         self.assertEqual(result[Output.TICKET], normalized_ticket)
         self.assertTrue(result[Output.SUCCESS])
     
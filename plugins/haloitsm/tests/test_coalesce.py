@@ -0,0 +1,121 @@
+import sys
+import os
+sys.path.append(os.path.abspath('../'))
+
+import json
+import threading
+import time
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import Mock
+from insightconnect_plugin_runtime.exceptions import PluginException
+from icon_haloitsm.util.coalesce import RequestCoalescer
+from tests.helpers import make_client
+
+
+class TestRequestCoalescer(unittest.TestCase):
+
+    def test_concurrent_callers_share_one_call(self):
+        coalescer = RequestCoalescer()
+        release = threading.Event()
+        fn = Mock(side_effect=lambda: release.wait() and {"id": 1})
+
+        with ThreadPoolExecutor(max_workers=10) as executor:
+            futures = [executor.submit(coalescer.do, "key", fn) for _ in range(10)]
+            while coalescer.stats()["saved"] < 9:
+                time.sleep(0.001)
+            release.set()
+            results = [future.result() for future in futures]
+
+        fn.assert_called_once()
+        self.assertTrue(all(result is results[0] for result in results))
+        self.assertEqual(coalescer.stats(), {"calls": 1, "saved": 9, "in_flight": 0})
+
+    def test_error_reaches_every_waiter(self):
+        coalescer = RequestCoalescer()
+        release = threading.Event()
+
+        def fail():
+            release.wait()
+            raise PluginException(cause="HaloITSM API error 500", assistance="boom")
+
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            futures = [executor.submit(coalescer.do, "key", fail) for _ in range(3)]
+            while coalescer.stats()["saved"] < 2:
+                time.sleep(0.001)
+            release.set()
+            for future in futures:
+                self.assertRaises(PluginException, future.result)
+
+    def test_completed_calls_are_not_reused(self):
+        coalescer = RequestCoalescer()
+        fn = Mock(return_value=1)
+
+        coalescer.do("key", fn)
+        coalescer.do("key", fn)
+
+        self.assertEqual(fn.call_count, 2)
+        self.assertEqual(coalescer.stats()["saved"], 0)
+
+
+class TestMakeRequestCoalescing(unittest.TestCase):
+
+    def setUp(self):
+        self.client = make_client(http_cache_size=0)
+        self.client.access_token = "token"
+        self.client.token_expires_at = float("inf")
+        self.client.session = Mock()
+        self.release = threading.Event()
+
+        def request(**kwargs):
+            self.release.wait()
+            response = Mock(status_code=200)
+            response.content = json.dumps({"url": kwargs["url"], "params": kwargs["params"]}).encode()
+            return response
+
+        self.client.session.request.side_effect = request
+
+    def _run_concurrently(self, calls, joined=0):
+        with ThreadPoolExecutor(max_workers=len(calls)) as executor:
+            futures = [executor.submit(call) for call in calls]
+            deadline = time.monotonic() + 2
+            while self.client.coalescer.stats()["saved"] < joined and time.monotonic() < deadline:
+                time.sleep(0.001)
+            time.sleep(0.02)
+            self.release.set()
+            return [future.result() for future in futures]
+
+    def test_identical_gets_coalesced(self):
+        """Test the same search with params in any order is sent once"""
+        results = self._run_concurrently(
+            [lambda: self.client.make_request("GET", "/tickets", params={"search": "x", "count": 5})] * 4 +
+            [lambda: self.client.make_request("GET", "/tickets", params={"count": 5, "search": "x"})] * 4,
+            joined=7
+        )
+
+        self.assertEqual(self.client.session.request.call_count, 1)
+        self.assertEqual(len({id(result) for result in results}), 1)
+        self.assertEqual(self.client.coalescer.stats()["saved"], 7)
+
+    def test_different_requests_not_coalesced(self):
+        self._run_concurrently([
+            lambda: self.client.get_ticket(1),
+            lambda: self.client.get_ticket(2),
+            lambda: self.client.make_request("GET", "/tickets", params={"page_no": 1}),
+            lambda: self.client.make_request("GET", "/tickets", params={"page_no": 2})
+        ])
+
+        self.assertEqual(self.client.session.request.call_count, 4)
+
+    def test_writes_and_bypass_not_coalesced(self):
+        self._run_concurrently(
+            [lambda: self.client.make_request("POST", "/tickets", json_data=[{"id": 1}])] * 2 +
+            [lambda: self.client.get_ticket(1, use_cache=False)] * 2
+        )
+
+        self.assertEqual(self.client.session.request.call_count, 4)
+        self.assertEqual(self.client.coalescer.stats()["saved"], 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,74 @@
+import sys
+import os
+sys.path.append(os.path.abspath('../'))
+
+import unittest
+from unittest.mock import Mock
+from icon_haloitsm.connection.connection import Connection
+from icon_haloitsm.connection.schema import ConnectionSchema
+
+
+def connection_params(**overrides):
+    """Connection inputs with every property the connection schema defines"""
+    params = {
+        "client_id": "client",
+        "client_secret": {"secretKey": "secret"},
+        "authorization_server": "https://halo.example.com/auth",
+        "resource_server": "https://halo.example.com/api",
+        "tenant": "tenant",
+        "ssl_verify": True,
+        "default_ticket_type_id": 1,
+        "default_priority_id": 3,
+        "default_team_id": 15,
+        "default_agent_id": 42,
+        "default_category_id": 8,
+        "background_token_refresh": False,
+        "read_rate_limit": 10,
+        "write_rate_limit": 5,
+        "circuit_breaker_threshold": 4,
+        "circuit_breaker_timeout": 30,
+        "reference_data_refresh": 600,
+        "ticket_batch_window": 20
+    }
+    params.update(overrides)
+    return params
+
+
+class TestConnect(unittest.TestCase):
+
+    def setUp(self):
+        self.connection = Connection()
+        self.connection.logger = Mock()
+
+    def test_params_cover_the_schema(self):
+        """Test the test inputs name every connection property, so connect() reads each one"""
+        self.assertEqual(set(connection_params()), set(ConnectionSchema.schema["properties"]))
+
+    def test_connect_stores_every_input(self):
+        """Test connect() accepts every input of the real schema without touching the network"""
+        self.connection.connect(connection_params())
+
+        self.assertEqual(self.connection.client_secret, "secret")
+        self.assertEqual(self.connection.resource_server, "https://halo.example.com/api")
+        self.assertEqual((self.connection.read_rate_limit, self.connection.write_rate_limit), (10, 5))
+        self.assertEqual((self.connection.circuit_breaker_threshold, self.connection.circuit_breaker_timeout), (4, 30))
+        self.assertEqual(self.connection.reference_data_refresh, 600)
+        self.assertEqual(self.connection.ticket_batch_window, 20)
+        self.assertEqual(self.connection.default_agent_id, 42)
+        self.assertIsNone(self.connection.client)
+
+    def test_connect_defaults_optional_inputs(self):
+        """Test optional inputs left out fall back to their defaults"""
+        params = connection_params()
+        for name in ["read_rate_limit", "circuit_breaker_threshold", "reference_data_refresh", "ticket_batch_window"]:
+            del params[name]
+        self.connection.connect(params)
+
+        self.assertIsNone(self.connection.read_rate_limit)
+        self.assertEqual(self.connection.circuit_breaker_threshold, 5)
+        self.assertEqual(self.connection.reference_data_refresh, 0)
+        self.assertEqual(self.connection.ticket_batch_window, 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -47,11 +47,31 @@ class TestGetTicket(unittest.TestCase):
         result = self.action.run({Input.TICKET_ID: 12345})
         
         # Assertions
-        self.action.connection.client.get_ticket.assert_called_once_with(12345)
+        self.action.connection.client.get_ticket.assert_called_once_with(12345, fields=[])
         self.action.connection.client._normalize_ticket.assert_called_once_with(mock_ticket)
         self.assertEqual(result[Output.TICKET], normalized_ticket)
         self.assertTrue(result[Output.SUCCESS])
     
+    def test_get_ticket_with_fields(self):
+        """Test fields are passed to the API and the output is projected onto them"""
+        self.action.connection.client.get_ticket.return_value = {"id": 12345}
+        self.action.connection.client._normalize_ticket.return_value = {
+            "id": 12345, "summary": "Test Ticket", "details": "Long details", "status_name": "Open"
+        }
+        
+        result = self.action.run({Input.TICKET_ID: 12345, Input.FIELDS: ["summary", "status_name"]})
+        
+        self.action.connection.client.get_ticket.assert_called_once_with(12345, fields=["summary", "status_name"])
+        self.assertEqual(result[Output.TICKET], {"id": 12345, "summary": "Test Ticket", "status_name": "Open"})
+    
+    def test_get_ticket_unknown_field(self):
+        """Test an unknown field name is rejected before calling the API"""
+        with self.assertRaises(PluginException) as context:
+            self.action.run({Input.TICKET_ID: 12345, Input.FIELDS: ["summary", "colour"]})
+        
+        self.assertIn("Unknown ticket field(s): colour", str(context.exception))
+        self.action.connection.client.get_ticket.assert_not_called()
+    
     def test_get_ticket_missing_id(self):
         """Test error when ticket ID is missing"""
         with self.assertRaises(PluginException) as context:
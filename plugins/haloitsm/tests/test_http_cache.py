@@ -0,0 +1,132 @@
+import sys
+import os
+sys.path.append(os.path.abspath('../'))
+
+import json
+import unittest
+from unittest.mock import Mock, patch
+import requests
+from icon_haloitsm.util import json_codec
+from icon_haloitsm.util.http_cache import HTTPCache, body_fingerprint, request_key
+from tests.helpers import make_client, make_response
+
+
+def make_cached_client(**kwargs):
+    client = make_client(**kwargs)
+    client.access_token = "token"
+    client.token_expires_at = float("inf")
+    client.session = Mock()
+    return client
+
+
+class TestHTTPCacheHelpers(unittest.TestCase):
+
+    def test_request_key_is_canonical(self):
+        self.assertEqual(
+            request_key("get", "/tickets", {"b": 2, "a": 1, "c": None}),
+            request_key("GET", "/tickets", {"a": "1", "b": "2"})
+        )
+
+    def test_fingerprint(self):
+        ticket = json.dumps({"id": 1, "dateupdated": "2024-01-01T00:00:00", "summary": "a"}).encode()
+        edited = json.dumps({"id": 1, "dateupdated": "2024-01-01T00:00:00", "summary": "b"}).encode()
+        listing = json.dumps([{"dateupdated": "x"}, {"dateupdated": "y"}]).encode()
+
+        self.assertEqual(body_fingerprint(ticket), "dateupdated:2024-01-01T00:00:00")
+        self.assertEqual(body_fingerprint(ticket), body_fingerprint(edited))
+        self.assertTrue(body_fingerprint(listing).startswith("blake2b:"))
+
+
+class TestConditionalGet(unittest.TestCase):
+
+    def setUp(self):
+        self.client = make_cached_client()
+
+    def test_etag_revalidation(self):
+        """Test a 304 answer is served from the cache"""
+        ticket = {"id": 1, "summary": "a"}
+        self.client.session.request.side_effect = [
+            make_response(json_data=ticket, headers={"ETag": '"v1"'}),
+            make_response(status_code=304)
+        ]
+
+        first = self.client.get_ticket(1)
+        second = self.client.get_ticket(1)
+
+        self.assertEqual(first, ticket)
+        self.assertIs(second, first)
+        second_headers = self.client.session.request.call_args_list[1].kwargs["headers"]
+        self.assertEqual(second_headers["If-None-Match"], '"v1"')
+        self.assertEqual(self.client.http_cache.stats()["not_modified"], 1)
+
+    def test_last_modified_revalidation(self):
+        self.client.session.request.side_effect = [
+            make_response(json_data={"id": 1}, headers={"Last-Modified": "Wed, 01 Jan 2025 00:00:00 GMT"}),
+            make_response(status_code=304)
+        ]
+
+        self.client.get_ticket(1)
+        self.client.get_ticket(1)
+
+        headers = self.client.session.request.call_args.kwargs["headers"]
+        self.assertEqual(headers["If-Modified-Since"], "Wed, 01 Jan 2025 00:00:00 GMT")
+
+    def test_fingerprint_hit_skips_parse(self):
+        """Test an unchanged dateupdated returns the cached object without parsing"""
+        self.client.session.request.side_effect = [
+            make_response(json_data={"id": 1, "dateupdated": "2024-01-01"}),
+            make_response(json_data={"id": 1, "dateupdated": "2024-01-01"}),
+            make_response(json_data={"id": 1, "dateupdated": "2024-02-01"})
+        ]
+
+        first = self.client.get_ticket(1)
+        with patch.object(json_codec, "loads", side_effect=AssertionError("parsed again")):
+            self.assertIs(self.client.get_ticket(1), first)
+        self.assertEqual(self.client.get_ticket(1)["dateupdated"], "2024-02-01")
+
+        stats = self.client.http_cache.stats()
+        self.assertEqual((stats["fingerprint_hits"], stats["misses"]), (1, 2))
+
+    def test_bypass(self):
+        self.client.session.request.side_effect = [
+            make_response(json_data={"id": 1}, headers={"ETag": '"v1"'}),
+            make_response(json_data={"id": 1, "summary": "fresh"}, headers={"ETag": '"v2"'})
+        ]
+
+        self.client.get_ticket(1)
+        result = self.client.get_ticket(1, use_cache=False)
+
+        self.assertEqual(result["summary"], "fresh")
+        self.assertNotIn("If-None-Match", self.client.session.request.call_args.kwargs["headers"])
+        self.assertEqual(self.client.http_cache.stats()["bypassed"], 1)
+
+    def test_writes_not_cached(self):
+        self.client.session.request.return_value = make_response(json_data={"id": 1}, headers={"ETag": '"v1"'})
+
+        self.client.make_request(method="POST", endpoint="/tickets", json_data=[{"summary": "a"}])
+
+        self.assertEqual(len(self.client.http_cache), 0)
+
+    def test_bounded(self):
+        cache = HTTPCache(max_entries=2, max_entry_bytes=100)
+        for ticket_id in range(3):
+            cache.resolve(ticket_id, None, make_response(json_data={"id": ticket_id}, headers={"ETag": str(ticket_id)}))
+        cache.resolve("big", None, make_response(json_data={"details": "x" * 200}, headers={"ETag": "big"}))
+
+        stats = cache.stats()
+        self.assertEqual((stats["size"], stats["evictions"], stats["too_large"]), (2, 1, 1))
+        self.assertIsNone(cache.lookup(0))
+
+    def test_disabled(self):
+        client = make_cached_client(http_cache_size=0)
+        client.session.request.return_value = make_response(json_data={"id": 1}, headers={"ETag": '"v1"'})
+
+        client.get_ticket(1)
+        client.get_ticket(1)
+
+        self.assertIsNone(client.http_cache)
+        self.assertNotIn("If-None-Match", client.session.request.call_args.kwargs["headers"])
+
+
+if __name__ == '__main__':
+    unittest.main()
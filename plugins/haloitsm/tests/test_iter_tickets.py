@@ -0,0 +1,91 @@
+import sys
+import os
+sys.path.append(os.path.abspath('../'))
+
+import unittest
+from unittest.mock import Mock
+from tests.helpers import make_client
+
+
+class FakeTicketPages:
+    """Stand-in for GET /tickets honouring page_no / page_size"""
+
+    def __init__(self, total, report_count=True):
+        self.total = total
+        self.report_count = report_count
+        self.calls = []
+
+    def __call__(self, method, endpoint, params=None, **kwargs):
+        self.calls.append(dict(params))
+        start = (params["page_no"] - 1) * params["page_size"]
+        tickets = [{"id": i + 1, "summary": f"ticket {i + 1}"} for i in range(start, min(start + params["page_size"], self.total))]
+        response = {"tickets": tickets}
+        if self.report_count:
+            response["record_count"] = self.total
+        return response
+
+
+class TestIterTickets(unittest.TestCase):
+
+    def setUp(self):
+        self.client = make_client()
+
+    def test_pages_through_all_tickets(self):
+        """Test every page is requested once and tickets come out normalized in order"""
+        pages = FakeTicketPages(total=25)
+        self.client.make_request = Mock(side_effect=pages)
+
+        tickets = list(self.client.iter_tickets({"search": "x", "count": 5}, page_size=10))
+
+        self.assertEqual([ticket["id"] for ticket in tickets], list(range(1, 26)))
+        self.assertIn("status_name", tickets[0])
+        self.assertEqual([call["page_no"] for call in pages.calls], [1, 2, 3])
+        self.assertEqual(pages.calls[0], {"search": "x", "pageinate": True, "page_size": 10, "page_no": 1})
+
+    def test_fields_project_tickets_and_set_query_flags(self):
+        """Test fields drop details / custom fields server side and prune the rest locally"""
+        pages = FakeTicketPages(total=3)
+        self.client.make_request = Mock(side_effect=pages)
+
+        tickets = list(self.client.iter_tickets(page_size=10, fields=["summary", "status_name"]))
+
+        self.assertEqual(pages.calls[0]["includedetails"], False)
+        self.assertEqual(pages.calls[0]["includecustomfields"], False)
+        self.assertEqual(len(tickets), 3)
+        self.assertEqual(set(tickets[0]), {"id", "summary", "status_name"})
+
+    def test_is_lazy_and_honours_limit(self):
+        """Test pages are only fetched as tickets are consumed and limit stops early"""
+        pages = FakeTicketPages(total=1000)
+        self.client.make_request = Mock(side_effect=pages)
+
+        iterator = self.client.iter_tickets(page_size=10, limit=15, normalize=False)
+        self.assertEqual(len(pages.calls), 0)
+
+        first = next(iterator)
+        self.assertEqual(first, {"id": 1, "summary": "ticket 1"})
+        self.assertEqual(len(pages.calls), 1)
+
+        self.assertEqual(len(list(iterator)), 14)
+        self.assertEqual(len(pages.calls), 2)
+
+    def test_exact_multiple_without_record_count(self):
+        """Test an empty page ends iteration when the total is not reported"""
+        pages = FakeTicketPages(total=20, report_count=False)
+        self.client.make_request = Mock(side_effect=pages)
+
+        self.assertEqual(len(list(self.client.iter_tickets(page_size=10))), 20)
+        self.assertEqual(len(pages.calls), 3)
+
+    def test_stops_when_paging_is_ignored(self):
+        """Test a server returning the same page forever does not loop"""
+        self.client.make_request = Mock(return_value=[{"id": 1}, {"id": 2}])
+
+        tickets = list(self.client.iter_tickets(page_size=2, normalize=False))
+
+        self.assertEqual(len(tickets), 2)
+        self.assertEqual(self.client.make_request.call_count, 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
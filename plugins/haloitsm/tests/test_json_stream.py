@@ -0,0 +1,122 @@
+import sys
+import os
+sys.path.append(os.path.abspath('../'))
+
+import io
+import json
+import random
+import unittest
+from unittest.mock import Mock
+import requests
+from icon_haloitsm.util.json_stream import JSONArrayStream, iter_json_array
+from tests.helpers import make_client
+
+DOCUMENTS = [
+    {"record_count": 2, "tickets": [{"id": 1, "details": "<p class=\"x\">a, ] } { [ \\ é</p>"}, {"id": 2, "nested": [1, [2, {"a": "b"}]]}], "page_no": 1},
+    {"tickets": ["text", 5, None, True, [1, 2]]},
+    {"label": "tickets", "other": [1, 2], "tickets": [{"id": 9}]},
+    {"nested": {"tickets": [1]}, "tickets": [{"id": 3}]},
+    {"tickets": []},
+    {"record_count": 0},
+    [{"id": 1}, {"id": 2}],
+    []
+]
+
+
+def random_chunks(data, max_size):
+    position = 0
+    while position < len(data):
+        size = random.randint(1, max_size)
+        yield data[position:position + size]
+        position += size
+
+
+class TestJSONArrayStream(unittest.TestCase):
+
+    def test_any_chunking(self):
+        """Test every split of the body decodes to the same items and meta"""
+        random.seed(7)
+        for document in DOCUMENTS:
+            for ensure_ascii in (True, False):
+                data = json.dumps(document, indent=random.choice([None, 2]), ensure_ascii=ensure_ascii).encode()
+                for max_size in (1, 2, 5, 64, len(data)):
+                    stream = JSONArrayStream(random_chunks(data, max_size))
+                    expected = document if isinstance(document, list) else document.get("tickets", [])
+
+                    self.assertEqual(list(stream), expected)
+                    if isinstance(document, dict):
+                        self.assertEqual(stream.meta, dict(document, tickets=[]) if "tickets" in document else document)
+
+    def test_items_yielded_before_body_ends(self):
+        """Test a ticket is available as soon as its bytes have arrived"""
+        def chunks():
+            yield b'{"tickets": [{"id": 1}, '
+            raise AssertionError("read too far")
+
+        self.assertEqual(next(iter_json_array(chunks())), {"id": 1})
+
+    def test_memory_stays_at_one_item(self):
+        ticket = json.dumps({"id": 1, "details": "x" * 10000}).encode()
+        data = b'{"tickets": [' + b",".join([ticket] * 200) + b"]}"
+        stream = JSONArrayStream(random_chunks(data, 4096))
+
+        largest = 0
+        for _ in stream:
+            largest = max(largest, len(stream._buf))
+        self.assertLess(largest, len(ticket) + 8192)
+
+    def test_truncated_body(self):
+        with self.assertRaises(ValueError):
+            list(JSONArrayStream([b'{"tickets": [{"id": 1}, {"id": 2']))
+
+    def test_close_called(self):
+        on_close = Mock()
+        stream = JSONArrayStream([b'{"tickets": [{"id": 1}, {"id": 2}]}'], on_close=on_close)
+        next(iter(stream))
+        stream.close()
+        stream.close()
+
+        on_close.assert_called_once()
+
+
+class TestStreamedIterTickets(unittest.TestCase):
+
+    def setUp(self):
+        self.client = make_client()
+        self.client.access_token = "token"
+        self.client.token_expires_at = float("inf")
+        self.client.session = Mock()
+
+        def page(**kwargs):
+            params = kwargs["params"]
+            start = (params["page_no"] - 1) * params["page_size"]
+            ids = range(start + 1, min(start + params["page_size"], 25) + 1)
+            response = requests.Response()
+            response.status_code = 200
+            response.raw = io.BytesIO(json.dumps({"record_count": 25, "tickets": [{"id": i} for i in ids]}).encode())
+            return response
+
+        self.client.session.request.side_effect = page
+
+    def test_stream_matches_buffered(self):
+        streamed = [ticket["id"] for ticket in self.client.iter_tickets(page_size=10, stream=True)]
+
+        self.assertEqual(streamed, list(range(1, 26)))
+        self.assertEqual(self.client.session.request.call_count, 3)
+        self.assertTrue(self.client.session.request.call_args.kwargs["stream"])
+
+    def test_stream_respects_limit(self):
+        tickets = list(self.client.iter_tickets(page_size=10, limit=10, normalize=False, stream=True))
+
+        self.assertEqual(len(tickets), 10)
+        self.assertEqual(self.client.session.request.call_count, 1)
+
+    def test_stream_page_meta(self):
+        page = self.client.stream_tickets_page({"search": "x"}, 3, 10)
+
+        self.assertEqual([ticket["id"] for ticket in page], list(range(21, 26)))
+        self.assertEqual(page.meta["record_count"], 25)
+
+
+if __name__ == '__main__':
+    unittest.main()
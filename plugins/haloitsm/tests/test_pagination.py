@@ -0,0 +1,112 @@
+import sys
+import os
+sys.path.append(os.path.abspath('../'))
+
+import random
+import threading
+import time
+import unittest
+from unittest.mock import Mock
+from icon_haloitsm.util.pagination import prefetch_pages
+from tests.helpers import make_client
+
+
+class SlowPages:
+    """Page fetcher with random latency that records concurrency"""
+
+    def __init__(self, latency=0.02):
+        self.latency = latency
+        self.lock = threading.Lock()
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.fetched = []
+
+    def __call__(self, page_no):
+        with self.lock:
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        time.sleep(random.uniform(0, self.latency))
+        with self.lock:
+            self.in_flight -= 1
+            self.fetched.append(page_no)
+        return f"page {page_no}"
+
+
+class TestPrefetchPages(unittest.TestCase):
+
+    def test_order_is_deterministic(self):
+        """Test pages come out in page order whatever order they complete in"""
+        pages = SlowPages()
+
+        result = list(prefetch_pages(pages, 2, 21, window=6))
+
+        self.assertEqual(result, [f"page {n}" for n in range(2, 22)])
+        self.assertGreater(pages.max_in_flight, 1)
+        self.assertLessEqual(pages.max_in_flight, 6)
+
+    def test_slow_consumer_applies_backpressure(self):
+        """Test no more than window pages are fetched ahead of the consumer"""
+        pages = SlowPages(latency=0.001)
+        iterator = prefetch_pages(pages, 1, 100, window=3)
+
+        next(iterator)
+        time.sleep(0.1)
+
+        # The consumed page plus the window
+        self.assertLessEqual(len(pages.fetched), 4)
+        iterator.close()
+
+    def test_close_stops_fetching(self):
+        pages = SlowPages(latency=0.001)
+        iterator = prefetch_pages(pages, 1, 1000, window=4)
+        next(iterator)
+        iterator.close()
+        time.sleep(0.05)
+
+        self.assertLess(len(pages.fetched), 10)
+
+    def test_empty_range(self):
+        self.assertEqual(list(prefetch_pages(SlowPages(), 2, 1)), [])
+
+
+class TestIterTicketsPrefetch(unittest.TestCase):
+
+    def setUp(self):
+        self.client = make_client()
+
+        def tickets_page(method, endpoint, params=None, **kwargs):
+            time.sleep(random.uniform(0, 0.01))
+            start = (params["page_no"] - 1) * params["page_size"]
+            ids = range(start + 1, min(start + params["page_size"], 95) + 1)
+            return {"record_count": 95, "tickets": [{"id": ticket_id} for ticket_id in ids]}
+
+        self.client.make_request = Mock(side_effect=tickets_page)
+
+    def test_prefetch_matches_sequential(self):
+        """Test prefetching yields exactly what the sequential scan does"""
+        sequential = [ticket["id"] for ticket in self.client.iter_tickets(page_size=10, normalize=False)]
+        prefetched = [ticket["id"] for ticket in self.client.iter_tickets(page_size=10, normalize=False, prefetch=4)]
+
+        self.assertEqual(prefetched, list(range(1, 96)))
+        self.assertEqual(prefetched, sequential)
+
+    def test_prefetch_respects_limit(self):
+        """Test pages beyond the limit are never requested"""
+        tickets = list(self.client.iter_tickets(page_size=10, limit=25, normalize=False, prefetch=8))
+
+        self.assertEqual(len(tickets), 25)
+        self.assertEqual(self.client.make_request.call_count, 3)
+
+    def test_prefetch_stops_when_paging_is_ignored(self):
+        """Test a server returning the first page for every page_no stops after one page when prefetching"""
+        self.client.make_request = Mock(return_value={"record_count": 95, "tickets": [{"id": 1}, {"id": 2}]})
+        self.client.logger = Mock()
+
+        tickets = list(self.client.iter_tickets(page_size=2, normalize=False, prefetch=4))
+
+        self.assertEqual([ticket["id"] for ticket in tickets], [1, 2])
+        self.client.logger.warning.assert_called_once()
+
+
+if __name__ == '__main__':
+    unittest.main()
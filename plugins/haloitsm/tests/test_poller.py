@@ -0,0 +1,220 @@
+import sys
+import os
+sys.path.append(os.path.abspath('../'))
+
+import shutil
+import tempfile
+import unittest
+from datetime import datetime, timedelta, timezone
+from unittest.mock import Mock
+from icon_haloitsm.util.poller import (
+    FilePollStateStore,
+    MemoryPollStateStore,
+    TicketPoller,
+    format_halo_date,
+    parse_halo_date,
+    poll_state_key
+)
+
+START = datetime(2025, 11, 6, 15, 0, 0, tzinfo=timezone.utc)
+
+
+def ticket(ticket_id, updated, occurred="2025-11-01T00:00:00Z", status_id=1):
+    return {"id": ticket_id, "dateupdated": updated, "dateoccurred": occurred, "status_id": status_id}
+
+
+class FakeHalo:
+    """Stands in for HaloITSMAPI.iter_tickets, serving whatever tickets the test sets"""
+
+    def __init__(self):
+        self.tickets = []
+        self.queries = []
+
+    def iter_tickets(self, filters, page_size, normalize):
+        self.queries.append(filters)
+        return iter(list(self.tickets))
+
+
+class TestHaloDates(unittest.TestCase):
+
+    def test_parse_halo_date_formats(self):
+        """Test the timestamp variants HaloITSM returns parse to the same UTC instant"""
+        expected = datetime(2025, 11, 6, 15, 0, 0, 123000, tzinfo=timezone.utc)
+        for value in ["2025-11-06T15:00:00.123Z", "2025-11-06T15:00:00.1230000", "2025-11-06T16:00:00.123+01:00"]:
+            self.assertEqual(parse_halo_date(value), expected, value)
+        self.assertIsNone(parse_halo_date(""))
+        self.assertIsNone(parse_halo_date("not a date"))
+        self.assertEqual(format_halo_date(expected), "2025-11-06T15:00:00.123Z")
+
+    def test_poll_state_key_depends_on_inputs(self):
+        """Test the same trigger inputs map to the same key and different ones do not"""
+        key = poll_state_key("https://halo/api", "t", "ticket_created", {"priority_id": 1})
+        self.assertEqual(key, poll_state_key("https://halo/api", "t", "ticket_created", {"priority_id": 1}))
+        self.assertNotEqual(key, poll_state_key("https://halo/api", "t", "ticket_created", {"priority_id": 2}))
+
+
+class TestTicketPoller(unittest.TestCase):
+
+    def setUp(self):
+        self.halo = FakeHalo()
+        self.store = MemoryPollStateStore()
+        self.emitted = []
+
+    def make_poller(self, **kwargs):
+        kwargs.setdefault("overlap", 60)
+        return TicketPoller(self.halo, "key", store=self.store, start=START, **kwargs)
+
+    def emit(self, ticket_data, created):
+        self.emitted.append((ticket_data["id"], ticket_data["dateupdated"], created))
+
+    def test_queries_from_watermark_minus_overlap(self):
+        """Test the query asks for updates since the watermark minus the overlap, oldest first"""
+        self.make_poller(filters={"tickettype_id": 3}).poll(self.emit)
+
+        query = self.halo.queries[0]
+        self.assertEqual(query["startdate"], "2025-11-06T14:59:00.000Z")
+        self.assertEqual(query["datesearch"], "dateupdated")
+        self.assertEqual(query["order"], "dateupdated")
+        self.assertFalse(query["orderdesc"])
+        self.assertEqual(query["tickettype_id"], 3)
+
+    def test_poll_filters_narrow_one_query(self):
+        """Test filters passed to poll are added to that query only"""
+        poller = self.make_poller()
+        poller.poll(self.emit, {"ticketids": "1,2"})
+        poller.poll(self.emit)
+
+        self.assertEqual(self.halo.queries[0]["ticketids"], "1,2")
+        self.assertNotIn("ticketids", self.halo.queries[1])
+
+    def test_emits_each_change_once(self):
+        """Test changes re-read inside the overlap window are not emitted again"""
+        poller = self.make_poller()
+        self.halo.tickets = [ticket(2, "2025-11-06T15:00:20Z"), ticket(1, "2025-11-06T15:00:10Z")]
+        self.assertEqual(poller.poll(self.emit), 2)
+
+        self.halo.tickets.append(ticket(3, "2025-11-06T15:00:30Z"))
+        self.assertEqual(poller.poll(self.emit), 1)
+
+        self.assertEqual([change[0] for change in self.emitted], [1, 2, 3])
+        self.assertEqual(poller.watermark, parse_halo_date("2025-11-06T15:00:30Z"))
+        self.assertEqual(poller.stats()["duplicates"], 2)
+
+    def test_new_revision_of_seen_ticket_is_emitted(self):
+        """Test a later dateupdated of the same ticket is a new change, not a duplicate"""
+        poller = self.make_poller()
+        self.halo.tickets = [ticket(1, "2025-11-06T15:00:10Z")]
+        poller.poll(self.emit)
+        self.halo.tickets = [ticket(1, "2025-11-06T15:00:40Z")]
+        poller.poll(self.emit)
+
+        self.assertEqual([change[1] for change in self.emitted], ["2025-11-06T15:00:10Z", "2025-11-06T15:00:40Z"])
+
+    def test_late_write_inside_overlap_is_not_lost(self):
+        """Test a change stamped before the watermark (clock skew) is still picked up within the overlap"""
+        poller = self.make_poller()
+        self.halo.tickets = [ticket(1, "2025-11-06T15:01:00Z")]
+        poller.poll(self.emit)
+        self.halo.tickets.append(ticket(2, "2025-11-06T15:00:30Z"))
+        poller.poll(self.emit)
+
+        self.assertEqual([change[0] for change in self.emitted], [1, 2])
+        self.assertEqual(poller.watermark, parse_halo_date("2025-11-06T15:01:00Z"))
+
+    def test_ignores_tickets_outside_window(self):
+        """Test tickets older than the window are dropped when the server ignores the date filter"""
+        self.halo.tickets = [ticket(1, "2025-11-01T00:00:00Z"), ticket(2, "2025-11-06T15:00:10Z")]
+        self.make_poller().poll(self.emit)
+
+        self.assertEqual([change[0] for change in self.emitted], [2])
+
+    def test_created_flag(self):
+        """Test only tickets first seen with dateoccurred inside the window count as created"""
+        poller = self.make_poller()
+        self.halo.tickets = [
+            ticket(1, "2025-11-06T15:00:10Z", occurred="2025-11-06T15:00:10Z"),
+            ticket(2, "2025-11-06T15:00:20Z")
+        ]
+        poller.poll(self.emit)
+        self.halo.tickets = [ticket(1, "2025-11-06T15:00:50Z", occurred="2025-11-06T15:00:10Z")]
+        poller.poll(self.emit)
+
+        self.assertEqual([change[2] for change in self.emitted], [True, False, False])
+
+    def test_failed_emit_is_retried_and_earlier_changes_kept(self):
+        """Test the watermark stops before a change whose emit failed"""
+        poller = self.make_poller()
+        self.halo.tickets = [ticket(1, "2025-11-06T15:00:10Z"), ticket(2, "2025-11-06T15:00:20Z")]
+        emit = Mock(side_effect=[None, RuntimeError("send failed")])
+        with self.assertRaises(RuntimeError):
+            poller.poll(emit)
+        self.assertEqual(poller.watermark, parse_halo_date("2025-11-06T15:00:10Z"))
+
+        poller.poll(self.emit)
+        self.assertEqual([change[0] for change in self.emitted], [2])
+
+    def test_emits_and_saves_page_by_page(self):
+        """Test each page is emitted and its watermark saved before the next page is read"""
+        pulled = []
+
+        def iter_tickets(filters, page_size, normalize):
+            for ticket_id in range(1, 5):
+                pulled.append(ticket_id)
+                yield ticket(ticket_id, f"2025-11-06T15:00:{ticket_id}0Z")
+
+        self.halo.iter_tickets = iter_tickets
+        poller = self.make_poller(page_size=2)
+        saved = []
+
+        def emit(ticket_data, created):
+            saved.append((len(pulled), self.store.load("key")))
+
+        self.assertEqual(poller.poll(emit), 4)
+
+        self.assertEqual([count for count, _ in saved], [2, 2, 4, 4])
+        self.assertEqual(saved[2][1]["watermark"], "2025-11-06T15:00:20.000Z")
+        self.assertEqual(self.store.load("key")["watermark"], "2025-11-06T15:00:40.000Z")
+
+    def test_out_of_order_pages_stop_mid_poll_saves(self):
+        """Test once a page is older than the one before it, the watermark is only saved when the poll ends"""
+        self.halo.tickets = [
+            ticket(3, "2025-11-06T15:00:30Z"), ticket(4, "2025-11-06T15:00:40Z"),
+            ticket(1, "2025-11-06T15:00:10Z"), ticket(2, "2025-11-06T15:00:20Z"),
+            ticket(5, "2025-11-06T15:00:50Z"), ticket(6, "2025-11-06T15:00:59Z"),
+            ticket(7, "2025-11-06T15:01:10Z")
+        ]
+        poller = self.make_poller(page_size=2)
+        saved = []
+        poller.poll(lambda ticket_data, created: saved.append(self.store.load("key")["watermark"] if self.store.load("key") else None))
+
+        self.assertEqual(saved[-1], "2025-11-06T15:00:40.000Z")
+        self.assertEqual(self.store.load("key")["watermark"], "2025-11-06T15:01:10.000Z")
+
+    def test_narrowed_poll_advances_watermark_to_query_time(self):
+        """Test a filtered poll that matched nothing still moves the watermark, an unfiltered one does not"""
+        now = START + timedelta(days=7)
+        poller = self.make_poller(clock=now.timestamp)
+        poller.poll(self.emit)
+        self.assertEqual(poller.watermark, START)
+
+        poller.poll(self.emit, {"ticketids": "42"})
+        self.assertEqual(poller.watermark, now - timedelta(seconds=60))
+
+    def test_state_survives_restart(self):
+        """Test a new poller on the same key resumes from the saved watermark and window"""
+        directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, directory, True)
+        self.store = FilePollStateStore(directory)
+        self.halo.tickets = [ticket(1, "2025-11-06T15:00:10Z")]
+        self.make_poller().poll(self.emit)
+
+        restarted = TicketPoller(self.halo, "key", store=self.store, overlap=60)
+        restarted.poll(self.emit)
+
+        self.assertEqual(len(self.emitted), 1)
+        self.assertEqual(restarted.watermark, parse_halo_date("2025-11-06T15:00:10Z"))
+        self.assertEqual(os.listdir(directory), ["key.json"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,115 @@
+import sys
+import os
+sys.path.append(os.path.abspath('../'))
+
+import time
+import unittest
+from email.utils import formatdate
+from icon_haloitsm.util.api import HaloITSMAPIError
+from icon_haloitsm.util.rate_limiter import RateLimiter, READ, WRITE, endpoint_class, parse_retry_after
+from tests.helpers import make_client, make_response, mock_session
+
+
+class TestRateLimiter(unittest.TestCase):
+
+    def test_parse_retry_after(self):
+        """Test delta-seconds, HTTP-date and garbage Retry-After values"""
+        self.assertEqual(parse_retry_after("7"), 7.0)
+        self.assertAlmostEqual(parse_retry_after(formatdate(time.time() + 30, usegmt=True)), 30, delta=2)
+        self.assertEqual(parse_retry_after("-5"), 0.0)
+        self.assertIsNone(parse_retry_after("soon"))
+        self.assertIsNone(parse_retry_after(None))
+
+    def test_endpoint_class(self):
+        self.assertEqual(endpoint_class("get"), READ)
+        self.assertEqual(endpoint_class("POST"), WRITE)
+        self.assertEqual(endpoint_class("DELETE"), WRITE)
+
+    def test_bucket_limits_rate_per_class(self):
+        """Test writes are paced by their bucket while reads stay unlimited"""
+        limiter = RateLimiter(write_rate=20, write_burst=1)
+
+        start = time.monotonic()
+        for _ in range(5):
+            limiter.acquire(WRITE)
+        write_elapsed = time.monotonic() - start
+
+        start = time.monotonic()
+        for _ in range(50):
+            limiter.acquire(READ)
+        read_elapsed = time.monotonic() - start
+
+        self.assertGreaterEqual(write_elapsed, 0.18)
+        self.assertLess(read_elapsed, 0.05)
+        self.assertEqual(limiter.stats()["throttled_requests"][WRITE], 4)
+        self.assertGreater(limiter.stats()["throttled_seconds"][WRITE], 0.15)
+
+    def test_cooldown_blocks_every_class(self):
+        """Test a 429 cooldown is shared by all callers"""
+        limiter = RateLimiter()
+        limiter.cooldown(0.2)
+
+        start = time.monotonic()
+        limiter.acquire(READ)
+        limiter.acquire(WRITE)
+
+        self.assertGreaterEqual(time.monotonic() - start, 0.19)
+        self.assertEqual(limiter.stats()["cooldowns"], 1)
+
+    def test_limiter_shared_per_tenant(self):
+        """Test clients of the same tenant share one limiter"""
+        first = RateLimiter.for_tenant("https://a/api|shared", read_rate=5)
+        second = RateLimiter.for_tenant("https://a/api|shared", read_rate=5)
+        other = RateLimiter.for_tenant("https://a/api|other", read_rate=5)
+
+        self.assertIs(first, second)
+        self.assertIsNot(first, other)
+
+    def test_new_client_keeps_bucket_balance(self):
+        """Test a client asking for the same rates does not refill the shared buckets"""
+        limiter = RateLimiter.for_tenant("https://a/api|balance", read_rate=5, read_burst=1)
+        limiter.acquire(READ)
+        RateLimiter.for_tenant("https://a/api|balance", read_rate=5, read_burst=1)
+
+        self.assertGreater(limiter.acquire(READ), 0.1)
+
+    def test_changed_rate_replaces_bucket(self):
+        """Test a client asking for a different rate gets a bucket at that rate"""
+        limiter = RateLimiter.for_tenant("https://a/api|changed", read_rate=5, write_rate=2)
+        RateLimiter.for_tenant("https://a/api|changed", read_rate=50)
+
+        self.assertEqual(limiter._buckets[READ].rate, 50)
+        self.assertIsNone(limiter._buckets[WRITE])
+
+    def test_make_request_honours_retry_after(self):
+        """Test make_request waits out Retry-After instead of the fixed retry sleep"""
+        client = make_client(tenant="retry-after")
+        mock_session(client)
+        client.session.request.side_effect = [
+            make_response(429, headers={"Retry-After": "0.3"}),
+            make_response(json_data={"id": 1})
+        ]
+
+        start = time.monotonic()
+        result = client.get_ticket(1)
+        elapsed = time.monotonic() - start
+
+        self.assertEqual(result, {"id": 1})
+        self.assertGreaterEqual(elapsed, 0.29)
+        self.assertLess(elapsed, 1.0)
+        self.assertEqual(client.rate_limiter.stats()["cooldowns"], 1)
+
+    def test_429_on_last_attempt_still_cools_down(self):
+        """Test a 429 that is not retried still pauses the other callers of the tenant"""
+        client = make_client(tenant="last-429")
+        mock_session(client)
+        client.session.request.return_value = make_response(429, headers={"Retry-After": "0"})
+
+        with self.assertRaises(HaloITSMAPIError):
+            client.make_request(method="GET", endpoint="/tickets/1", retry_count=1)
+
+        self.assertEqual(client.rate_limiter.stats()["cooldowns"], 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,136 @@
+import sys
+import os
+sys.path.append(os.path.abspath('../'))
+
+import time
+import unittest
+from unittest.mock import Mock
+from insightconnect_plugin_runtime.exceptions import PluginException
+from icon_haloitsm.util.reference_data import ReferenceData
+from tests.helpers import make_client
+
+RESPONSES = {
+    "/tickettype": [{"id": 1, "name": "Incident"}, {"id": 3, "name": "Service Request"}],
+    "/priority": [
+        {"id": 101, "priorityid": 1, "name": "Critical"},
+        {"id": 102, "priorityid": 1, "name": "P1"},
+        {"id": 103, "priorityid": 4, "name": "Low"}
+    ],
+    "/status": [{"id": 1, "name": "New"}, {"id": 9, "name": "Closed"}],
+    "/team": {"record_count": 1, "teams": [{"id": 15, "name": "SOC Team"}]}
+}
+
+
+def lookup(method, endpoint, **kwargs):
+    return RESPONSES[endpoint]
+
+
+class TestReferenceData(unittest.TestCase):
+
+    def setUp(self):
+        self.client = Mock()
+        self.client.make_request.side_effect = lookup
+        self.reference_data = ReferenceData(self.client, background=False)
+
+    def test_resolves_both_ways(self):
+        self.assertEqual(self.reference_data.name_for("status", 9), "Closed")
+        self.assertEqual(self.reference_data.name_for("status", "1"), "New")
+        self.assertEqual(self.reference_data.name_for("team", 15), "SOC Team")
+        self.assertEqual(self.reference_data.name_for("priority", 1), "Critical")
+        self.assertEqual(self.reference_data.id_for("ticket_type", " service request"), 3)
+        self.assertEqual(self.reference_data.name_for("status", 42), "")
+        self.assertIsNone(self.reference_data.id_for("team", "Unknown"))
+
+    def test_loads_once(self):
+        """Test lookups after the first one never call HaloITSM"""
+        for _ in range(50):
+            self.reference_data.name_for("status", 1)
+
+        self.assertEqual(self.client.make_request.call_count, 4)
+
+    def test_reload_when_stale(self):
+        self.reference_data.name_for("status", 1)
+        self.reference_data.loaded_at = time.monotonic() - self.reference_data.refresh_interval - 1
+        self.reference_data.name_for("status", 1)
+
+        self.assertEqual(self.reference_data.loads, 2)
+
+    def test_validate(self):
+        self.reference_data.validate_ticket({"tickettype_id": 1, "status_id": 9, "team_id": None})
+
+        with self.assertRaises(PluginException) as context:
+            self.reference_data.validate_ticket({"tickettype_id": 1, "priority_id": 7})
+        self.assertEqual(context.exception.cause, "Unknown priority ID 7")
+        self.assertIn("4 (Low)", context.exception.assistance)
+
+    def test_priorities_keyed_on_priorityid(self):
+        """Test priorities resolve by priorityid, not by the per-SLA row id"""
+        self.reference_data.validate("priority", 4)
+        self.assertEqual(self.reference_data.names("priority"), {1: "Critical", 4: "Low"})
+        with self.assertRaises(PluginException):
+            self.reference_data.validate("priority", 103)
+
+    def test_failed_load_fails_open(self):
+        """Test an unreachable lookup endpoint neither blocks tickets nor retries on every call"""
+        self.client.make_request.side_effect = PluginException(cause="HaloITSM unavailable", assistance="")
+
+        self.reference_data.validate("priority", 7)
+        self.assertEqual(self.reference_data.name_for("status", 1), "")
+        self.assertEqual(self.client.make_request.call_count, 1)
+        self.assertEqual(self.reference_data.stats()["failures"], 1)
+
+    def test_failed_refresh_keeps_tables(self):
+        self.reference_data.ensure_loaded()
+        self.client.make_request.side_effect = PluginException(cause="HaloITSM unavailable", assistance="")
+
+        self.assertFalse(self.reference_data.refresh())
+        self.assertEqual(self.reference_data.name_for("status", 9), "Closed")
+
+    def test_background_refresh(self):
+        reference_data = ReferenceData(self.client, refresh_interval=0.05)
+        reference_data.ensure_loaded()
+        time.sleep(0.2)
+        reference_data.stop()
+
+        self.assertGreaterEqual(reference_data.loads, 2)
+        self.assertFalse(reference_data.is_running)
+
+
+class TestNormalizeWithReferenceData(unittest.TestCase):
+
+    def _client(self, **kwargs):
+        client = make_client(**kwargs)
+        client.make_request = Mock(side_effect=lookup)
+        return client
+
+    def test_names_filled_from_reference_data(self):
+        client = self._client(reference_data_refresh=3600, tenant="names-reference")
+        client.reference_data.background = False
+
+        ticket = client._normalize_ticket({"id": 1, "status_id": 9, "priority_id": 4, "team_id": 15, "tickettype": {"name": "Embedded"}})
+
+        self.assertEqual(ticket["status_name"], "Closed")
+        self.assertEqual(ticket["priority_name"], "Low")
+        self.assertEqual(ticket["team_name"], "SOC Team")
+        self.assertEqual(ticket["ticket_type_name"], "Embedded")
+
+    def test_shared_per_tenant(self):
+        """Test clients of one tenant share the tables, so a per-action client does not reload them"""
+        first = self._client(reference_data_refresh=3600, tenant="shared-reference")
+        second = self._client(reference_data_refresh=3600, tenant="shared-reference")
+        other = self._client(reference_data_refresh=3600, tenant="other-reference")
+
+        self.assertIs(first.reference_data, second.reference_data)
+        self.assertIsNot(first.reference_data, other.reference_data)
+        first.make_request.assert_not_called()
+
+    def test_disabled_by_default(self):
+        client = self._client()
+
+        self.assertIsNone(client.reference_data)
+        self.assertEqual(client._normalize_ticket({"id": 1, "status_id": 9})["status_name"], "")
+        client.make_request.assert_not_called()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,136 @@
+import sys
+import os
+sys.path.append(os.path.abspath('../'))
+
+import unittest
+from unittest.mock import patch
+import requests
+from insightconnect_plugin_runtime.exceptions import PluginException
+from icon_haloitsm.util.retry import RetryPolicy, RetryBudget, CONNECT_ERROR, TIMEOUT, CONNECTION_ERROR
+from tests.helpers import make_client, make_response, mock_session
+
+
+class TestRetryPolicy(unittest.TestCase):
+
+    def test_classify_statuses(self):
+        """Test client errors are never retried and writes only retry on 429"""
+        policy = RetryPolicy()
+
+        for status in (400, 403, 404, 422):
+            self.assertFalse(policy.classify(True, status=status))
+        for status in (500, 502, 503, 504):
+            self.assertTrue(policy.classify(True, status=status))
+            self.assertFalse(policy.classify(False, status=status))
+        self.assertTrue(policy.classify(False, status=429))
+
+    def test_classify_transport_errors(self):
+        """Test non-idempotent requests only retry when they were never sent"""
+        policy = RetryPolicy()
+
+        self.assertTrue(policy.classify(False, error=CONNECT_ERROR))
+        self.assertFalse(policy.classify(False, error=TIMEOUT))
+        self.assertFalse(policy.classify(False, error=CONNECTION_ERROR))
+        self.assertTrue(policy.classify(True, error=TIMEOUT))
+        self.assertFalse(policy.classify(True))
+
+    def test_backoff_is_jittered_and_capped(self):
+        """Test delays stay within the exponential envelope and vary"""
+        policy = RetryPolicy(base_delay=0.5, max_delay=4)
+
+        delays = [policy.backoff(2) for _ in range(200)]
+        self.assertTrue(all(0 <= delay <= 2.0 for delay in delays))
+        self.assertGreater(len(set(delays)), 1)
+        self.assertTrue(all(policy.backoff(10) <= 4 for _ in range(50)))
+
+    def test_budget_limits_retries(self):
+        """Test the budget stops retry storms and refills with traffic"""
+        budget = RetryBudget(ratio=0.5, min_per_second=0)
+
+        self.assertTrue(budget.try_withdraw())
+        self.assertFalse(budget.try_withdraw())
+
+        budget.record_request()
+        budget.record_request()
+        self.assertTrue(budget.try_withdraw())
+        self.assertEqual(budget.stats()["exhausted"], 1)
+        self.assertEqual(budget.stats()["retries"], 2)
+
+
+class TestMakeRequestRetries(unittest.TestCase):
+
+    def setUp(self):
+        self.client = make_client(tenant="retry", retry_policy=RetryPolicy(base_delay=0.001, max_delay=0.001))
+        mock_session(self.client)
+
+    def test_client_error_fails_fast(self):
+        """Test a 404 raises after a single attempt"""
+        self.client.session.request.return_value = make_response(404, {"error": "not found"})
+
+        with self.assertRaises(PluginException) as context:
+            self.client.get_ticket(1)
+
+        self.assertIn("404", context.exception.cause)
+        self.assertEqual(self.client.session.request.call_count, 1)
+
+    def test_server_error_retried_for_reads(self):
+        """Test a GET is retried after a 503"""
+        self.client.session.request.side_effect = [make_response(503), make_response(json_data={"id": 1})]
+
+        self.assertEqual(self.client.get_ticket(1), {"id": 1})
+        self.assertEqual(self.client.session.request.call_count, 2)
+
+    def test_create_not_resent_after_timeout(self):
+        """Test a ticket create is not re-POSTed when the server may have processed it"""
+        self.client.session.request.side_effect = requests.exceptions.ReadTimeout("read timed out")
+
+        with self.assertRaises(PluginException) as context:
+            self.client.create_ticket({"summary": "test"})
+
+        self.assertEqual(context.exception.cause, "Request timeout")
+        self.assertEqual(self.client.session.request.call_count, 1)
+
+    def test_create_resent_after_connect_error(self):
+        """Test a ticket create is retried when the connection was never made"""
+        self.client.session.request.side_effect = [
+            requests.exceptions.ConnectTimeout("connect timed out"),
+            make_response(json_data=[{"id": 7}])
+        ]
+
+        self.assertEqual(self.client.create_ticket({"summary": "test"}), {"id": 7})
+        self.assertEqual(self.client.session.request.call_count, 2)
+
+    def test_update_is_idempotent(self):
+        """Test a ticket update (carries its id) is retried after a timeout"""
+        self.client.session.request.side_effect = [
+            requests.exceptions.ReadTimeout("read timed out"),
+            make_response(json_data=[{"id": 7}])
+        ]
+
+        self.assertEqual(self.client.update_ticket({"id": 7, "summary": "test"}), {"id": 7})
+        self.assertEqual(self.client.session.request.call_count, 2)
+
+    def test_exhausted_budget_stops_retries(self):
+        """Test no retries happen once the budget is spent"""
+        self.client.retry_policy.budget = RetryBudget(ratio=0, min_per_second=0)
+        self.client.retry_policy.budget._balance = 0
+        self.client.session.request.return_value = make_response(503)
+
+        with self.assertRaises(PluginException):
+            self.client.get_ticket(1)
+
+        self.assertEqual(self.client.session.request.call_count, 1)
+
+    def test_backoff_used_between_attempts(self):
+        """Test the policy's backoff replaces the fixed retry sleep"""
+        self.client.session.request.side_effect = [make_response(502), make_response(json_data={"id": 1})]
+
+        with patch("icon_haloitsm.util.api.time.sleep") as sleep, \
+                patch.object(self.client.retry_policy, "backoff", return_value=0.25) as backoff:
+            self.client.get_ticket(1)
+
+        backoff.assert_called_once_with(0)
+        sleep.assert_called_once_with(0.25)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -70,7 +70,7 @@ class TestSearchTickets(unittest.TestCase):
             "page_no": 1,
             "search": "Test Ticket"
         }
-        self.action.connection.client.search_tickets.assert_called_once_with(expected_params)
+        self.action.connection.client.search_tickets.assert_called_once_with(expected_params, fields=[])
         self.assertEqual(len(result[Output.TICKETS]), 2)
         self.assertTrue(result[Output.SUCCESS])
         self.assertEqual(result[Output.COUNT], 2)
@@ -91,7 +91,7 @@ class TestSearchTickets(unittest.TestCase):
             "count": 50,  # Default count
             "page_no": 1  # Default page
         }
-        self.action.connection.client.search_tickets.assert_called_once_with(expected_params)
+        self.action.connection.client.search_tickets.assert_called_once_with(expected_params, fields=[])
         self.assertTrue(result[Output.SUCCESS])
     
     def test_search_tickets_with_search_string(self):
@@ -106,7 +106,7 @@ class TestSearchTickets(unittest.TestCase):
             "page_no": 1,
             "search": "specific query"
         }
-        self.action.connection.client.search_tickets.assert_called_once_with(expected_params)
+        self.action.connection.client.search_tickets.assert_called_once_with(expected_params, fields=[])
         self.assertEqual(len(result[Output.TICKETS]), 0)
         self.assertEqual(result[Output.COUNT], 0)
     
@@ -130,6 +130,47 @@ class TestSearchTickets(unittest.TestCase):
         self.assertIn("Failed to search tickets", str(context.exception))
         self.assertIn("API Error", str(context.exception))
 
+    
+    def test_search_tickets_fetch_all(self):
+        """Test Fetch All streams every page through iter_tickets"""
+        self.action.connection.client.iter_tickets.return_value = iter([{"id": 1}, {"id": 2}, {"id": 3}])
+        
+        result = self.action.run({
+            Input.SEARCH: "phishing",
+            Input.COUNT: 200,
+            Input.FETCH_ALL: True,
+            Input.MAX_RESULTS: 1000
+        })
+        
+        self.action.connection.client.iter_tickets.assert_called_once_with(
+            {"search": "phishing"}, page_size=200, limit=1000, prefetch=4, fields=[]
+        )
+        self.action.connection.client.search_tickets.assert_not_called()
+        self.assertEqual(result[Output.COUNT], 3)
+        self.assertTrue(result[Output.SUCCESS])
+
+    def test_search_tickets_fetch_all_is_capped_by_default(self):
+        """Test Fetch All without Max Results stops at the default cap instead of loading the whole tenant"""
+        self.action.connection.client.iter_tickets.return_value = iter([])
+        
+        self.action.run({Input.FETCH_ALL: True, Input.MAX_RESULTS: 0})
+        
+        self.assertEqual(self.action.connection.client.iter_tickets.call_args.kwargs["limit"], 10000)
+
+    def test_search_tickets_with_fields(self):
+        """Test fields reach the API and every ticket is projected onto them"""
+        self.action.connection.client.search_tickets.return_value = [{"id": 1}, {"id": 2}]
+        self.action.connection.client._normalize_ticket.side_effect = lambda ticket: dict(
+            ticket, summary="Ticket", details="Long details", agent_name="Analyst"
+        )
+        
+        result = self.action.run({Input.FIELDS: ["summary"]})
+        
+        self.action.connection.client.search_tickets.assert_called_once_with(
+            {"count": 50, "page_no": 1}, fields=["summary"]
+        )
+        self.assertEqual(result[Output.TICKETS], [{"id": 1, "summary": "Ticket"}, {"id": 2, "summary": "Ticket"}])
+
 
 if __name__ == "__main__":
     unittest.main()
\ No newline at end of file
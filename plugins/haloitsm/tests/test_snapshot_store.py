@@ -0,0 +1,96 @@
+import sys
+import os
+sys.path.append(os.path.abspath('../'))
+
+import shutil
+import tempfile
+import unittest
+from insightconnect_plugin_runtime.exceptions import PluginException
+from icon_haloitsm.util.snapshot_store import (
+    WATCHABLE_FIELDS,
+    SnapshotStore,
+    TicketSnapshot,
+    changed_fields,
+    content_digest,
+    snapshot_of,
+    validate_watched_fields
+)
+
+
+class TestSnapshotOf(unittest.TestCase):
+
+    def test_snapshot_fields(self):
+        """Test ids are kept as integers and dateupdated as epoch milliseconds"""
+        snapshot = snapshot_of({
+            "id": 1, "status_id": "2", "agent_id": 3, "team_id": None, "priority_id": 4,
+            "dateupdated": "2025-11-06T15:00:00.250Z"
+        })
+        self.assertEqual(snapshot[:5], (2, 3, None, 4, 1762441200250))
+
+    def test_digest_ignores_key_order_and_volatile_fields(self):
+        """Test the content hash only moves when the content does"""
+        ticket = {"id": 1, "summary": "A", "customfields": [{"id": 1, "value": "x"}], "dateupdated": "2025-11-06T15:00:00Z"}
+        reordered = {"dateupdated": "2025-11-07T09:00:00Z", "customfields": [{"value": "x", "id": 1}], "summary": "A", "id": 1}
+        self.assertEqual(content_digest(ticket), content_digest(reordered))
+        self.assertNotEqual(content_digest(ticket), content_digest(dict(ticket, summary="B")))
+
+    def test_changed_fields(self):
+        """Test only watched fields whose value moved are reported, under their normalized names"""
+        before = snapshot_of({"id": 1, "summary": "A", "tickettype_id": 1, "status_id": 1, "dateupdated": "2025-11-06T15:00:00Z"})
+        bumped = snapshot_of({"id": 1, "summary": "A", "tickettype_id": 1, "status_id": 1, "dateupdated": "2025-11-06T16:00:00Z"})
+        edited = snapshot_of({"id": 1, "summary": "B", "tickettype_id": 2, "status_id": 1, "dateupdated": "2025-11-06T16:00:00Z"})
+
+        self.assertEqual(changed_fields(before, bumped), [])
+        self.assertEqual(changed_fields(before, edited), ["summary", "ticket_type_id"])
+        self.assertEqual(changed_fields(before, edited, ["status_id", "ticket_type_id"]), ["ticket_type_id"])
+
+    def test_ids_compared_exactly_other_fields_hashed(self):
+        """Test status, agent, team and priority come from the snapshot columns and only the rest is hashed"""
+        before = snapshot_of({"id": 1, "status_id": 1, "agent_id": 3, "summary": "A"})
+        after = snapshot_of({"id": 1, "status_id": 1, "agent_id": 4, "summary": "A"})
+
+        self.assertEqual(len(before.field_hashes), 4 * (len(WATCHABLE_FIELDS) - 4))
+        self.assertEqual(before.field_hashes, after.field_hashes)
+        self.assertEqual(changed_fields(before, after), ["agent_id"])
+
+    def test_validate_watched_fields(self):
+        """Test an empty selection watches everything and unknown names are rejected"""
+        self.assertIn("customfields", validate_watched_fields(None))
+        self.assertEqual(validate_watched_fields(["status_id", " agent_id "]), ["status_id", "agent_id"])
+        with self.assertRaises(PluginException) as context:
+            validate_watched_fields(["status_id", "colour"])
+        self.assertIn("colour", str(context.exception))
+
+
+class TestSnapshotStore(unittest.TestCase):
+
+    def test_swap_returns_previous_snapshot(self):
+        """Test swap stores the new snapshot and hands back the one it replaced"""
+        store = SnapshotStore()
+        first = TicketSnapshot(1, 2, 3, 4, 1000, -5, b"")
+        second = TicketSnapshot(2, 2, 3, 4, 2000, 7, b"")
+
+        self.assertIsNone(store.swap(10, first))
+        self.assertEqual(store.swap(10, second), first)
+        self.assertEqual(store.get(10), second)
+        self.assertIsNone(store.get(11))
+        self.assertEqual(len(store), 1)
+
+    def test_file_store_survives_reopen(self):
+        """Test committed snapshots are read back after the store is reopened"""
+        directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, directory, True)
+        path = os.path.join(directory, "snapshots.sqlite")
+        store = SnapshotStore(path)
+        store.put_many((ticket_id, TicketSnapshot(1, None, None, 2, ticket_id, 2 ** 63 - 1, b"\x01" * 48)) for ticket_id in range(1, 101))
+        store.commit()
+        store.close()
+
+        reopened = SnapshotStore(path)
+        self.assertEqual(len(reopened), 100)
+        self.assertEqual(reopened.get(42), TicketSnapshot(1, None, None, 2, 42, 2 ** 63 - 1, b"\x01" * 48))
+        reopened.close()
+
+
+if __name__ == "__main__":
+    unittest.main()
\ No newline at end of file
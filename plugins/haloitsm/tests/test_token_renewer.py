@@ -0,0 +1,112 @@
+import sys
+import os
+sys.path.append(os.path.abspath('../'))
+
+import time
+import unittest
+from unittest.mock import patch
+from icon_haloitsm.util.token_renewer import TokenRenewer
+from tests.helpers import make_client
+
+
+class FakeClient:
+    """Stands in for HaloITSMAPI's token bookkeeping"""
+
+    def __init__(self, lifetime=3600, fail=False):
+        self.access_token = "token"
+        self.token_issued_at = time.time()
+        self.token_lifetime = lifetime
+        self.fail = fail
+        self.refresh_calls = 0
+
+    def refresh_token(self):
+        self.refresh_calls += 1
+        if self.fail:
+            raise RuntimeError("auth server down")
+        self.token_issued_at = time.time()
+        return self.access_token
+
+
+class TestTokenRenewer(unittest.TestCase):
+
+    def test_next_delay_uses_fraction_of_lifetime(self):
+        """Test the refresh is scheduled at the configured fraction of expires_in"""
+        client = FakeClient(lifetime=3600)
+        renewer = TokenRenewer(client, refresh_fraction=0.5, jitter=0)
+
+        self.assertAlmostEqual(renewer.next_delay(), 1800, delta=1)
+
+    def test_next_delay_jitter_and_lazy_buffer(self):
+        """Test jitter stays in bounds and never passes the lazy refresh point"""
+        client = FakeClient(lifetime=3600)
+        renewer = TokenRenewer(client, refresh_fraction=0.75, jitter=0.1)
+        delays = [renewer.next_delay() for _ in range(200)]
+        self.assertTrue(all(2340 - 1 <= delay <= 3060 + 1 for delay in delays))
+        self.assertGreater(len(set(round(delay) for delay in delays)), 1)
+
+        renewer = TokenRenewer(client, refresh_fraction=0.99, jitter=0)
+        self.assertLessEqual(renewer.next_delay(), 3600 - 60)
+
+    def test_next_delay_without_token_is_immediate(self):
+        """Test a renewer with no token fetches one straight away"""
+        client = FakeClient()
+        client.access_token = None
+
+        self.assertEqual(TokenRenewer(client).next_delay(), 0)
+
+    def test_refreshes_and_stops(self):
+        """Test the renewer refreshes in the background and stops cleanly"""
+        client = FakeClient(lifetime=62)
+        renewer = TokenRenewer(client, refresh_fraction=0.0, jitter=0)
+
+        with patch("icon_haloitsm.util.token_renewer.LAZY_REFRESH_BUFFER", 0):
+            client.token_issued_at = time.time() - 100
+            renewer.start()
+            time.sleep(0.2)
+            renewer.stop()
+
+        self.assertFalse(renewer.is_running)
+        self.assertGreaterEqual(renewer.refreshes, 1)
+        self.assertEqual(renewer.stats()["failures"], 0)
+
+    def test_failures_are_counted(self):
+        """Test failed refreshes are counted and retried later"""
+        client = FakeClient(fail=True)
+        client.access_token = None
+        renewer = TokenRenewer(client, retry_interval=60)
+
+        renewer.start()
+        time.sleep(0.1)
+        renewer.stop()
+
+        self.assertEqual(renewer.failures, 1)
+        self.assertEqual(renewer.refreshes, 0)
+        self.assertIn("auth server down", renewer.last_error)
+
+    def test_client_starts_shared_renewer_with_first_token(self):
+        """Test clients start no renewer until they hold a token, then share one per tenant"""
+        first = make_client(tenant="renewer-shared", background_token_refresh=True)
+        second = make_client(tenant="renewer-shared", background_token_refresh=True)
+        self.assertIsNone(first.token_renewer)
+
+        first._set_token("token", time.time(), 3600)
+        second._set_token("token", time.time(), 3600)
+        self.addCleanup(first.token_renewer.stop)
+
+        self.assertTrue(first.token_renewer.is_running)
+        self.assertIs(first.token_renewer, second.token_renewer)
+        self.assertIs(first.token_renewer.client, first)
+
+    def test_client_close_keeps_shared_renewer(self):
+        """Test closing one client does not stop renewal for the tenant's other clients"""
+        client = make_client(tenant="renewer-close", background_token_refresh=True)
+        client._set_token("token", time.time(), 3600)
+        self.addCleanup(client.token_renewer.stop)
+
+        client.close()
+
+        self.assertTrue(client.token_renewer.is_running)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,102 @@
+import sys
+import os
+sys.path.append(os.path.abspath('../'))
+
+import shutil
+import stat
+import tempfile
+import threading
+import time
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import Mock
+from icon_haloitsm.util.token_store import FileTokenStore, token_store_key
+from tests.helpers import make_client
+
+
+class TestFileTokenStore(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.store = FileTokenStore(os.path.join(self.directory, "tokens"))
+        self.token_calls = 0
+        self.lock = threading.Lock()
+
+    def tearDown(self):
+        shutil.rmtree(self.directory, ignore_errors=True)
+
+    def make_client(self, tenant="example"):
+        client = make_client(tenant=tenant, token_store=self.store)
+        client.session = Mock()
+
+        def post(*args, **kwargs):
+            time.sleep(0.05)
+            with self.lock:
+                self.token_calls += 1
+                token = f"token-{self.token_calls}"
+            response = Mock()
+            response.json.return_value = {"access_token": token, "expires_in": 3600}
+            return response
+
+        client.session.post.side_effect = post
+        return client
+
+    def test_key_is_scoped_and_secret_free(self):
+        """Test keys differ per auth server, client, tenant and secret without containing the secret"""
+        key = token_store_key("https://a/auth", "client", "tenant")
+
+        self.assertEqual(key, token_store_key("https://a/auth", "client", "tenant"))
+        self.assertNotEqual(key, token_store_key("https://b/auth", "client", "tenant"))
+        self.assertNotEqual(key, token_store_key("https://a/auth", "other", "tenant"))
+        self.assertNotEqual(key, token_store_key("https://a/auth", "client", "other"))
+        secret_key = token_store_key("https://a/auth", "client", "tenant", "hunter2")
+        self.assertNotEqual(key, secret_key)
+        self.assertNotIn("hunter2", secret_key)
+
+    def test_save_load_delete(self):
+        """Test records round-trip and delete only removes the matching token"""
+        record = {"access_token": "abc", "issued_at": 1, "lifetime": 3600, "expires_at": 3601}
+        self.store.save("key", record)
+
+        self.assertEqual(self.store.load("key"), record)
+        mode = os.stat(os.path.join(self.store.directory, "key.json")).st_mode
+        self.assertEqual(stat.S_IMODE(mode), 0o600)
+
+        self.store.delete("key", access_token="other")
+        self.assertIsNotNone(self.store.load("key"))
+        self.store.delete("key", access_token="abc")
+        self.assertIsNone(self.store.load("key"))
+
+    def test_new_client_reuses_cached_token(self):
+        """Test a fresh client (e.g. after a restart) skips the token endpoint"""
+        self.make_client().get_access_token()
+        self.assertEqual(self.token_calls, 1)
+
+        token = self.make_client().get_access_token()
+
+        self.assertEqual(token, "token-1")
+        self.assertEqual(self.token_calls, 1)
+
+    def test_workers_share_one_refresh(self):
+        """Test separate clients sharing the store make exactly one token call"""
+        clients = [self.make_client() for _ in range(8)]
+
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            tokens = list(pool.map(lambda client: client.get_access_token(), clients))
+
+        self.assertEqual(set(tokens), {"token-1"})
+        self.assertEqual(self.token_calls, 1)
+
+    def test_invalidated_token_is_removed(self):
+        """Test a 401'd token is dropped from the shared store"""
+        client = self.make_client()
+        token, generation = client._get_token()
+
+        client._invalidate_token(generation)
+
+        self.assertIsNone(self.store.load(client._token_store_key))
+        self.assertEqual(self.make_client().get_access_token(), "token-2")
+
+
+if __name__ == '__main__':
+    unittest.main()